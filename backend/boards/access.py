@@ -0,0 +1,152 @@
+import threading  # guards the process-local access cache
+import time  # TTL bookkeeping
+from collections import OrderedDict  # LRU order
+
+from django.conf import settings  # BOARDS_ACCESS_CACHE
+from django.db import transaction  # keep a rebuild all-or-nothing
+
+from .bus import bus  # invalidation in every worker
+from .models import Project, ProjectAccess  # access index and its source of truth
+
+# ----------------------------
+# Keep ProjectAccess in step with Project.owner and Project.members
+# ----------------------------
+REBUILD_BATCH_SIZE = 1000  # rows per bulk_create during a full rebuild
+
+
+def _desired_access(project_ids=None):
+    # {(user_id, project_id): role} computed from the owner column and the members table
+    memberships = Project.members.through.objects.all()
+    projects = Project.all_objects.all()
+    if project_ids is not None:
+        memberships = memberships.filter(project_id__in=project_ids)
+        projects = projects.filter(pk__in=project_ids)
+    desired = {
+        (user_id, project_id): ProjectAccess.MEMBER
+        for project_id, user_id in memberships.values_list('project_id', 'user_id').iterator()
+    }
+    for project_id, owner_id in projects.values_list('pk', 'owner_id').iterator():
+        desired[(owner_id, project_id)] = ProjectAccess.OWNER  # owner role wins over membership
+    return desired
+
+
+def sync_project_access(project_ids):
+    """Bring the access rows of the given projects in line with their owner and members."""
+    project_ids = list(project_ids)
+    if not project_ids:
+        return
+    desired = _desired_access(project_ids)
+    existing = {
+        (user_id, project_id): (pk, role)
+        for pk, user_id, project_id, role in ProjectAccess.objects.filter(project_id__in=project_ids)
+        .values_list('pk', 'user_id', 'project_id', 'role')
+    }
+    stale = [pk for key, (pk, _) in existing.items() if key not in desired]
+    if stale:
+        ProjectAccess.objects.filter(pk__in=stale).delete()
+    for role in (ProjectAccess.OWNER, ProjectAccess.MEMBER):
+        changed = [pk for key, (pk, current) in existing.items() if current != role == desired.get(key)]
+        if changed:
+            ProjectAccess.objects.filter(pk__in=changed).update(role=role)
+    ProjectAccess.objects.bulk_create(
+        [ProjectAccess(user_id=user_id, project_id=project_id, role=role)
+         for (user_id, project_id), role in desired.items() if (user_id, project_id) not in existing],
+        ignore_conflicts=True,  # a concurrent sync may have inserted the same row
+    )
+    bus.publish('projects', project_ids)  # drop cached answers once visible
+    bus.publish('users', {user_id for user_id, _ in desired} | {user_id for user_id, _ in existing})  # cached project id sets
+
+
+@transaction.atomic
+def rebuild_project_access(batch_size=REBUILD_BATCH_SIZE):
+    """Recreate the whole access index from scratch. Returns the number of rows written."""
+    ProjectAccess.objects.all().delete()
+    rows = [
+        ProjectAccess(user_id=user_id, project_id=project_id, role=role)
+        for (user_id, project_id), role in _desired_access().items()
+    ]
+    ProjectAccess.objects.bulk_create(rows, batch_size=batch_size)
+    bus.publish('projects')  # everything
+    bus.publish('users')
+    return len(rows)
+
+
+# ----------------------------
+# "Can user U touch project P?" resolver
+#
+# Answers are memoized on the request, and optionally in a process-local
+# LRU with a TTL (settings.BOARDS_ACCESS_CACHE). A miss costs a single
+# EXISTS on the (user, project) unique index.
+# ----------------------------
+class AccessCache:
+    def __init__(self, max_entries, ttl):
+        self.max_entries = max_entries  # LRU capacity
+        self.ttl = ttl  # seconds an answer stays valid, 0 disables the cache
+        self._entries = OrderedDict()  # (user_id, project_id) -> (expires_at, allowed)
+        self._lock = threading.Lock()  # gunicorn threads share the process cache
+
+    def get(self, key):
+        if not self.ttl:
+            return None
+        bus.ensure_listening()  # a process holding cached answers must hear other workers' writes
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, allowed):
+        if not self.ttl:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, allowed)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)  # drop least recently used
+
+    def evict(self, keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def evict_projects(self, project_ids):
+        project_ids = set(project_ids)
+        with self._lock:
+            for key in [key for key in self._entries if key[1] in project_ids]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_cache_settings = getattr(settings, 'BOARDS_ACCESS_CACHE', {})
+access_cache = AccessCache(
+    max_entries=_cache_settings.get('MAX_ENTRIES', 10000),
+    ttl=_cache_settings.get('TTL', 0),
+)
+bus.register('projects', lambda project_ids: access_cache.clear() if project_ids is None else access_cache.evict_projects(project_ids))
+
+
+def can_access_project(request, project_id):
+    """True if request.user owns or is a member of project_id."""
+    user = request.user
+    if project_id is None or not user.is_authenticated:
+        return False
+    http_request = getattr(request, '_request', request)  # DRF Request wraps the Django HttpRequest
+    memo = http_request.__dict__.setdefault('_project_access', {})
+    project_ids = getattr(user, 'boards_project_ids', None)  # set by CachedJWTAuthentication with CACHE_PROJECT_IDS
+    if project_ids is not None:
+        return project_id in project_ids
+    key = (user.pk, project_id)
+    if key not in memo:
+        allowed = access_cache.get(key)
+        if allowed is None:
+            allowed = ProjectAccess.objects.filter(user_id=user.pk, project_id=project_id).exists()
+            access_cache.set(key, allowed)
+        memo[key] = allowed
+    return memo[key]
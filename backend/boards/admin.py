@@ -1,16 +1,21 @@
 from django.contrib import admin
-from .models import Project, Column, Task, Comment, Notification
+from .models import Project, ProjectAccess, Column, Task, Comment, Notification, NotificationCounter, ArchivedRecord, TokenVersion, InvalidationEvent
 
 # Register simple models
 admin.site.register(Project)
 admin.site.register(Column)
 admin.site.register(Comment)
 admin.site.register(Notification)
+admin.site.register(ProjectAccess)
+admin.site.register(NotificationCounter)
+admin.site.register(ArchivedRecord)
+admin.site.register(TokenVersion)
+admin.site.register(InvalidationEvent)
 
 # Register Task model with custom admin settings
 @admin.register(Task)
 class TaskAdmin(admin.ModelAdmin):
     list_display = ('title', 'column', 'due', 'assigned')
     list_filter = ('column', 'due')
-    search_fields = ('title', 'description', 'assigned')
+    search_fields = ('title', 'description', 'assigned__username')  # full-text search is /api/search/
     ordering = ('due',)
@@ -3,3 +3,8 @@ from django.apps import AppConfig
 class BoardsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'  # default primary key field type
     name = 'backend.boards'  # name of the app
+
+    def ready(self):
+        from django.db.models.signals import post_migrate
+        from . import search, signals  # noqa: F401  connect model signal handlers
+        post_migrate.connect(search.reinstall, sender=self)  # SQLite drops the search triggers when it rebuilds a table
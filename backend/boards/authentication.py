@@ -0,0 +1,128 @@
+import copy  # per-request copy of a cached user
+
+from django.conf import settings  # BOARDS_AUTH
+from django.contrib.auth import get_user_model  # user lookups
+from django.db.models import F  # atomic version bump
+from rest_framework_simplejwt.authentication import JWTAuthentication  # header parsing and token validation
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError  # simplejwt errors
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer  # login/refresh
+from rest_framework_simplejwt.settings import api_settings  # USER_ID_CLAIM / USER_ID_FIELD
+
+from .access import AccessCache  # same LRU + TTL cache as the access answers
+from .blacklist import BloomRefreshToken  # refresh tokens with the bloom-filtered blacklist check
+from .bus import bus  # evictions reach every worker
+from .models import ProjectAccess, TokenVersion  # project ids, revocation counter
+from . import timing  # 'auth' span of the Server-Timing header
+
+User = get_user_model()
+
+# ----------------------------
+# JWT authentication with a process-local user cache
+#
+# Tokens carry the user's TokenVersion in the `ver` claim. The user row,
+# its current version and (optionally) its project ids are cached per
+# process for USER_CACHE_TTL seconds, so most requests authenticate
+# without a query. Changing the password or deactivating the user bumps
+# the version (boards.signals): tokens issued before stop working, in
+# this process at once and in the others once their entry expires.
+# Logout evicts the entry; the blacklisted refresh token can't mint new
+# access tokens.
+# ----------------------------
+TOKEN_VERSION_CLAIM = 'ver'
+
+_auth_settings = getattr(settings, 'BOARDS_AUTH', {})
+CACHE_PROJECT_IDS = _auth_settings.get('CACHE_PROJECT_IDS', False)  # answer can_access_project from the cached entry
+user_cache = AccessCache(
+    max_entries=_auth_settings.get('MAX_ENTRIES', 10000),
+    ttl=_auth_settings.get('USER_CACHE_TTL', 60),  # 0 disables the cache (one query per request)
+)
+
+
+def token_version(user_id):
+    return TokenVersion.objects.filter(user_id=user_id).values_list('version', flat=True).first() or 0
+
+
+def bump_token_version(user_id):
+    """Revoke every token issued to user_id so far."""
+    TokenVersion.objects.get_or_create(user_id=user_id)
+    TokenVersion.objects.filter(user_id=user_id).update(version=F('version') + 1)
+    evict_users([user_id])
+
+
+def evict_users(user_ids):
+    """Drop the cached entries of user_ids in every worker once the transaction commits."""
+    bus.publish('users', user_ids)
+
+
+def _evict_cached_users(user_ids):
+    if user_ids is None:
+        user_cache.clear()
+    else:
+        user_cache.evict([str(user_id) for user_id in user_ids])  # keys are the token's user id claim
+
+
+bus.register('users', _evict_cached_users)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    def authenticate(self, request):
+        with timing.span('auth'):
+            return super().authenticate(request)
+
+    def get_user(self, validated_token):
+        try:
+            user_id = str(validated_token[api_settings.USER_ID_CLAIM])  # cache key; the claim may be a str or an int
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+        version = validated_token.get(TOKEN_VERSION_CLAIM, 0)  # tokens from before versioning count as 0
+        entry = user_cache.get(user_id)
+        if entry is None or entry[0] != version:  # miss, or the version moved since the entry was cached
+            entry = self._load(user_id)
+            user_cache.set(user_id, entry)
+        current, user, project_ids = entry
+        if current != version:
+            raise AuthenticationFailed("Token has been revoked", code="token_revoked")
+        user = copy.copy(user)  # requests never share (and mutate) one instance
+        user.boards_project_ids = project_ids
+        return user
+
+    def _load(self, user_id):
+        # (version, user, project ids or None); one query, two with CACHE_PROJECT_IDS
+        try:
+            user = User.objects.select_related('token_version').get(**{api_settings.USER_ID_FIELD: user_id})
+        except User.DoesNotExist:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+        if not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        try:
+            version = user.token_version.version
+        except TokenVersion.DoesNotExist:
+            version = 0
+        project_ids = None
+        if CACHE_PROJECT_IDS:
+            project_ids = frozenset(ProjectAccess.objects.filter(user_id=user.pk).values_list('project_id', flat=True))
+        return version, user, project_ids
+
+
+class VersionedTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = BloomRefreshToken
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token[TOKEN_VERSION_CLAIM] = token_version(user.pk)  # copied into every access token minted from it
+        return token
+
+
+class VersionedTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = BloomRefreshToken
+
+    def validate(self, attrs):
+        try:
+            refresh = self.token_class(attrs['refresh'])
+        except TokenError:
+            return super().validate(attrs)  # raises the usual invalid-token error
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM)
+        if refresh.payload.get(TOKEN_VERSION_CLAIM, 0) != token_version(user_id):
+            raise AuthenticationFailed("Token has been revoked", code="token_revoked")
+        return super().validate(attrs)
@@ -0,0 +1,150 @@
+import hashlib  # bloom filter hashing
+import math  # filter sizing
+import threading  # one rebuild/sync at a time
+import time  # sync throttling
+
+from django.conf import settings  # BOARDS_BLACKLIST
+from django.db import transaction  # batch deletes
+from django.db.models import Max  # sync watermark
+from django.utils import timezone  # token expiry
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken  # simplejwt tables
+from rest_framework_simplejwt.settings import api_settings  # JTI_CLAIM
+from rest_framework_simplejwt.tokens import RefreshToken  # token class being extended
+
+from .bus import bus  # new blacklist entries reach every worker
+
+# ----------------------------
+# Bloom-filtered refresh token blacklist
+#
+# simplejwt looks a refresh token up in BlacklistedToken on every refresh.
+# Almost all of those lookups miss, so a process-local Bloom filter of the
+# blacklisted jtis answers "not blacklisted" from memory and only possible
+# hits go to the database (which stays the source of truth). The filter is
+# built from the table on first use in each process and updated on every
+# blacklist() in any process through the invalidation bus (bus.py); as a
+# safety net it also catches up with the table at most every SYNC_SECONDS. Expired rows are dropped in batches by
+# `manage.py flush_expired_tokens`.
+# ----------------------------
+_blacklist_settings = getattr(settings, 'BOARDS_BLACKLIST', {})
+CAPACITY = _blacklist_settings.get('CAPACITY', 100000)  # jtis before the filter is rebuilt twice as large
+ERROR_RATE = _blacklist_settings.get('ERROR_RATE', 0.001)  # share of clean tokens still checked in the DB
+SYNC_SECONDS = _blacklist_settings.get('SYNC_SECONDS', 2.0)  # 0: check for other processes' inserts every time
+
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate):
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))  # bits
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1, h2 = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))  # double hashing
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class TokenBlacklist:
+    def __init__(self, capacity=CAPACITY, error_rate=ERROR_RATE, sync_seconds=SYNC_SECONDS):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_seconds = sync_seconds
+        self._lock = threading.Lock()
+        self._filter = None  # built on first use
+        self._last_id = 0  # highest BlacklistedToken id already in the filter
+        self._synced_at = float('-inf')
+
+    def _load(self, bloom, rows):
+        for pk, jti in rows:
+            bloom.add(jti)
+            self._last_id = max(self._last_id, pk)
+
+    def rebuild(self):
+        """Refill the filter from the live (unexpired) blacklist."""
+        with self._lock:
+            rows = BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now()).values_list('pk', 'token__jti')
+            bloom = BloomFilter(max(self.capacity, rows.count() * 2), self.error_rate)
+            self._last_id = BlacklistedToken.objects.aggregate(last=Max('pk'))['last'] or 0  # expired rows are skipped, not re-synced
+            self._load(bloom, rows.iterator())
+            self._filter = bloom
+            self._synced_at = time.monotonic()
+            return bloom
+
+    def _current(self):
+        # the bus thread may drop the filter (invalidate(None)) at any time: work on a local reference
+        with self._lock:
+            bloom = self._filter
+        return self.rebuild() if bloom is None else bloom
+
+    def _sync(self):
+        # rows other processes inserted since the last sync
+        bloom = self._current()
+        if time.monotonic() - self._synced_at < self.sync_seconds:
+            return bloom
+        with self._lock:
+            self._load(bloom, BlacklistedToken.objects.filter(pk__gt=self._last_id).values_list('pk', 'token__jti'))
+            self._synced_at = time.monotonic()
+        if bloom.count > bloom.capacity:
+            bloom = self.rebuild()
+        return bloom
+
+    def might_contain(self, jti):
+        """False means certainly not blacklisted (as of the last sync); True needs a database check."""
+        bus.ensure_listening()
+        return jti in self._sync()
+
+    def add(self, jti):
+        bloom = self._current()
+        with self._lock:
+            bloom.add(jti)
+
+    def invalidate(self, jtis):
+        # bus handler: jtis blacklisted by any worker, None after messages may have been missed
+        if jtis is None:
+            with self._lock:
+                self._filter = None  # rebuilt on next use
+            return
+        for jti in jtis:
+            self.add(jti)
+
+
+token_blacklist = TokenBlacklist()
+bus.register('jti', token_blacklist.invalidate)
+
+
+class BloomRefreshToken(RefreshToken):
+    """RefreshToken whose blacklist check skips the database for tokens the filter has never seen."""
+
+    def check_blacklist(self):
+        if token_blacklist.might_contain(self.payload[api_settings.JTI_CLAIM]):
+            super().check_blacklist()  # possible hit: the database decides
+
+    def blacklist(self):
+        result = super().blacklist()
+        bus.publish('jti', [self.payload[api_settings.JTI_CLAIM]])  # this worker and the others, after commit
+        return result
+
+
+def flush_expired_tokens(batch_size=1000, max_seconds=60):
+    """Delete expired outstanding tokens (and their blacklist rows) in batches. Returns (deleted, finished)."""
+    deadline = time.monotonic() + max_seconds
+    now = timezone.now()
+    expired = OutstandingToken.objects.filter(expires_at__lte=now).order_by('pk')
+    deleted = 0
+    while time.monotonic() < deadline:
+        ids = list(expired.values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return deleted, True
+        with transaction.atomic():
+            BlacklistedToken.objects.filter(token_id__in=ids).delete()
+            deleted += OutstandingToken.objects.filter(pk__in=ids).delete()[1].get(OutstandingToken._meta.label, 0)
+    return deleted, False
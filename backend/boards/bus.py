@@ -0,0 +1,141 @@
+import json  # message payloads
+import logging  # listener failures
+import select  # wait for NOTIFY without busy polling
+import threading  # background listener
+import time  # poll interval, reconnect backoff
+from collections import defaultdict  # kind -> handlers
+from datetime import timedelta  # fallback table retention
+
+from django.conf import settings  # BOARDS_BUS
+from django.db import close_old_connections, connection, transaction  # publisher connection, on_commit
+from django.utils import timezone  # fallback table retention
+
+logger = logging.getLogger(__name__)
+
+# ----------------------------
+# Cross-process cache invalidation bus
+#
+# Process-local caches (access answers, cached JWT users, the refresh
+# token Bloom filter) register a handler per message kind. publish()
+# runs the local handlers once the transaction commits and tells every
+# other worker: on PostgreSQL with NOTIFY on CHANNEL, elsewhere by
+# inserting an InvalidationEvent row that the other workers poll for.
+# Each worker starts its listener thread the first time one of those
+# caches is read. Handlers take a list of keys, or None for "everything",
+# and must be idempotent: the publishing worker hears its own message too.
+# Board change events ride along as the 'events' kind (events.BusBroker
+# drops its own messages instead).
+# ----------------------------
+_bus_settings = getattr(settings, 'BOARDS_BUS', {})
+ENABLED = _bus_settings.get('ENABLED', True)  # False: local handlers only
+CHANNEL = _bus_settings.get('CHANNEL', 'boards_invalidate')
+POLL_SECONDS = _bus_settings.get('POLL_SECONDS', 1.0)  # fallback table poll interval (and NOTIFY wait timeout)
+RETAIN_SECONDS = _bus_settings.get('RETAIN_SECONDS', 3600)  # fallback rows older than this are pruned
+CHUNK_SIZE = 500  # keys per message (NOTIFY payloads are capped at 8000 bytes)
+
+
+class InvalidationBus:
+    def __init__(self, enabled=ENABLED, channel=CHANNEL, poll_seconds=POLL_SECONDS):
+        self.enabled = enabled
+        self.channel = channel
+        self.poll_seconds = poll_seconds
+        self._handlers = defaultdict(list)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def register(self, kind, handler):
+        self._handlers[kind].append(handler)
+
+    # ---- publishing ----
+    def publish(self, kind, keys=None):
+        """Invalidate `keys` (None: everything) of `kind` here and in every other worker, after commit."""
+        keys = None if keys is None else sorted(set(keys), key=str)
+        if keys is not None and not keys:
+            return
+        transaction.on_commit(lambda: self._publish(kind, keys))
+
+    def _publish(self, kind, keys):
+        self.dispatch(kind, keys)
+        if not self.enabled:
+            return
+        chunks = [None] if keys is None else [keys[i:i + CHUNK_SIZE] for i in range(0, len(keys), CHUNK_SIZE)]
+        try:
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    for chunk in chunks:
+                        cursor.execute('SELECT pg_notify(%s, %s)', [self.channel, json.dumps({'kind': kind, 'keys': chunk})])
+            else:
+                from .models import InvalidationEvent
+                InvalidationEvent.objects.bulk_create([InvalidationEvent(kind=kind, keys=chunk) for chunk in chunks])
+        except Exception:  # the write itself is committed; other workers catch up when their entries expire
+            logger.exception("Could not publish %s invalidation", kind)
+
+    def dispatch(self, kind, keys):
+        for handler in self._handlers.get(kind, ()):
+            try:
+                handler(keys)
+            except Exception:
+                logger.exception("Invalidation handler for %s failed", kind)
+
+    # ---- listening ----
+    def ensure_listening(self):
+        if not self.enabled or (self._thread is not None and self._thread.is_alive()):
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='boards-invalidation', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            try:
+                if connection.vendor == 'postgresql':
+                    self._listen()
+                else:
+                    self._poll()
+            except Exception:
+                logger.exception("Invalidation listener failed, restarting")
+                time.sleep(self.poll_seconds)
+            finally:
+                close_old_connections()  # this thread owns its own DB connection
+
+    def _listen(self):
+        # dedicated autocommit connection: LISTEN must not sit inside Django's transaction handling
+        raw = connection.get_new_connection(connection.get_connection_params())
+        try:
+            raw.autocommit = True
+            with raw.cursor() as cursor:
+                cursor.execute(f'LISTEN "{self.channel}"')
+            self.dispatch_all()  # whatever was published while not listening
+            while True:
+                if select.select([raw], [], [], self.poll_seconds) == ([], [], []):
+                    continue
+                raw.poll()
+                while raw.notifies:
+                    message = json.loads(raw.notifies.pop(0).payload)
+                    self.dispatch(message['kind'], message['keys'])
+        finally:
+            raw.close()
+
+    def _poll(self):
+        from .models import InvalidationEvent
+        last_id = InvalidationEvent.objects.order_by('-pk').values_list('pk', flat=True).first() or 0
+        self.dispatch_all()
+        pruned_at = time.monotonic()
+        while True:
+            time.sleep(self.poll_seconds)
+            for pk, kind, keys in InvalidationEvent.objects.filter(pk__gt=last_id).order_by('pk').values_list('pk', 'kind', 'keys'):
+                self.dispatch(kind, keys)
+                last_id = pk
+            if time.monotonic() - pruned_at > RETAIN_SECONDS:
+                InvalidationEvent.objects.filter(created_at__lt=timezone.now() - timedelta(seconds=RETAIN_SECONDS)).delete()
+                pruned_at = time.monotonic()
+            close_old_connections()
+
+    def dispatch_all(self):
+        # (re)connected: messages may have been missed, drop everything cached
+        for kind in list(self._handlers):
+            self.dispatch(kind, None)
+
+
+bus = InvalidationBus()
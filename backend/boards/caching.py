@@ -0,0 +1,74 @@
+import hashlib  # short digest of the requested field set
+
+from django.conf import settings  # BOARDS_READ_CACHE
+from django.core.cache import caches  # configured backend (LocMem by default)
+
+# ----------------------------
+# Read cache for serialized project and board payloads
+#
+# Keys embed the project revision, and every write that changes what a
+# payload shows (project, members, columns, tasks, comments, usernames)
+# bumps that revision from boards.signals. A write therefore invalidates
+# every cached variant of the board at once, in every process sharing the
+# backend, and stale entries simply age out. Hits and misses are counted
+# in the same backend so all workers report into one pair of counters.
+# ----------------------------
+_read_cache_settings = getattr(settings, 'BOARDS_READ_CACHE', {})
+ENABLED = _read_cache_settings.get('ENABLED', True)
+TIMEOUT = _read_cache_settings.get('TIMEOUT', 300)  # seconds; old revisions are never read again, they only expire
+ALIAS = _read_cache_settings.get('ALIAS', 'default')
+PREFIX = 'boards:read'
+VARIANT_PARAMS = ('fields', 'expand')  # query parameters that change the payload
+
+
+class ReadCache:
+    def __init__(self, alias=ALIAS, timeout=TIMEOUT, enabled=ENABLED):
+        self.alias = alias
+        self.timeout = timeout
+        self.enabled = enabled
+
+    @property
+    def backend(self):
+        return caches[self.alias]  # per-thread connection handled by Django
+
+    @staticmethod
+    def variant(request):
+        params = '&'.join(f'{name}={request.query_params.get(name, "")}' for name in VARIANT_PARAMS)
+        return hashlib.sha1(params.encode()).hexdigest()[:12]
+
+    def key(self, kind, project_id, revision, variant):
+        return f'{PREFIX}:{kind}:{project_id}:{revision}:{variant}'
+
+    def get_or_build(self, kind, project_id, revision, variant, build):
+        """(payload, hit): the cached payload for this revision, or build() stored under it."""
+        if not self.enabled:
+            return build(), False
+        key = self.key(kind, project_id, revision, variant)
+        payload = self.backend.get(key)
+        if payload is not None:
+            self._count('hits')
+            return payload, True
+        self._count('misses')
+        payload = build()
+        self.backend.set(key, payload, self.timeout)
+        return payload, False
+
+    def _count(self, name):
+        key = f'{PREFIX}:stats:{name}'
+        try:
+            self.backend.incr(key)
+        except ValueError:  # first hit/miss since the backend started
+            self.backend.add(key, 0, None)
+            self.backend.incr(key)
+
+    def stats(self):
+        values = self.backend.get_many([f'{PREFIX}:stats:hits', f'{PREFIX}:stats:misses'])
+        hits, misses = values.get(f'{PREFIX}:stats:hits', 0), values.get(f'{PREFIX}:stats:misses', 0)
+        total = hits + misses
+        return {'enabled': self.enabled, 'hits': hits, 'misses': misses, 'hit_ratio': round(hits / total, 4) if total else None}
+
+    def reset_stats(self):
+        self.backend.delete_many([f'{PREFIX}:stats:hits', f'{PREFIX}:stats:misses'])
+
+
+read_cache = ReadCache()
@@ -0,0 +1,268 @@
+import asyncio  # subscriber queues live on the ASGI event loop
+import itertools  # event ids
+import json  # SSE data lines
+import logging  # presence announcer failures
+import threading  # publishers run in sync worker threads
+import time  # presence expiry
+import uuid  # origin of bus messages
+from collections import defaultdict  # project_id -> subscribers
+
+from django.conf import settings  # BOARDS_EVENTS
+from django.db import close_old_connections, transaction  # announcer thread connection, publish only what was committed
+from django.utils.module_loading import import_string  # pluggable broker class
+from rest_framework.utils.encoders import JSONEncoder  # same encoding as the REST API
+
+from .bus import bus  # cross-worker delivery
+
+logger = logging.getLogger(__name__)
+
+# ----------------------------
+# Board change events
+#
+# Model signals (boards.signals) describe each committed write to a column,
+# task or comment as an event and hand it to the broker. The SSE view
+# subscribes one asyncio.Queue per connection, so an idle client costs a
+# parked coroutine and an empty queue. Bulk renumbering (ordering.rebalance)
+# sends one `<kind>.reordered` event with the new orders instead of one
+# event per row. LocalBroker only reaches clients connected to the same
+# process; BusBroker also relays events to every other worker over
+# boards.bus (NOTIFY, or the polled table). Workers with subscribers
+# announce the project ids they stream on the bus every PRESENCE_SECONDS,
+# and at once when the set changes; a write is only relayed when some
+# worker streams its project, so boards nobody watches cost nothing.
+# ----------------------------
+_event_settings = getattr(settings, 'BOARDS_EVENTS', {})
+QUEUE_SIZE = _event_settings.get('QUEUE_SIZE', 256)  # events buffered per connection before it is told to resync
+HEARTBEAT_SECONDS = _event_settings.get('HEARTBEAT_SECONDS', 15)  # keeps proxies from closing idle streams
+BUS_KIND = 'events'
+PRESENCE_KIND = 'events.presence'
+PRESENCE_SECONDS = _event_settings.get('PRESENCE_SECONDS', 20)  # re-announce interval; silent workers expire after 3x
+MAX_MESSAGE_BYTES = 7000  # NOTIFY payloads are capped at 8000 bytes; larger events are relayed without `data`
+
+
+class Subscription:
+    def __init__(self, project_id, loop):
+        self.project_id = project_id
+        self.loop = loop  # loop that owns the queue
+        self.queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self.overflowed = False  # set when the client fell too far behind
+
+    def deliver(self, event):
+        # runs on the subscriber's loop (call_soon_threadsafe)
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # slow consumer: drop the backlog and tell it to reload the board instead
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({'type': 'resync', 'project': self.project_id})
+
+
+class LocalBroker:
+    """In-process pub/sub: publishers in any thread, subscribers on asyncio loops."""
+
+    def __init__(self):
+        self._subscribers = defaultdict(set)  # project_id -> {Subscription}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)  # monotonic event ids for the SSE `id:` field
+
+    def subscribe(self, project_id):
+        subscription = Subscription(project_id, asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers[project_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.project_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.project_id]
+
+    def is_listening(self, project_id=None):
+        # lets publishers skip building events nobody in this process would receive
+        if project_id is None:
+            return bool(self._subscribers)
+        return project_id in self._subscribers
+
+    def publish(self, project_id, event):
+        event = {'id': next(self._ids), **event}
+        with self._lock:
+            subscribers = list(self._subscribers.get(project_id, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+            except RuntimeError:  # loop already closed; the stream is going away
+                self.unsubscribe(subscription)
+
+
+class BusBroker(LocalBroker):
+    """LocalBroker that also delivers to the subscribers of every other worker, over boards.bus."""
+
+    def __init__(self):
+        super().__init__()
+        self.origin = uuid.uuid4().hex  # the bus echoes our own messages back; they were delivered locally already
+        self._connected = False  # the listener's first "everything" message is its start, not a gap
+        self._remote = {}  # origin -> (project ids streamed by that worker, monotonic expiry)
+        self._announced = ()  # project ids last announced by this worker
+        self._ask = False  # (re)connected: ask the other workers to announce theirs
+        self._wake = threading.Event()  # announce now instead of at the next interval
+        self._announcer = None
+        bus.register(BUS_KIND, self._receive)
+        bus.register(PRESENCE_KIND, self._presence)
+
+    def subscribe(self, project_id):
+        bus.ensure_listening()
+        subscription = super().subscribe(project_id)
+        self._changed()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        super().unsubscribe(subscription)
+        self._changed()
+
+    def is_listening(self, project_id=None):
+        if super().is_listening(project_id):
+            return True
+        if not bus.enabled:
+            return False
+        bus.ensure_listening()  # presence announcements arrive on the listener thread
+        now = time.monotonic()
+        with self._lock:
+            return any(
+                expires > now and (project_id is None or project_id in project_ids)
+                for project_ids, expires in self._remote.values()
+            )
+
+    def publish(self, project_id, event):
+        super().publish(project_id, event)
+        if not bus.enabled:
+            return
+        message = self._encode(project_id, event)
+        if len(message) > MAX_MESSAGE_BYTES:  # other workers get the object id and reload the row
+            message = self._encode(project_id, {key: value for key, value in event.items() if key != 'data'})
+        bus.publish(BUS_KIND, [message])
+
+    def _encode(self, project_id, event):
+        return json.dumps({'origin': self.origin, 'project': project_id, 'event': event}, cls=JSONEncoder, separators=(',', ':'))
+
+    def _receive(self, messages):
+        # bus handler: events published by any worker, None when some may have been missed
+        if messages is None:
+            if self._connected:
+                with self._lock:
+                    project_ids = list(self._subscribers)
+                for project_id in project_ids:
+                    super().publish(project_id, {'type': 'resync', 'project': project_id})
+            self._connected = True
+            return
+        for message in messages:
+            message = json.loads(message)
+            if message['origin'] != self.origin:
+                super().publish(message['project'], message['event'])
+
+    # ---- presence ----
+    def _presence(self, messages):
+        # bus handler: project ids streamed by the other workers, None when this listener (re)connected
+        if messages is None:
+            self._ask = True
+            self._changed()
+            return
+        expires = time.monotonic() + 3 * PRESENCE_SECONDS
+        for message in messages:
+            message = json.loads(message)
+            if message['origin'] == self.origin:
+                continue
+            with self._lock:
+                if message['projects']:
+                    self._remote[message['origin']] = (frozenset(message['projects']), expires)
+                else:
+                    self._remote.pop(message['origin'], None)
+            if message['ask']:
+                self._changed()
+
+    def _changed(self):
+        # wake the announcer; DB writes stay off the ASGI loop and the request threads
+        if not bus.enabled:
+            return
+        if self._announcer is None or not self._announcer.is_alive():
+            with self._lock:
+                if self._announcer is None or not self._announcer.is_alive():
+                    self._announcer = threading.Thread(target=self._announce_forever, name='boards-events-presence', daemon=True)
+                    self._announcer.start()
+        self._wake.set()
+
+    def _announce_forever(self):
+        while True:
+            self._wake.wait(PRESENCE_SECONDS)
+            self._wake.clear()
+            try:
+                self._announce()
+            except Exception:
+                logger.exception("Could not announce event subscriptions")
+            finally:
+                close_old_connections()  # this thread owns its own DB connection
+
+    def _announce(self):
+        with self._lock:
+            project_ids = sorted(self._subscribers)
+            now = time.monotonic()
+            self._remote = {origin: entry for origin, entry in self._remote.items() if entry[1] > now}
+            ask, self._ask = self._ask, False
+        if not (project_ids or self._announced or ask):
+            return  # nothing streamed here, and the others already know
+        message = {'origin': self.origin, 'projects': project_ids, 'ask': ask}
+        bus.publish(PRESENCE_KIND, [json.dumps(message, separators=(',', ':'))])
+        self._announced = project_ids
+
+
+broker = import_string(_event_settings.get('BROKER', 'backend.boards.events.BusBroker'))()
+
+
+def emit(kind, action, instance, project_id, serializer_class=None):
+    """Queue a `<kind>.<action>` event for project_id, published once the transaction commits."""
+    if project_id is None or not broker.is_listening(project_id):
+        return
+    event = {'type': f'{kind}.{action}', 'project': project_id, 'object_id': instance.pk}
+    if serializer_class is not None and action != 'deleted':
+        event['data'] = serializer_class(instance).data
+    transaction.on_commit(lambda: broker.publish(project_id, event))
+
+
+def emit_reordered(kind, project_id, scope, scope_id, orders):
+    """Queue one `<kind>.reordered` event for rows renumbered in bulk: orders is [(id, order), ...]."""
+    if project_id is None or not broker.is_listening(project_id):
+        return
+    event = {
+        'type': f'{kind}.reordered', 'project': project_id, 'object_id': scope_id,
+        'data': {scope: scope_id, 'order': [{'id': pk, 'order': order} for pk, order in orders]},
+    }
+    transaction.on_commit(lambda: broker.publish(project_id, event))
+
+
+def format_sse(event):
+    """One event in text/event-stream framing."""
+    data = json.dumps(event, cls=JSONEncoder, separators=(',', ':'))
+    return f"id: {event.get('id', '')}\nevent: {event['type']}\ndata: {data}\n\n"
+
+
+async def stream(project_id):
+    """Async iterator of SSE frames for one connection; unsubscribes when the client goes away."""
+    subscription = broker.subscribe(project_id)
+    try:
+        yield 'retry: 3000\n\n'  # reconnect delay hint for EventSource
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), timeout=HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield ': keepalive\n\n'
+                continue
+            yield format_sse(event)
+            if event['type'] == 'resync':
+                return  # client must reload the board and reconnect
+    finally:
+        broker.unsubscribe(subscription)
@@ -0,0 +1,34 @@
+import json  # --json output for cron/log shippers
+
+from django.core.management.base import BaseCommand, CommandError  # base class for manage.py commands
+
+from backend.boards.retention import DEFAULT_POLICIES, apply_retention  # retention job
+
+
+class Command(BaseCommand):
+    help = "Archive or delete old read notifications and long soft-deleted columns, tasks and comments."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--max-seconds', type=float, default=60, help="Stop starting new batches after this long")
+        parser.add_argument('--batch-size', type=int, default=1000, help="Rows per batch (one transaction each)")
+        parser.add_argument('--only', action='append', choices=sorted(DEFAULT_POLICIES), help="Run only this policy (repeatable)")
+        parser.add_argument('--dry-run', action='store_true', help="Only count eligible rows")
+        parser.add_argument('--json', action='store_true', help="Print the metrics as JSON")
+
+    def handle(self, *args, **options):
+        try:
+            metrics = apply_retention(
+                max_seconds=options['max_seconds'], batch_size=options['batch_size'],
+                dry_run=options['dry_run'], only=options['only'],
+            )
+        except ValueError as exc:  # bad BOARDS_RETENTION
+            raise CommandError(exc)
+        if options['json']:
+            self.stdout.write(json.dumps(metrics))
+            return
+        for name in DEFAULT_POLICIES:
+            if name in metrics:
+                stats = ', '.join(f'{key}={value}' for key, value in metrics[name].items())
+                self.stdout.write(f"{name}: {stats}")
+        status = "done" if metrics['finished'] else "time budget reached, run again to continue"
+        self.stdout.write(self.style.SUCCESS(f"Retention {status} ({metrics['elapsed_seconds']}s)."))
@@ -0,0 +1,382 @@
+import json  # request bodies, results file
+import math  # nearest-rank percentiles
+import random  # request parameters
+import statistics  # medians
+import time  # timing
+import uuid  # unique registrations
+from datetime import timedelta  # sync token age
+
+from django.conf import settings  # ALLOWED_HOSTS
+from django.contrib.auth import get_user_model  # benchmark user
+from django.core.management.base import BaseCommand, CommandError  # base class for manage.py commands
+from django.db import connection  # query counting
+from django.test import Client  # requests through the full middleware/URL stack
+from django.test.utils import CaptureQueriesContext  # query counting
+from django.urls import URLResolver, reverse  # route coverage, paths
+from django.utils import timezone  # results timestamp
+from django.utils.http import urlencode  # extra query-string parameters
+
+from backend.boards import urls as boards_urls  # routes to cover
+from backend.boards.authentication import VersionedTokenObtainPairSerializer  # refresh tokens without a login round trip
+from backend.boards.models import Column, Comment, Notification, Project, ProjectAccess, Task  # request parameters
+from backend.boards.ordering import next_order  # untimed setup rows
+from backend.boards.versioning import make_sync_token  # ?since= for the changes route
+
+User = get_user_model()
+
+SEARCH_TERMS = ['fix', 'review', 'deploy', 'search', 'release', 'mobile', 'customer', 'sprint']
+SKIPPED = {'project_events': "endless SSE stream"}  # routes that cannot be timed as a single request
+
+# name -> (mix, url name); the request itself is built by Command._request_<name with dots as underscores>
+ROUTES = {
+    'api.root': ('read', 'api-root'),
+    'test_connection': ('read', 'test_connection'),
+    'projects.list': ('read', 'project-list'),
+    'projects.retrieve': ('read', 'project-detail'),
+    'projects.board': ('read', 'project-board'),
+    'projects.board_not_modified': ('read', 'project-board'),
+    'projects.changes': ('read', 'project-changes'),
+    'projects.cache_stats': ('read', 'project-cache-stats'),
+    'columns.list': ('read', 'column-list'),
+    'columns.retrieve': ('read', 'column-detail'),
+    'tasks.list': ('read', 'task-list'),
+    'tasks.retrieve': ('read', 'task-detail'),
+    'comments.list': ('read', 'comment-list'),
+    'comments.retrieve': ('read', 'comment-detail'),
+    'notifications.list': ('read', 'notification-list'),
+    'notifications.retrieve': ('read', 'notification-detail'),
+    'notifications.unread_count': ('read', 'notification-unread-count'),
+    'search': ('read', 'search'),
+    'projects.create': ('write', 'project-list'),
+    'projects.update': ('write', 'project-detail'),
+    'projects.reorder': ('write', 'project-reorder'),
+    'columns.create': ('write', 'column-list'),
+    'columns.move': ('write', 'column-move'),
+    'columns.delete': ('write', 'column-detail'),
+    'tasks.create': ('write', 'task-list'),
+    'tasks.update': ('write', 'task-detail'),
+    'tasks.move': ('write', 'task-move'),
+    'tasks.delete': ('write', 'task-detail'),
+    'comments.create': ('write', 'comment-list'),
+    'comments.delete': ('write', 'comment-detail'),
+    'notifications.mark_read': ('write', 'notification-mark-read'),
+    'auth.register': ('auth', 'auth_register'),
+    'auth.login': ('auth', 'token_obtain_pair'),
+    'auth.refresh': ('auth', 'token_refresh'),
+    'auth.logout': ('auth', 'auth_logout'),
+}
+MIXES = ('read', 'write', 'auth')
+
+
+def _route_names(patterns):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _route_names(pattern.url_patterns)
+        elif pattern.name:
+            yield pattern.name
+
+
+def _count_objects(data):
+    # JSON objects in a response body, i.e. rows (and nested rows) serialized
+    if isinstance(data, dict):
+        return 1 + sum(_count_objects(value) for value in data.values())
+    if isinstance(data, list):
+        return sum(_count_objects(value) for value in data)
+    return 0
+
+
+def _percentile(values, share):
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(share * len(ordered)) - 1)]
+
+
+class Command(BaseCommand):
+    help = ("Replay a request mix against every boards.urls route through the test client and report p50/p95 latency, "
+            "SQL queries and serialized rows per route. Run `manage.py seed_kanban` first, on a scratch database: "
+            "the write and auth routes create rows.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--mix', action='append', choices=MIXES, help="Route group to run (repeatable; default all)")
+        parser.add_argument('--only', action='append', choices=sorted(ROUTES), metavar='ROUTE', help="Run only this route (repeatable)")
+        parser.add_argument('--rounds', type=int, default=20, help="Timed requests per route")
+        parser.add_argument('--warmup', type=int, default=2, help="Untimed rounds first")
+        parser.add_argument('--prefix', default='seed', help="seed_kanban --prefix; <prefix>0 sends the requests")
+        parser.add_argument('--password', default='seed-password', help="seed_kanban --password")
+        parser.add_argument('--random-seed', type=int, default=0, help="Seed for the request parameters")
+        parser.add_argument('--output', help="Write the results as JSON to this file")
+        parser.add_argument('--compare', help="Earlier --output file to print deltas against")
+
+    def handle(self, *args, **options):
+        self.setup(options['prefix'], options['password'], options['random_seed'])
+        routes = [name for name, (mix, _) in ROUTES.items()
+                  if (not options['only'] or name in options['only']) and (not options['mix'] or mix in options['mix'])]
+        missing = set(_route_names(boards_urls.urlpatterns)) - {url for _, url in ROUTES.values()} - set(SKIPPED)
+        for name in sorted(missing):
+            self.stderr.write(f"warning: route {name} has no benchmark request")
+
+        samples = {name: [] for name in routes}
+        for round_ in range(options['warmup'] + options['rounds']):
+            for name in routes:
+                sample = self.run(name)
+                if round_ >= options['warmup']:
+                    samples[name].append(sample)
+
+        results = {
+            'created_at': timezone.now().isoformat(),
+            'database': connection.vendor,
+            'user': self.user.username,
+            'rounds': options['rounds'],
+            'workload': {
+                'projects': len(self.project_ids),
+                'columns': Column.objects.filter(project_id__in=self.project_ids).count(),
+                'tasks': Task.objects.filter(column__project_id__in=self.project_ids).count(),
+                'comments': Comment.objects.filter(task__column__project_id__in=self.project_ids).count(),
+                'notifications': Notification.objects.filter(user=self.user).count(),
+            },
+            'skipped': SKIPPED,
+            'routes': {name: self._summary(name, samples[name]) for name in routes},
+        }
+        previous = self._load(options['compare']) if options['compare'] else None
+        self._print(results, previous)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(results, f, indent=2, sort_keys=True)
+            self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}."))
+
+    # ---- running ----
+    def setup(self, prefix, password, random_seed=0):
+        """Log in as <prefix>0 from seed_kanban and collect the ids the requests are built from."""
+        self.user = User.objects.filter(username=f"{prefix}0").first()
+        if self.user is None:
+            raise CommandError(f"User {prefix}0 not found; run `manage.py seed_kanban` first.")
+        self.rng = random.Random(random_seed)
+        self.password = password
+        self.project_ids = list(ProjectAccess.objects.filter(user=self.user, project__is_active=True).values_list('project_id', flat=True))
+        self.owned_ids = list(Project.objects.filter(owner=self.user).values_list('pk', flat=True))
+        if not self.owned_ids:
+            raise CommandError(f"{self.user} owns no project; run `manage.py seed_kanban` with --projects > 0.")
+        self.created = {'columns': [], 'tasks': [], 'comments': []}  # rows made by the create routes, used by the deletes
+        hosts = [host for host in settings.ALLOWED_HOSTS if host not in ('*',) and not host.startswith('.')]
+        self.client = Client(HTTP_HOST=hosts[0] if hosts else 'localhost')
+        self.auth = {'HTTP_AUTHORIZATION': f"Bearer {self._login()['access']}"}
+
+    def run(self, name, params=None):
+        """Send one request of route `name`; returns its time, status, queries (and their SQL) and serialized rows."""
+        method, path, body, headers = getattr(self, '_request_' + name.replace('.', '_'))()  # untimed setup
+        if params:  # e.g. {'fields': 'id,title'} or {'expand': 'assigned'}
+            path += ('&' if '?' in path else '?') + urlencode(params)
+        headers = {**self.auth, **headers}
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            response = self.client.generic(method, path, json.dumps(body) if body is not None else '',
+                                           content_type='application/json', **headers)
+            elapsed = time.perf_counter() - start
+        data = response.json() if response.get('Content-Type', '').startswith('application/json') and response.content else None
+        self._after(name, data)
+        return {
+            'ms': elapsed * 1000, 'status': response.status_code, 'queries': len(queries),
+            'sql': [query['sql'] for query in queries.captured_queries], 'rows': _count_objects(data),
+        }
+
+    def _after(self, name, data):
+        # remember what the create routes made so the delete routes have something to delete
+        kind = name.split('.')[0]
+        if name.endswith('.create') and kind in self.created and isinstance(data, dict) and 'id' in data:
+            self.created[kind].append(data['id'])
+
+    @staticmethod
+    def _summary(name, samples):
+        if not samples:
+            return {}
+        ms = [sample['ms'] for sample in samples]
+        return {
+            'url_name': ROUTES[name][1],
+            'requests': len(samples),
+            'status': sorted({sample['status'] for sample in samples}),
+            'p50_ms': round(_percentile(ms, 0.50), 3),
+            'p95_ms': round(_percentile(ms, 0.95), 3),
+            'mean_ms': round(statistics.fmean(ms), 3),
+            'queries': statistics.median(sample['queries'] for sample in samples),
+            'queries_max': max(sample['queries'] for sample in samples),
+            'rows': statistics.median(sample['rows'] for sample in samples),
+        }
+
+    # ---- reporting ----
+    def _load(self, path):
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Cannot read {path}: {exc}")
+
+    def _print(self, results, previous):
+        before = (previous or {}).get('routes', {})
+        self.stdout.write(f"{results['database']}, {results['rounds']} rounds as {results['user']}, workload {results['workload']}")
+        self.stdout.write(f"{'route':30} {'status':>10} {'p50 ms':>9} {'p95 ms':>9} {'queries':>8} {'rows':>7}")
+        for name, stats in results['routes'].items():
+            status = ','.join(str(code) for code in stats['status'])
+            line = f"{name:30} {status:>10} {stats['p50_ms']:9.2f} {stats['p95_ms']:9.2f} {stats['queries']:8g} {stats['rows']:7g}"
+            old = before.get(name)
+            if old:
+                line += (f"   p50 {stats['p50_ms'] / old['p50_ms'] if old['p50_ms'] else 0:5.2f}x"
+                         f"  p95 {stats['p95_ms'] / old['p95_ms'] if old['p95_ms'] else 0:5.2f}x"
+                         f"  queries {stats['queries'] - old['queries']:+g}")
+            self.stdout.write(line)
+        for name, reason in SKIPPED.items():
+            self.stdout.write(f"{name:30} skipped: {reason}")
+
+    # ---- setup helpers (not timed) ----
+    def _project(self, owned=False):
+        return self.rng.choice(self.owned_ids if owned else self.project_ids)
+
+    def _column(self, project_id=None):
+        columns = list(Column.objects.filter(project_id=project_id or self._project()).values_list('pk', flat=True))
+        return self.rng.choice(columns) if columns else self._new_column(project_id or self._project())
+
+    def _new_column(self, project_id):
+        return Column.objects.create(project_id=project_id, name='Bench', order=next_order(Column, project_id)).pk
+
+    def _task(self):
+        task_id = Task.objects.filter(column__project_id__in=self.project_ids).order_by('?').values_list('pk', flat=True).first()
+        return task_id or self._new_task()
+
+    def _new_task(self):
+        column_id = self._column()
+        return Task.objects.create(column_id=column_id, title='Bench task', order=next_order(Task, column_id), created_by=self.user).pk
+
+    def _comment(self):
+        comment_id = Comment.objects.filter(task__column__project_id__in=self.project_ids).order_by('?').values_list('pk', flat=True).first()
+        return comment_id or self._new_comment()
+
+    def _new_comment(self):
+        return Comment.objects.create(task_id=self._task(), author=self.user, text='Bench comment').pk
+
+    def _refresh_token(self):
+        return str(VersionedTokenObtainPairSerializer.get_token(self.user))
+
+    def _login(self):
+        response = self.client.post(reverse('token_obtain_pair'), {'username': self.user.username, 'password': self.password},
+                                    content_type='application/json')
+        if response.status_code != 200:
+            raise CommandError(f"Login as {self.user} failed ({response.status_code}); pass the seed_kanban --password.")
+        return response.json()
+
+    # ---- requests: (method, path, JSON body or None, extra headers) ----
+    def _request_api_root(self):
+        return 'GET', reverse('api-root'), None, {}
+
+    def _request_test_connection(self):
+        return 'GET', reverse('test_connection'), None, {}
+
+    def _request_projects_list(self):
+        return 'GET', reverse('project-list'), None, {}
+
+    def _request_projects_retrieve(self):
+        return 'GET', reverse('project-detail', args=[self._project()]), None, {}
+
+    def _request_projects_board(self):
+        return 'GET', reverse('project-board', args=[self._project()]), None, {}
+
+    def _request_projects_board_not_modified(self):
+        path = reverse('project-board', args=[self._project()])
+        etag = self.client.get(path, **self.auth).get('ETag', '')
+        return 'GET', path, None, {'HTTP_IF_NONE_MATCH': etag}
+
+    def _request_projects_changes(self):
+        since = make_sync_token(timezone.now() - timedelta(minutes=5))
+        return 'GET', f"{reverse('project-changes', args=[self._project()])}?since={since}", None, {}
+
+    def _request_projects_cache_stats(self):
+        return 'GET', reverse('project-cache-stats'), None, {}
+
+    def _request_columns_list(self):
+        return 'GET', reverse('column-list'), None, {}
+
+    def _request_columns_retrieve(self):
+        return 'GET', reverse('column-detail', args=[self._column()]), None, {}
+
+    def _request_tasks_list(self):
+        return 'GET', reverse('task-list'), None, {}
+
+    def _request_tasks_retrieve(self):
+        return 'GET', reverse('task-detail', args=[self._task()]), None, {}
+
+    def _request_comments_list(self):
+        return 'GET', reverse('comment-list'), None, {}
+
+    def _request_comments_retrieve(self):
+        return 'GET', reverse('comment-detail', args=[self._comment()]), None, {}
+
+    def _request_notifications_list(self):
+        return 'GET', reverse('notification-list'), None, {}
+
+    def _request_notifications_retrieve(self):
+        notification = Notification.objects.filter(user=self.user).values_list('pk', flat=True).first()
+        if notification is None:
+            notification = Notification.objects.create(user=self.user, message='Bench notification').pk
+        return 'GET', reverse('notification-detail', args=[notification]), None, {}
+
+    def _request_notifications_unread_count(self):
+        return 'GET', reverse('notification-unread-count'), None, {}
+
+    def _request_search(self):
+        return 'GET', f"{reverse('search')}?q={self.rng.choice(SEARCH_TERMS)}", None, {}
+
+    def _request_projects_create(self):
+        return 'POST', reverse('project-list'), {'name': f'Bench project {uuid.uuid4().hex[:8]}'}, {}
+
+    def _request_projects_update(self):
+        return 'PATCH', reverse('project-detail', args=[self._project(owned=True)]), {'description': f'Bench {uuid.uuid4().hex}'}, {}
+
+    def _request_projects_reorder(self):
+        project_id = self._project()
+        column_id = self._column(project_id)
+        tasks = list(Task.objects.filter(column_id=column_id).values_list('pk', flat=True))
+        self.rng.shuffle(tasks)
+        return 'POST', reverse('project-reorder', args=[project_id]), {'tasks': [{'column': column_id, 'tasks': tasks}]}, {}
+
+    def _request_columns_create(self):
+        return 'POST', reverse('column-list'), {'project': self._project(), 'name': 'Bench column'}, {}
+
+    def _request_columns_move(self):
+        return 'POST', reverse('column-move', args=[self._column()]), {'position': self.rng.randint(0, 3)}, {}
+
+    def _request_columns_delete(self):
+        column_id = self.created['columns'].pop() if self.created['columns'] else self._new_column(self._project())
+        return 'DELETE', reverse('column-detail', args=[column_id]), None, {}
+
+    def _request_tasks_create(self):
+        return 'POST', reverse('task-list'), {'column': self._column(), 'title': 'Bench task'}, {}
+
+    def _request_tasks_update(self):
+        return 'PATCH', reverse('task-detail', args=[self._task()]), {'title': f'Bench {uuid.uuid4().hex[:8]}'}, {}
+
+    def _request_tasks_move(self):
+        return 'POST', reverse('task-move', args=[self._task()]), {'position': self.rng.randint(0, 10)}, {}
+
+    def _request_tasks_delete(self):
+        task_id = self.created['tasks'].pop() if self.created['tasks'] else self._new_task()
+        return 'DELETE', reverse('task-detail', args=[task_id]), None, {}
+
+    def _request_comments_create(self):
+        return 'POST', reverse('comment-list'), {'task': self._task(), 'text': 'Bench comment'}, {}
+
+    def _request_comments_delete(self):
+        comment_id = self.created['comments'].pop() if self.created['comments'] else self._new_comment()
+        return 'DELETE', reverse('comment-detail', args=[comment_id]), None, {}
+
+    def _request_notifications_mark_read(self):
+        return 'POST', reverse('notification-mark-read'), {}, {}
+
+    def _request_auth_register(self):
+        name = f'bench-{uuid.uuid4().hex[:12]}'
+        return 'POST', reverse('auth_register'), {'username': name, 'email': f'{name}@example.com', 'password': 'bench-password'}, {}
+
+    def _request_auth_login(self):
+        return 'POST', reverse('token_obtain_pair'), {'username': self.user.username, 'password': self.password}, {}
+
+    def _request_auth_refresh(self):
+        return 'POST', reverse('token_refresh'), {'refresh': self._refresh_token()}, {}
+
+    def _request_auth_logout(self):
+        return 'POST', reverse('auth_logout'), {'refresh': self._refresh_token()}, {}
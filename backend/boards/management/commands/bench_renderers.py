@@ -0,0 +1,65 @@
+import io  # parser input stream
+import time  # timing
+from datetime import date, timedelta  # sample due dates
+
+from django.contrib.auth import get_user_model  # sample assignees
+from django.core.management.base import BaseCommand, CommandError  # base class for manage.py commands
+from django.utils import timezone  # sample timestamps
+from rest_framework.parsers import JSONParser  # stdlib baseline
+from rest_framework.renderers import JSONRenderer  # stdlib baseline
+
+from backend.boards.models import Task  # payload rows
+from backend.boards.renderers import ORJSONParser, ORJSONRenderer, orjson  # classes under test
+from backend.boards.serializers import TaskSerializer  # real field output
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Compare DRF's JSON renderer/parser with the orjson-backed ones on a task list payload (no database access)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, default=2000, help="Tasks in the payload")
+        parser.add_argument('--rounds', type=int, default=50, help="Timed repetitions per class")
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            raise CommandError("orjson is not installed; ORJSONRenderer/ORJSONParser fall back to the stdlib.")
+        data = TaskSerializer(self._tasks(options['tasks']), many=True).data
+        body = JSONRenderer().render(data)
+        if ORJSONRenderer().render(data) != body:
+            raise CommandError("ORJSONRenderer output differs from JSONRenderer.")
+        self.stdout.write(f"payload: {options['tasks']} tasks, {len(body) / 1024:.0f} KiB, identical bytes")
+
+        rounds = options['rounds']
+        for label, baseline, fast in (
+            ('render', lambda: JSONRenderer().render(data), lambda: ORJSONRenderer().render(data)),
+            ('parse', lambda: JSONParser().parse(io.BytesIO(body)), lambda: ORJSONParser().parse(io.BytesIO(body))),
+        ):
+            slow_ms = self._time(baseline, rounds)
+            fast_ms = self._time(fast, rounds)
+            self.stdout.write(f"{label:6} json {slow_ms:7.2f} ms   orjson {fast_ms:7.2f} ms   {slow_ms / fast_ms:5.1f}x")
+
+    @staticmethod
+    def _tasks(count):
+        # unsaved instances with every field set, so serializing runs no queries
+        now = timezone.now()
+        users = [User(pk=i, username=f'user{i}') for i in range(1, 21)]
+        tasks = []
+        for i in range(1, count + 1):
+            task = Task(
+                pk=i, column_id=i % 8 + 1, title=f'Task {i}: ship the thing – ünïcode', description='Details ' * 20,
+                order=i * 1024, due=date.today() + timedelta(days=i % 30) if i % 3 else None,
+                assigned=users[i % 20] if i % 4 else None, created_by=users[0], is_active=True,
+            )
+            task.created_at = task.updated_at = now - timedelta(minutes=i)
+            tasks.append(task)
+        return tasks
+
+    @staticmethod
+    def _time(func, rounds):
+        func()  # warm-up
+        start = time.perf_counter()
+        for _ in range(rounds):
+            func()
+        return (time.perf_counter() - start) * 1000 / rounds
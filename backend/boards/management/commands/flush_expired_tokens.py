@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand  # base class for manage.py commands
+
+from backend.boards.blacklist import flush_expired_tokens  # batched compaction
+
+
+class Command(BaseCommand):
+    help = "Delete expired outstanding/blacklisted JWT refresh tokens in batches (run from cron)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help="Tokens per DELETE batch")
+        parser.add_argument('--max-seconds', type=float, default=60, help="Stop starting new batches after this long")
+
+    def handle(self, *args, **options):
+        deleted, finished = flush_expired_tokens(batch_size=options['batch_size'], max_seconds=options['max_seconds'])
+        status = "done" if finished else "time budget reached, run again to continue"
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} expired tokens ({status})."))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand  # base class for manage.py commands
+
+from backend.boards.access import REBUILD_BATCH_SIZE, rebuild_project_access  # index rebuild
+
+
+class Command(BaseCommand):
+    help = "Rebuild the ProjectAccess index from Project.owner and Project.members."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=REBUILD_BATCH_SIZE, help="Rows per INSERT batch")
+
+    def handle(self, *args, **options):
+        written = rebuild_project_access(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt project access index: {written} rows."))
@@ -0,0 +1,131 @@
+import random  # reproducible synthetic data
+import time  # timing
+from datetime import date, timedelta  # due dates
+
+from django.contrib.auth import get_user_model  # seeded users
+from django.contrib.auth.hashers import make_password  # one hash shared by every seeded user
+from django.core.management.base import BaseCommand, CommandError  # base class for manage.py commands
+from django.db import transaction  # all-or-nothing seeding
+
+from backend.boards.access import sync_project_access  # bulk_create skips the signals that keep the index
+from backend.boards.models import Column, Comment, Notification, Project, Task  # seeded rows
+from backend.boards.notifications import adjust_unread  # unread counters of the seeded inboxes
+from backend.boards.ordering import ORDER_GAP  # rows start evenly spaced, like after a rebalance
+
+User = get_user_model()
+
+COLUMN_NAMES = ['To Do', 'In Progress', 'Review', 'Done', 'Blocked', 'Backlog']
+VERBS = ['Fix', 'Ship', 'Review', 'Refactor', 'Document', 'Test', 'Deploy', 'Design', 'Migrate', 'Profile']
+NOUNS = ['login page', 'board drag and drop', 'notification badge', 'search index', 'API docs', 'release notes',
+         'payment flow', 'settings screen', 'onboarding', 'mobile layout', 'export job', 'audit log']
+WORDS = ('the of and to a in is it that for on with as at this but by from they we say her she or an will my all would '
+         'there their what so up out if about who get which go me when make can like time no just him know take people '
+         'into year your good some could them see other than then now look only come its over think also back after use '
+         'two how our work first well way even new want because any these give day most us deadline sprint customer').split()
+
+
+class Command(BaseCommand):
+    help = "Generate a synthetic workload (users, projects, members, columns, tasks, comments, notifications) with bulk inserts."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=50, help="Users to create; <prefix>0 is staff")
+        parser.add_argument('--projects', type=int, default=20, help="Projects, owned round-robin by the users")
+        parser.add_argument('--members', type=int, default=5, help="Members per project besides the owner")
+        parser.add_argument('--columns', type=int, default=4, help="Columns per project")
+        parser.add_argument('--tasks', type=int, default=25, help="Tasks per column")
+        parser.add_argument('--comments', type=int, default=2, help="Comments per task")
+        parser.add_argument('--notifications', type=int, default=20, help="Notifications per user")
+        parser.add_argument('--unread', type=float, default=0.3, help="Share of notifications left unread")
+        parser.add_argument('--prefix', default='seed', help="Username prefix (users are <prefix>0, <prefix>1, ...)")
+        parser.add_argument('--password', default='seed-password', help="Password of every seeded user")
+        parser.add_argument('--random-seed', type=int, default=0, help="Seed for the generated content")
+        parser.add_argument('--batch-size', type=int, default=1000, help="Rows per INSERT")
+
+    def handle(self, *args, **options):
+        if options['users'] < 1:
+            raise CommandError("--users must be at least 1.")
+        prefix = options['prefix']
+        if User.objects.filter(username=f'{prefix}0').exists():
+            raise CommandError(f"User {prefix}0 already exists; choose another --prefix or use a fresh database.")
+        self.rng = random.Random(options['random_seed'])
+        self.batch_size = options['batch_size']
+        self.counts = {}
+        start = time.perf_counter()
+        with transaction.atomic():
+            self._seed(options)
+        elapsed = time.perf_counter() - start
+        total = sum(self.counts.values())
+        for model, count in self.counts.items():
+            self.stdout.write(f"{model:14} {count:8}")
+        self.stdout.write(self.style.SUCCESS(f"Seeded {total} rows in {elapsed:.1f}s ({total / elapsed:.0f} rows/s)."))
+
+    def _insert(self, label, rows):
+        # ids are read back by the caller where needed: not every backend returns them from bulk_create
+        if rows:
+            type(rows[0]).objects.bulk_create(rows, batch_size=self.batch_size)
+        self.counts[label] = self.counts.get(label, 0) + len(rows)
+
+    def _sentence(self, low, high):
+        return ' '.join(self.rng.choice(WORDS) for _ in range(self.rng.randint(low, high))).capitalize() + '.'
+
+    def _seed(self, options):
+        rng, prefix = self.rng, options['prefix']
+        password = make_password(options['password'])
+        names = [f'{prefix}{i}' for i in range(options['users'])]
+        self._insert('users', [
+            User(username=name, email=f'{name}@example.com', password=password, is_staff=(i == 0))
+            for i, name in enumerate(names)
+        ])
+        user_ids = list(User.objects.filter(username__in=names).order_by('pk').values_list('pk', flat=True))
+
+        project_names = [f'{prefix} project {i}' for i in range(options['projects'])]
+        self._insert('projects', [
+            Project(name=name, description=self._sentence(5, 15), owner_id=user_ids[i % len(user_ids)])
+            for i, name in enumerate(project_names)
+        ])
+        projects = list(Project.objects.filter(name__in=project_names, owner_id__in=user_ids).values_list('pk', 'owner_id'))
+        people = {}  # project id -> owner and members
+        memberships = []
+        for project_id, owner_id in projects:
+            others = [user_id for user_id in user_ids if user_id != owner_id]
+            members = rng.sample(others, min(options['members'], len(others)))
+            people[project_id] = [owner_id] + members
+            memberships += [Project.members.through(project_id=project_id, user_id=user_id) for user_id in members]
+        self._insert('members', memberships)
+        sync_project_access(list(people))
+
+        self._insert('columns', [
+            Column(project_id=project_id, name=COLUMN_NAMES[j % len(COLUMN_NAMES)] + (f' {j // len(COLUMN_NAMES) + 1}' if j >= len(COLUMN_NAMES) else ''),
+                   order=(j + 1) * ORDER_GAP)
+            for project_id in people for j in range(options['columns'])
+        ])
+        columns = list(Column.objects.filter(project_id__in=people).values_list('pk', 'project_id'))
+
+        today = date.today()
+        tasks = []
+        for column_id, project_id in columns:
+            for k in range(options['tasks']):
+                tasks.append(Task(
+                    column_id=column_id, title=f'{rng.choice(VERBS)} {rng.choice(NOUNS)} #{k + 1}',
+                    description=self._sentence(8, 40) if rng.random() < 0.7 else None, order=(k + 1) * ORDER_GAP,
+                    due=today + timedelta(days=rng.randint(-10, 60)) if rng.random() < 0.5 else None,
+                    assigned_id=rng.choice(people[project_id]) if rng.random() < 0.6 else None,
+                    created_by_id=rng.choice(people[project_id]),
+                ))
+        self._insert('tasks', tasks)
+        column_project = dict(columns)
+        task_rows = list(Task.objects.filter(column_id__in=column_project).values_list('pk', 'column_id'))
+
+        self._insert('comments', [
+            Comment(task_id=task_id, author_id=rng.choice(people[column_project[column_id]]), text=self._sentence(3, 25))
+            for task_id, column_id in task_rows for _ in range(options['comments'])
+        ])
+
+        notifications, unread = [], {}
+        for user_id in user_ids:
+            for _ in range(options['notifications']):
+                read = rng.random() >= options['unread']
+                notifications.append(Notification(user_id=user_id, message=self._sentence(4, 12), read=read))
+                unread[user_id] = unread.get(user_id, 0) + (not read)
+        self._insert('notifications', notifications)
+        adjust_unread(unread)  # bulk_create skips the counter signals
@@ -0,0 +1,113 @@
+# Generated by Django 5.2.8 on 2026-10-18 02:31
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Notification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('message', models.TextField(help_text='Notification message')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('read', models.BooleanField(default=False, help_text='Has the user read this notification?')),
+                ('user', models.ForeignKey(help_text='User this notification belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Notification',
+                'verbose_name_plural': 'Notifications',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Project',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Name of the project (required)', max_length=100)),
+                ('description', models.TextField(blank=True, help_text='Optional project description', null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('members', models.ManyToManyField(blank=True, help_text='Users who can interact with the project', related_name='projects', to=settings.AUTH_USER_MODEL)),
+                ('owner', models.ForeignKey(help_text='User who owns the project', on_delete=django.db.models.deletion.CASCADE, related_name='owned_projects', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Project',
+                'verbose_name_plural': 'Projects',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Column',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text="Column name, e.g., 'To Do', 'In Progress'", max_length=100)),
+                ('order', models.PositiveIntegerField(help_text='Position of column in project board (left to right)')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('project', models.ForeignKey(help_text='The project this column belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='columns', to='boards.project')),
+            ],
+            options={
+                'verbose_name': 'Column',
+                'verbose_name_plural': 'Columns',
+                'ordering': ['order'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Task',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(help_text='Task title', max_length=200)),
+                ('description', models.TextField(blank=True, help_text='Task description', null=True)),
+                ('order', models.PositiveIntegerField(help_text='Task order within the column')),
+                ('due', models.DateField(blank=True, help_text='Optional due date', null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('assigned', models.ForeignKey(blank=True, help_text='User assigned to this task', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='tasks', to=settings.AUTH_USER_MODEL)),
+                ('column', models.ForeignKey(help_text='The column this task belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='tasks', to='boards.column')),
+                ('created_by', models.ForeignKey(blank=True, help_text='User who created this task', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='created_tasks', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Task',
+                'verbose_name_plural': 'Tasks',
+                'ordering': ['order'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Comment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('text', models.TextField(help_text='Comment text')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('author', models.ForeignKey(help_text='User who wrote this comment', on_delete=django.db.models.deletion.CASCADE, related_name='comments', to=settings.AUTH_USER_MODEL)),
+                ('task', models.ForeignKey(help_text='Task this comment belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='boards.task')),
+            ],
+            options={
+                'verbose_name': 'Comment',
+                'verbose_name_plural': 'Comments',
+                'ordering': ['created_at'],
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='column',
+            unique_together={('project', 'order')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='task',
+            unique_together={('column', 'order')},
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.8 on 2026-10-18 02:31
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_project_access(apps, schema_editor):
+    # index every existing owner and member, so nobody loses access on deploy
+    Project = apps.get_model('boards', 'Project')
+    ProjectAccess = apps.get_model('boards', 'ProjectAccess')
+    desired = {
+        (user_id, project_id): 'member'
+        for project_id, user_id in Project.members.through.objects.values_list('project_id', 'user_id').iterator()
+    }
+    for project_id, owner_id in Project.objects.values_list('pk', 'owner_id').iterator():
+        desired[(owner_id, project_id)] = 'owner'  # owner role wins over membership
+    ProjectAccess.objects.bulk_create(
+        [ProjectAccess(user_id=user_id, project_id=project_id, role=role) for (user_id, project_id), role in desired.items()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectAccess',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', models.CharField(choices=[('owner', 'Owner'), ('member', 'Member')], max_length=10)),
+                ('project', models.ForeignKey(help_text='Project the user can access', on_delete=django.db.models.deletion.CASCADE, related_name='access', to='boards.project')),
+                ('user', models.ForeignKey(help_text='User who can access the project', on_delete=django.db.models.deletion.CASCADE, related_name='project_access', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Project access',
+                'verbose_name_plural': 'Project access',
+                'unique_together': {('user', 'project')},
+            },
+        ),
+        migrations.RunPython(backfill_project_access, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 02:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0002_project_access'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='revision',
+            field=models.PositiveBigIntegerField(default=0, editable=False, help_text='Bumped on every change to the project, its columns, tasks or comments'),
+        ),
+    ]
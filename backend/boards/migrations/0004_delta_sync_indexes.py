@@ -0,0 +1,25 @@
+# Generated by Django 5.2.8 on 2026-10-18 02:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0003_project_revision'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='column',
+            index=models.Index(fields=['project', 'updated_at'], name='column_project_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['column', 'updated_at'], name='task_column_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['task', 'updated_at'], name='comment_task_updated_idx'),
+        ),
+    ]
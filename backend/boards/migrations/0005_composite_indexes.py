@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-18 02:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0004_delta_sync_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['task', 'created_at', 'id'], name='comment_active_task_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='notification_user_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('read', False)), fields=['user', '-created_at', '-id'], name='notification_unread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['assigned', 'due'], name='task_active_assigned_idx'),
+        ),
+    ]
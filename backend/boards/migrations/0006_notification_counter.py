@@ -0,0 +1,41 @@
+# Generated by Django 5.2.8 on 2026-10-18 02:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_unread_counters(apps, schema_editor):
+    # seed counters from the notifications that already exist
+    Notification = apps.get_model('boards', 'Notification')
+    NotificationCounter = apps.get_model('boards', 'NotificationCounter')
+    unread = Notification.objects.filter(read=False).values('user_id').annotate(unread=Count('id')).order_by()
+    NotificationCounter.objects.bulk_create(
+        [NotificationCounter(user_id=row['user_id'], unread=row['unread']) for row in unread.iterator()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0005_composite_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationCounter',
+            fields=[
+                ('user', models.OneToOneField(help_text='User the counter belongs to', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='notification_counter', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('unread', models.PositiveIntegerField(default=0, help_text='Number of unread notifications')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Notification counter',
+                'verbose_name_plural': 'Notification counters',
+            },
+        ),
+        migrations.RunPython(backfill_unread_counters, migrations.RunPython.noop),
+    ]
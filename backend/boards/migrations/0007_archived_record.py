@@ -0,0 +1,30 @@
+# Generated by Django 5.2.8 on 2026-10-18 02:35
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0006_notification_counter'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(help_text="Source model, e.g. 'task'", max_length=50)),
+                ('object_id', models.BigIntegerField(help_text='Primary key in the source table')),
+                ('payload', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='Column values at archive time')),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Archived record',
+                'verbose_name_plural': 'Archived records',
+                'ordering': ['-archived_at'],
+                'indexes': [models.Index(fields=['model', 'object_id'], name='archive_model_object_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations
+
+
+def install_search(apps, schema_editor):
+    # tsvector columns + GIN on PostgreSQL, FTS5 table + triggers on SQLite
+    from backend.boards import search
+    search.install(schema_editor.connection)
+
+
+def uninstall_search(apps, schema_editor):
+    from backend.boards import search
+    search.uninstall(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0007_archived_record'),
+    ]
+
+    operations = [
+        migrations.RunPython(install_search, uninstall_search),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-18 02:44
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('boards', '0008_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TokenVersion',
+            fields=[
+                ('user', models.OneToOneField(help_text='User the version belongs to', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='token_version', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('version', models.PositiveIntegerField(default=0, help_text="Current token version, carried in the 'ver' claim")),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Token version',
+                'verbose_name_plural': 'Token versions',
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.8 on 2026-10-18 02:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0009_token_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InvalidationEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(help_text="Cache kind, e.g. 'users'", max_length=30)),
+                ('keys', models.JSONField(blank=True, help_text='Keys to drop; empty means everything', null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'verbose_name': 'Invalidation event',
+                'verbose_name_plural': 'Invalidation events',
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.8 on 2026-10-18 03:13
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def copy_updated_at(apps, schema_editor):
+    # until now updated_at was bumped by every board change: it is the board's last change
+    Project = apps.get_model('boards', 'Project')
+    Project.objects.update(changed_at=models.F('updated_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0010_invalidation_event'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='changed_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False, help_text='Time of the last change to the project, its columns, tasks or comments'),
+        ),
+        migrations.RunPython(copy_updated_at, migrations.RunPython.noop),
+    ]
@@ -2,6 +2,7 @@ from django.db import models  # import Django models
 from django.conf import settings  # import settings to access AUTH_USER_MODEL
 from django.contrib.auth import get_user_model  # import the user model
 from django.utils import timezone  # import timezone for timestamps
+from django.core.serializers.json import DjangoJSONEncoder  # archive payloads hold dates
 
 # Get the active user model
 User = get_user_model()
@@ -34,6 +35,14 @@ class Project(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)  # timestamp when created
     updated_at = models.DateTimeField(auto_now=True)  # timestamp when updated
     is_active = models.BooleanField(default=True)  # soft delete flag
+    revision = models.PositiveBigIntegerField(
+        default=0, editable=False,
+        help_text="Bumped on every change to the project, its columns, tasks or comments"
+    )  # board version, used for ETags
+    changed_at = models.DateTimeField(
+        default=timezone.now, editable=False,
+        help_text="Time of the last change to the project, its columns, tasks or comments"
+    )  # board Last-Modified; updated_at only moves with the project's own fields
 
     # Custom managers
     objects = ActiveManager()  # only active objects
@@ -42,12 +51,55 @@ class Project(models.Model):
     def __str__(self):
         return self.name  # display name in admin
 
+    def save(self, *args, **kwargs):
+        # revision/changed_at are only changed by atomic UPDATEs (boards.versioning); never write back a stale copy
+        if not self._state.adding and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in ('revision', 'changed_at')
+            ]
+        super().save(*args, **kwargs)
+
     class Meta:
         ordering = ['name']  # order projects alphabetically
         verbose_name = "Project"
         verbose_name_plural = "Projects"
 
 
+# ---------------- ProjectAccess Model ----------------
+class ProjectAccess(models.Model):
+    """
+    Denormalized (user, project) access index, one row per user that can see a project.
+
+    Maintained from Project.owner and Project.members by boards.signals;
+    rebuild with `manage.py rebuild_project_access`.
+    """
+    OWNER = 'owner'
+    MEMBER = 'member'
+    ROLE_CHOICES = [
+        (OWNER, 'Owner'),
+        (MEMBER, 'Member'),
+    ]
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name='project_access',
+        help_text="User who can access the project"
+    )  # user with access
+    project = models.ForeignKey(
+        Project, on_delete=models.CASCADE, related_name='access',
+        help_text="Project the user can access"
+    )  # accessible project
+    role = models.CharField(max_length=10, choices=ROLE_CHOICES)  # owner wins when the owner is also a member
+
+    def __str__(self):
+        return f"{self.user} -> {self.project} ({self.role})"
+
+    class Meta:
+        unique_together = ('user', 'project')  # one row per user and project, indexed in that order
+        verbose_name = "Project access"
+        verbose_name_plural = "Project access"
+
+
 # ---------------- Column Model ----------------
 class Column(models.Model):
     project = models.ForeignKey(
@@ -73,6 +125,9 @@ class Column(models.Model):
     class Meta:
         ordering = ['order']  # order columns left to right
         unique_together = ('project', 'order')  # no duplicate column orders in same project
+        indexes = [
+            models.Index(fields=['project', 'updated_at'], name='column_project_updated_idx'),  # delta sync
+        ]
         verbose_name = "Column"
         verbose_name_plural = "Columns"
 
@@ -108,6 +163,12 @@ class Task(models.Model):
     class Meta:
         ordering = ['order']  # order tasks top to bottom
         unique_together = ('column', 'order')  # no duplicate task order in same column
+        indexes = [
+            models.Index(fields=['column', 'updated_at'], name='task_column_updated_idx'),  # delta sync
+            models.Index(
+                fields=['assigned', 'due'], name='task_active_assigned_idx', condition=models.Q(is_active=True)
+            ),  # a user's active tasks by due date
+        ]
         verbose_name = "Task"
         verbose_name_plural = "Tasks"
 
@@ -135,6 +196,12 @@ class Comment(models.Model):
 
     class Meta:
         ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['task', 'updated_at'], name='comment_task_updated_idx'),  # delta sync
+            models.Index(
+                fields=['task', 'created_at', 'id'], name='comment_active_task_idx', condition=models.Q(is_active=True)
+            ),  # active comments of a task, oldest first
+        ]
         verbose_name = "Comment"
         verbose_name_plural = "Comments"
 
@@ -154,5 +221,82 @@ class Notification(models.Model):
 
     class Meta:
         ordering = ['-created_at']  # newest notifications first
+        indexes = [
+            models.Index(fields=['user', '-created_at', '-id'], name='notification_user_recent_idx'),  # inbox, newest first
+            models.Index(
+                fields=['user', '-created_at', '-id'], name='notification_unread_idx', condition=models.Q(read=False)
+            ),  # unread inbox / badge
+        ]
         verbose_name = "Notification"
         verbose_name_plural = "Notifications"
+
+
+# ---------------- NotificationCounter Model ----------------
+class NotificationCounter(models.Model):
+    """Unread notification count per user, kept in step with Notification writes (boards.notifications)."""
+    user = models.OneToOneField(
+        User, on_delete=models.CASCADE, primary_key=True, related_name='notification_counter',
+        help_text="User the counter belongs to"
+    )  # counter owner
+    unread = models.PositiveIntegerField(default=0, help_text="Number of unread notifications")  # badge value
+    updated_at = models.DateTimeField(auto_now=True)  # timestamp when updated
+
+    def __str__(self):
+        return f"{self.user}: {self.unread} unread"
+
+    class Meta:
+        verbose_name = "Notification counter"
+        verbose_name_plural = "Notification counters"
+
+
+# ---------------- TokenVersion Model ----------------
+class TokenVersion(models.Model):
+    """Per-user JWT version; bumping it revokes every token issued before (boards.authentication)."""
+    user = models.OneToOneField(
+        User, on_delete=models.CASCADE, primary_key=True, related_name='token_version',
+        help_text="User the version belongs to"
+    )  # token owner
+    version = models.PositiveIntegerField(default=0, help_text="Current token version, carried in the 'ver' claim")  # revocation counter
+    updated_at = models.DateTimeField(auto_now=True)  # timestamp when updated
+
+    def __str__(self):
+        return f"{self.user}: v{self.version}"
+
+    class Meta:
+        verbose_name = "Token version"
+        verbose_name_plural = "Token versions"
+
+
+# ---------------- ArchivedRecord Model ----------------
+class ArchivedRecord(models.Model):
+    """Row moved out of a live table by the retention job (boards.retention), kept as JSON."""
+    model = models.CharField(max_length=50, help_text="Source model, e.g. 'task'")  # source table
+    object_id = models.BigIntegerField(help_text="Primary key in the source table")  # original id
+    payload = models.JSONField(encoder=DjangoJSONEncoder, help_text="Column values at archive time")  # row snapshot
+    archived_at = models.DateTimeField(auto_now_add=True)  # timestamp when archived
+
+    def __str__(self):
+        return f"{self.model} #{self.object_id}"
+
+    class Meta:
+        ordering = ['-archived_at']
+        indexes = [
+            models.Index(fields=['model', 'object_id'], name='archive_model_object_idx'),  # look up an archived row
+        ]
+        verbose_name = "Archived record"
+        verbose_name_plural = "Archived records"
+
+
+# ---------------- InvalidationEvent Model ----------------
+class InvalidationEvent(models.Model):
+    """Cache invalidation message for the other workers when NOTIFY is unavailable (boards.bus)."""
+    kind = models.CharField(max_length=30, help_text="Cache kind, e.g. 'users'")  # handler to run
+    keys = models.JSONField(null=True, blank=True, help_text="Keys to drop; empty means everything")  # payload
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)  # timestamp when published, for pruning
+
+    def __str__(self):
+        return f"{self.kind} #{self.pk}"
+
+    class Meta:
+        verbose_name = "Invalidation event"
+        verbose_name_plural = "Invalidation events"
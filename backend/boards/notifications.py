@@ -0,0 +1,224 @@
+import atexit  # flush what is queued when the worker exits
+import logging  # failures in the background thread
+import threading  # background flusher
+from collections import defaultdict  # grouping per recipient
+from contextlib import contextmanager  # acting_as() block
+from contextvars import ContextVar  # acting user of the current request
+
+from django.conf import settings  # BOARDS_NOTIFICATIONS
+from django.contrib.auth import get_user_model  # actor usernames
+from django.db import close_old_connections, transaction  # thread-owned DB connection, on_commit
+from django.db.models import F, Value  # atomic counter updates
+from django.db.models.functions import Greatest  # counters never go below zero
+
+from .models import Notification, NotificationCounter, ProjectAccess, Task  # recipients and targets
+
+logger = logging.getLogger(__name__)
+User = get_user_model()
+
+# ----------------------------
+# Notification fan-out
+#
+# Board events (task assigned, new comment, due date changed) are queued
+# after commit and turned into Notification rows by a background thread:
+# recipients for the whole batch are resolved in a handful of queries,
+# bursts are coalesced per (user, task, kind) ("5 new comments on X"),
+# duplicates dropped, and rows written with bulk_create.
+# ----------------------------
+_notification_settings = getattr(settings, 'BOARDS_NOTIFICATIONS', {})
+ASYNC = _notification_settings.get('ASYNC', True)  # False: deliver inline at commit (tests, scripts)
+FLUSH_SECONDS = _notification_settings.get('FLUSH_SECONDS', 2.0)  # coalescing window of the background thread
+BATCH_SIZE = _notification_settings.get('BATCH_SIZE', 500)  # rows per INSERT
+
+ASSIGNED = 'assigned'
+COMMENT = 'comment'
+DUE = 'due'
+
+
+class NotificationFanout:
+    def __init__(self, asynchronous=ASYNC, flush_seconds=FLUSH_SECONDS, batch_size=BATCH_SIZE):
+        self.asynchronous = asynchronous
+        self.flush_seconds = flush_seconds
+        self.batch_size = batch_size
+        self._pending = []  # queued event dicts
+        self._lock = threading.Lock()
+        self._wake = threading.Event()  # set when a batch is full
+        self._thread = None
+
+    # ---- producers (request threads) ----
+    def submit(self, event):
+        """Queue one board event once the current transaction commits."""
+        transaction.on_commit(lambda: self._enqueue(event))
+
+    def _enqueue(self, event):
+        with self._lock:
+            self._pending.append(event)
+            pending = len(self._pending)
+        if not self.asynchronous:
+            self.flush()
+            return
+        self._ensure_thread()
+        if pending >= self.batch_size:
+            self._wake.set()
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(target=self._run, name='notification-fanout', daemon=True)
+                    self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_seconds)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:  # keep the thread alive; the batch is dropped and logged
+                logger.exception("Notification fan-out flush failed")
+            finally:
+                close_old_connections()  # this thread owns its own DB connection
+
+    # ---- consumer ----
+    def flush(self):
+        """Turn every queued event into notifications. Returns the number of rows written."""
+        with self._lock:
+            events, self._pending = self._pending, []
+        if not events:
+            return 0
+        rows = self.build(events)
+        per_user = defaultdict(int)
+        for row in rows:
+            per_user[row.user_id] += 1
+        with transaction.atomic():  # rows and badge counts become visible together
+            Notification.objects.bulk_create(rows, batch_size=self.batch_size)
+            adjust_unread(per_user)
+        return len(rows)
+
+    def build(self, events):
+        task_ids = {event['task'] for event in events}
+        tasks = {
+            pk: (project_id, title, assigned_id, created_by_id)
+            for pk, project_id, title, assigned_id, created_by_id in Task.all_objects.filter(pk__in=task_ids)
+            .values_list('pk', 'column__project_id', 'title', 'assigned_id', 'created_by_id')
+        }
+        project_ids = {task[0] for task in tasks.values()}
+        members = defaultdict(set)
+        if any(event['kind'] == COMMENT for event in events):
+            for project_id, user_id in ProjectAccess.objects.filter(project_id__in=project_ids).values_list('project_id', 'user_id'):
+                members[project_id].add(user_id)
+        actor_ids = {event.get('actor') for event in events if event['kind'] == COMMENT} - {None}  # named in comment messages
+        usernames = dict(User.objects.filter(pk__in=actor_ids).values_list('pk', 'username')) if actor_ids else {}
+
+        # (user, task, kind) -> events, in arrival order
+        grouped = defaultdict(list)
+        for event in events:
+            task = tasks.get(event['task'])
+            if task is None:
+                continue  # task hard-deleted meanwhile
+            project_id, _, assigned_id, created_by_id = task
+            if event['kind'] == COMMENT:
+                recipients = members[project_id]
+            elif event['kind'] == ASSIGNED:
+                recipients = {event['assignee']}  # assignee at the time, the task may be reassigned again before the flush
+            else:  # DUE
+                recipients = {assigned_id, created_by_id}
+            for user_id in recipients - {None, event.get('actor')}:
+                grouped[(user_id, event['task'], event['kind'])].append(event)
+
+        rows = []
+        seen = set()
+        for (user_id, task_id, kind), burst in grouped.items():
+            message = self.message(kind, tasks[task_id][1], burst, usernames)
+            if (user_id, message) in seen:
+                continue
+            seen.add((user_id, message))
+            rows.append(Notification(user_id=user_id, message=message))
+        return rows
+
+    @staticmethod
+    def message(kind, title, burst, usernames):
+        if kind == COMMENT:
+            if len(burst) > 1:
+                return f'{len(burst)} new comments on "{title}"'
+            return f'{usernames.get(burst[0].get("actor"), "Someone")} commented on "{title}"'
+        if kind == ASSIGNED:
+            return f'You were assigned to "{title}"'
+        due = burst[-1]['due']  # latest value of the burst wins
+        return f'Due date of "{title}" changed to {due}' if due else f'Due date of "{title}" was removed'
+
+
+# ----------------------------
+# Unread counters
+#
+# NotificationCounter.unread changes in the same transaction as the
+# notification rows: +n for bulk fan-out inserts, +/-1 from the
+# Notification signals, and an exact recount on bulk mark-read.
+# ----------------------------
+def adjust_unread(deltas):
+    """Apply {user_id: delta} to the unread counters with one UPDATE per distinct delta."""
+    deltas = {user_id: delta for user_id, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    NotificationCounter.objects.bulk_create(
+        [NotificationCounter(user_id=user_id) for user_id in deltas], ignore_conflicts=True
+    )  # make sure every counter row exists
+    by_delta = defaultdict(list)
+    for user_id, delta in deltas.items():
+        by_delta[delta].append(user_id)
+    for delta, user_ids in by_delta.items():
+        NotificationCounter.objects.filter(user_id__in=user_ids).update(unread=Greatest(F('unread') + delta, Value(0)))
+
+
+def unread_count(user):
+    return NotificationCounter.objects.filter(user=user).values_list('unread', flat=True).first() or 0
+
+
+@transaction.atomic
+def mark_read(user, up_to=None):
+    """Mark all (or up to id `up_to`) unread notifications of user as read. Returns (marked, unread)."""
+    unread = Notification.objects.filter(user=user, read=False)
+    marked = (unread.filter(pk__lte=up_to) if up_to is not None else unread).update(read=True)
+    remaining = unread.count() if up_to is not None else 0  # recount: also repairs any drift
+    NotificationCounter.objects.update_or_create(user=user, defaults={'unread': remaining})
+    return marked, remaining
+
+
+fanout = NotificationFanout()
+atexit.register(fanout.flush)
+
+
+# ----------------------------
+# Entry points used by boards.signals
+#
+# `actor` is the user who made the change; they are never notified of it.
+# Views run their saves inside acting_as(request.user.pk) so the model
+# signals can tell who that is.
+# ----------------------------
+_actor = ContextVar('boards_notification_actor', default=None)
+
+
+@contextmanager
+def acting_as(user_id):
+    """Attribute task changes saved inside the block to user_id."""
+    token = _actor.set(user_id)
+    try:
+        yield
+    finally:
+        _actor.reset(token)
+
+
+def current_actor():
+    return _actor.get()
+
+
+def task_assigned(task, actor=None):
+    fanout.submit({'kind': ASSIGNED, 'task': task.pk, 'assignee': task.assigned_id, 'actor': actor})
+
+
+def task_due_changed(task, actor=None):
+    fanout.submit({'kind': DUE, 'task': task.pk, 'due': task.due.isoformat() if task.due else None, 'actor': actor})
+
+
+def comment_created(comment):
+    fanout.submit({'kind': COMMENT, 'task': comment.task_id, 'actor': comment.author_id})
@@ -0,0 +1,147 @@
+from django.db import transaction  # atomic blocks for moves and rebalances
+from django.db.models import Case, IntegerField, Max, Value, When  # set-based renumbering
+from django.utils import timezone  # bump updated_at on renumbered rows
+
+from . import events  # renumbering bypasses save() signals: one event for the scope
+from .versioning import touch_projects  # renumbering bypasses save() signals
+
+# ----------------------------
+# Sparse ordering for Task.order (per column) and Column.order (per project)
+#
+# Rows are spaced ORDER_GAP apart, so inserting between two neighbours only
+# writes the moved row (it takes the midpoint). When a gap is used up the
+# whole scope is renumbered once in bulk with the row already in its new place.
+# ----------------------------
+ORDER_GAP = 1024  # spacing between neighbours after a rebalance
+ORDER_MAX = 2 ** 30  # highest value handed out; the space above it is used to park rows while rebalancing
+
+# Scope (parent foreign key) for each ordered model
+ORDER_SCOPES = {
+    'Task': 'column',
+    'Column': 'project',
+}
+
+# Project lookup from a scope id, used to bump the board revision
+PROJECT_LOOKUPS = {
+    'Task': 'columns',
+    'Column': 'pk',
+}
+
+
+def _scope_field(model):
+    return ORDER_SCOPES[model.__name__]
+
+
+def _project_id(model, scope_id):
+    # project of a scope, for change events
+    if _scope_field(model) == 'project':
+        return scope_id
+    scope_model = model._meta.get_field(_scope_field(model)).related_model
+    return scope_model.all_objects.filter(pk=scope_id).values_list('project_id', flat=True).first()
+
+
+def _siblings(model, scope_id):
+    # all_objects: soft-deleted rows still hold their slot in the unique (scope, order) constraint
+    return model.all_objects.filter(**{f'{_scope_field(model)}_id': scope_id})
+
+
+def lock_scope(model, scope_id):
+    """Serialize writers of one column/project so concurrent moves can't pick the same slot."""
+    scope_model = model._meta.get_field(_scope_field(model)).related_model
+    scope_model.all_objects.select_for_update().filter(pk=scope_id).first()
+
+
+def next_order(model, scope_id):
+    """Order value that appends a row at the end of its scope."""
+    last = _siblings(model, scope_id).aggregate(last=Max('order'))['last']
+    if last is None:
+        return ORDER_GAP
+    if last + ORDER_GAP > ORDER_MAX:
+        rebalance(model, scope_id)
+        return next_order(model, scope_id)
+    return last + ORDER_GAP
+
+
+def rebalance(model, scope_id, ordered_ids=None):
+    """
+    Renumber every row of a scope to ORDER_GAP, 2*ORDER_GAP, ... in two UPDATEs.
+
+    ordered_ids optionally gives the new sequence and may name rows that
+    currently live in another scope (they are moved in). Rows of the scope
+    that are not listed keep their relative order after the listed ones.
+    The first UPDATE parks every row above both the old and the new values,
+    so the unique (scope, order) constraint holds after each row of the
+    second one.
+    """
+    current = list(_siblings(model, scope_id).order_by('order', 'id').values_list('id', 'order'))
+    listed = list(ordered_ids or [])
+    seen = set(listed)
+    sequence = listed + [pk for pk, _ in current if pk not in seen]
+    if not sequence:
+        return
+    parking = max([order for _, order in current] + [len(sequence) * ORDER_GAP, ORDER_MAX]) + 1
+    rows = model.all_objects.filter(pk__in=sequence)
+    rows.update(**{f'{_scope_field(model)}_id': scope_id}, order=Case(
+        *[When(pk=pk, then=Value(parking + i)) for i, pk in enumerate(sequence)],
+        output_field=IntegerField(),
+    ))
+    rows.update(updated_at=timezone.now(), order=Case(
+        *[When(pk=pk, then=Value((i + 1) * ORDER_GAP)) for i, pk in enumerate(sequence)],
+        output_field=IntegerField(),
+    ))
+    touch_projects(**{PROJECT_LOOKUPS[model.__name__]: scope_id})
+    if events.broker.is_listening():
+        orders = [(pk, (i + 1) * ORDER_GAP) for i, pk in enumerate(sequence)]
+        events.emit_reordered(model.__name__.lower(), _project_id(model, scope_id), _scope_field(model), scope_id, orders)
+
+
+def _free_slot(model, scope_id, low, high, exclude_pk):
+    # largest free gap between two active neighbours, skipping soft-deleted rows parked in between
+    taken = sorted(
+        _siblings(model, scope_id)
+        .filter(order__gt=low, order__lt=high)
+        .exclude(pk=exclude_pk)
+        .values_list('order', flat=True)
+    )
+    bounds = [low, *taken, high]
+    gap, start = max((bounds[i + 1] - bounds[i], bounds[i]) for i in range(len(bounds) - 1))
+    return start + gap // 2 if gap > 1 else None
+
+
+def move(instance, scope_id, position):
+    """
+    Place instance at index `position` among the active rows of scope_id.
+
+    Usually writes a single row. Falls back to one bulk rebalance of the
+    scope when the neighbours have no integer left between them.
+    """
+    model = type(instance)
+    scope_attr = f'{_scope_field(model)}_id'
+    with transaction.atomic():
+        lock_scope(model, scope_id)
+        active = model.objects.filter(**{scope_attr: scope_id}).exclude(pk=instance.pk).order_by('order', 'id')
+        position = max(0, position)
+        neighbours = list(active.values_list('order', flat=True)[max(position - 1, 0):position + 1])
+        if position == 0:
+            low, high = -1, neighbours[0] if neighbours else None
+        else:
+            low = neighbours[0] if neighbours else None
+            high = neighbours[1] if len(neighbours) > 1 else None
+        if low is None:  # position past the end
+            low = active.aggregate(last=Max('order'))['last'] or -1
+        if high is None:  # appending: step a full gap past everything in the scope
+            order = max(next_order(model, scope_id), low + ORDER_GAP)
+            slot = order if order <= ORDER_MAX else None
+        else:
+            slot = _free_slot(model, scope_id, low, high, instance.pk)
+        if slot is None:  # no room left between the neighbours: renumber the scope with the row in place
+            ids = list(active.values_list('pk', flat=True))
+            ids.insert(min(position, len(ids)), instance.pk)
+            rebalance(model, scope_id, ids)
+            setattr(instance, scope_attr, scope_id)
+            instance.order = model.all_objects.values_list('order', flat=True).get(pk=instance.pk)
+            return instance
+        setattr(instance, scope_attr, scope_id)
+        instance.order = slot
+        instance.save(update_fields=[scope_attr.removesuffix('_id'), 'order', 'updated_at'])
+    return instance
@@ -0,0 +1,151 @@
+import base64  # opaque cursor encoding
+import json  # cursor payload
+
+from django.core.exceptions import ValidationError  # to_python() on a tampered value
+from django.db.models import Q  # keyset predicates
+from rest_framework.exceptions import NotFound  # bad cursor -> 404 like DRF's CursorPagination
+from rest_framework.pagination import BasePagination  # DRF pagination interface
+from rest_framework.response import Response  # paginated response
+from rest_framework.settings import api_settings  # default PAGE_SIZE
+from rest_framework.utils.urls import replace_query_param  # next/previous links
+
+
+# ----------------------------
+# Keyset (cursor) pagination
+#
+# Pages are selected with a WHERE on the ordering key of the last row seen
+# instead of OFFSET, so page N costs the same as page 1. The ordering must
+# end with `id` so the key is unique and ties never repeat or skip rows.
+# No COUNT(*) is run unless the client passes ?count=true.
+# ----------------------------
+class KeysetPagination(BasePagination):
+    ordering = ('id',)  # overridden per viewset; last field must be unique
+    page_size = api_settings.PAGE_SIZE  # default rows per page
+    max_page_size = 100  # cap for ?page_size=
+    page_size_query_param = 'page_size'
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.model = queryset.model
+        limit = self.get_page_size(request)
+        position, reverse = self.decode_cursor(request)
+
+        ordering = self._inverted() if reverse else self.ordering
+        rows = queryset.order_by(*ordering)
+        if position is not None:
+            rows = rows.filter(self._after(ordering, position))
+        rows = list(rows[:limit + 1])
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if reverse:
+            rows.reverse()
+
+        has_next = True if reverse else has_more
+        has_previous = has_more if reverse else position is not None
+        self.next_position = self._key(rows[-1]) if rows and has_next else None
+        self.previous_position = self._key(rows[0]) if rows and has_previous else None
+        self.count = queryset.count() if self._wants_count(request) else None
+        return rows
+
+    def get_paginated_response(self, data):
+        payload = {}
+        if self.count is not None:
+            payload['count'] = self.count
+        payload['next'] = self.get_next_link()
+        payload['previous'] = self.get_previous_link()
+        payload['results'] = data
+        return Response(payload)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'count': {'type': 'integer', 'description': 'Only present with ?count=true'},
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        return self.encode_cursor(self.next_position, reverse=False)
+
+    def get_previous_link(self):
+        if self.previous_position is None:
+            return None
+        return self.encode_cursor(self.previous_position, reverse=True)
+
+    # ---- cursor helpers ----
+    def encode_cursor(self, position, reverse):
+        raw = json.dumps({'p': position, 'r': int(reverse)}, separators=(',', ':'))
+        cursor = base64.urlsafe_b64encode(raw.encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request):
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None, False
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            position = [
+                self.model._meta.get_field(name.lstrip('-')).to_python(value)
+                for name, value in zip(self.ordering, data['p'], strict=True)
+            ]
+            return position, bool(data['r'])
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    @property
+    def key_fields(self):
+        # columns a cursor is built from: the view must load them even when ?fields= leaves them out
+        return [name.lstrip('-') for name in self.ordering]
+
+    def _key(self, row):
+        # rows are model instances, or dicts on values() based fast paths
+        values = [row[name] if isinstance(row, dict) else getattr(row, name) for name in self.key_fields]
+        return [value.isoformat() if hasattr(value, 'isoformat') else value for value in values]
+
+    def _inverted(self):
+        return tuple(name[1:] if name.startswith('-') else f'-{name}' for name in self.ordering)
+
+    @staticmethod
+    def _after(ordering, position):
+        # (a, b, c) > (x, y, z) expanded for mixed directions:
+        # a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z)
+        condition = Q()
+        for i, name in enumerate(ordering):
+            field = name.lstrip('-')
+            step = Q(**{f'{field}__lt' if name.startswith('-') else f'{field}__gt': position[i]})
+            for prior, value in zip(ordering[:i], position[:i]):
+                step &= Q(**{prior.lstrip('-'): value})
+            condition |= step
+        return condition
+
+    def _wants_count(self, request):
+        return request.query_params.get(self.count_query_param, '').lower() in ('1', 'true', 'yes')
+
+
+class TaskPagination(KeysetPagination):
+    ordering = ('order', 'id')  # Task.Meta.ordering, tie-broken on id
+
+
+class CommentPagination(KeysetPagination):
+    ordering = ('created_at', 'id')  # Comment.Meta.ordering, tie-broken on id
+
+
+class NotificationPagination(KeysetPagination):
+    ordering = ('-created_at', '-id')  # newest first, tie-broken on id
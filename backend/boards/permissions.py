@@ -1,14 +1,17 @@
 from rest_framework import permissions  # import DRF permission base class
 
+from .access import can_access_project  # memoized project membership check
+
+
 # ----------------------------
 # Allow project members or owner to access an object (Column or Task)
 # ----------------------------
 class IsProjectMemberOrOwner(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
-        # Get the related project (obj can be Column or Task)
-        project = getattr(obj, 'project', None) or (getattr(obj, 'column', None) and obj.column.project)
+        # Get the related project id (obj can be Column or Task; viewsets select_related the column)
+        project_id = getattr(obj, 'project_id', None) or (getattr(obj, 'column', None) and obj.column.project_id)
         # Allow if user is in members or is the owner
-        return project and (request.user in project.members.all() or request.user == project.owner)
+        return can_access_project(request, project_id)
 
 
 # ----------------------------
@@ -16,8 +19,10 @@ class IsProjectMemberOrOwner(permissions.BasePermission):
 # ----------------------------
 class IsProjectOwner(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
-        # obj is a Project instance
-        return request.user == getattr(obj, 'owner', None)
+        # obj is a Project instance; members may read it (the viewset queryset already limits reads)
+        if request.method in permissions.SAFE_METHODS:
+            return True
+        return request.user.pk == getattr(obj, 'owner_id', None)
 
 
 # ----------------------------
@@ -25,9 +30,8 @@ class IsProjectOwner(permissions.BasePermission):
 # ----------------------------
 class IsCommentAuthorOrProjectMember(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
-        # obj is a Comment instance
-        project = obj.task.project
-        return request.user == obj.author or request.user in project.members.all() or request.user == project.owner
+        # obj is a Comment instance (viewset select_related task__column)
+        return request.user.pk == obj.author_id or can_access_project(request, obj.task.column.project_id)
 
 
 # ----------------------------
@@ -36,4 +40,4 @@ class IsCommentAuthorOrProjectMember(permissions.BasePermission):
 class IsNotificationUser(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         # obj is a Notification instance
-        return request.user == obj.user
+        return request.user.pk == obj.user_id
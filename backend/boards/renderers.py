@@ -0,0 +1,52 @@
+from rest_framework.exceptions import ParseError  # same error shape as DRF's JSONParser
+from rest_framework.parsers import JSONParser  # stdlib fallback
+from rest_framework.renderers import JSONRenderer  # stdlib fallback
+from rest_framework.utils import encoders  # DRF's encoding rules for everything orjson does not know
+
+from . import timing  # 'render' span of the Server-Timing header
+
+try:
+    import orjson  # optional: several times faster dumps/loads (manage.py bench_renderers)
+except ImportError:  # pragma: no cover - the classes below then behave exactly like DRF's
+    orjson = None
+
+# ----------------------------
+# orjson-backed JSON renderer and parser
+#
+# Output is byte-identical to DRF's JSONRenderer with the default settings
+# (UNICODE_JSON, COMPACT_JSON): UTF-8 without escaping, no whitespace,
+# datetimes as ISO 8601 with "Z" for UTC, U+2028/U+2029 escaped. Types
+# orjson does not handle natively (Decimal, lazy strings, querysets, ...)
+# go through DRF's JSONEncoder.default. Indented output (browsable API,
+# `Accept: application/json; indent=4`) and a missing orjson fall back
+# to the stock classes.
+# ----------------------------
+if orjson is not None:
+    ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+    _encoder_default = encoders.JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with timing.span('render'):
+            return self._render(data, accepted_media_type, renderer_context)
+
+    def _render(self, data, accepted_media_type, renderer_context):
+        if orjson is None or data is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        ret = orjson.dumps(data, default=_encoder_default, option=ORJSON_OPTIONS)
+        if b'\xe2\x80' in ret:  # same JavaScript-safe escaping as JSONRenderer
+            ret = ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
+        return ret
+
+
+class ORJSONParser(JSONParser):
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())  # bytes in, UTF-8 only (RFC 8259)
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
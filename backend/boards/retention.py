@@ -0,0 +1,124 @@
+import logging  # one structured line per run
+import time  # time budget
+from datetime import timedelta  # policy ages
+
+from django.conf import settings  # BOARDS_RETENTION
+from django.db import transaction  # one transaction per batch
+from django.utils import timezone  # cutoffs
+
+from .models import ArchivedRecord, Column, Comment, Notification, Task  # live and archive tables
+from .signals import quiet  # purging tombstones is not a board change
+
+logger = logging.getLogger(__name__)
+
+# ----------------------------
+# Retention policies
+#
+# Each policy selects rows that no longer belong in the hot tables:
+# read notifications past their age, and soft-deleted columns, tasks and
+# comments that have been inactive for a while. Rows are archived (copied
+# to ArchivedRecord as JSON, then deleted) or simply deleted, in short
+# batches so the job never holds long locks, and it stops once its time
+# budget is spent. Children that would be removed by CASCADE are archived
+# together with their parent.
+# ----------------------------
+DEFAULT_POLICIES = {
+    'notification': {'days': 90, 'action': 'archive'},
+    'comment': {'days': 180, 'action': 'archive'},
+    'task': {'days': 180, 'action': 'archive'},
+    'column': {'days': 365, 'action': 'archive'},
+}
+ACTIONS = ('archive', 'delete')
+
+
+def get_policies():
+    configured = getattr(settings, 'BOARDS_RETENTION', {})
+    policies = {}
+    for name, default in DEFAULT_POLICIES.items():
+        policy = {**default, **configured.get(name, {})}
+        if policy['action'] not in ACTIONS:
+            raise ValueError(f"Unknown retention action {policy['action']!r} for {name}")
+        if policy.get('days') is not None:  # days=None disables the policy
+            policies[name] = policy
+    return policies
+
+
+def _candidates(name, cutoff):
+    # rows eligible under the policy `name`
+    if name == 'notification':
+        return Notification.objects.filter(read=True, created_at__lt=cutoff)
+    if name == 'comment':
+        return Comment.all_objects.filter(is_active=False, updated_at__lt=cutoff)
+    if name == 'task':
+        return Task.all_objects.filter(is_active=False, updated_at__lt=cutoff)
+    # columns still holding live tasks are kept: those tasks are visible through /api/tasks/
+    return Column.all_objects.filter(is_active=False, updated_at__lt=cutoff).exclude(tasks__is_active=True)
+
+
+def _archive(model_name, queryset):
+    rows = list(queryset.values())
+    ArchivedRecord.objects.bulk_create(
+        [ArchivedRecord(model=model_name, object_id=row['id'], payload=row) for row in rows]
+    )
+    return len(rows)
+
+
+MODELS = {'notification': Notification, 'comment': Comment, 'task': Task, 'column': Column}
+
+
+def _manager(name):
+    model = MODELS[name]
+    return getattr(model, 'all_objects', model.objects)  # soft-deleted rows are the point
+
+
+def _purge_batch(name, ids, action):
+    """Archive (optionally) and delete one batch; returns {model: rows} including cascaded children."""
+    if name == 'column':
+        task_ids = list(Task.all_objects.filter(column_id__in=ids).values_list('pk', flat=True))
+        batch = [('comment', Comment.all_objects.filter(task_id__in=task_ids)), ('task', Task.all_objects.filter(pk__in=task_ids))]
+    elif name == 'task':
+        batch = [('comment', Comment.all_objects.filter(task_id__in=ids))]
+    else:
+        batch = []
+    parents = _manager(name).filter(pk__in=ids)
+    batch.append((name, parents))
+    moved = {}
+    for model_name, rows in batch:  # children first, the parent's DELETE cascades to them
+        count = _archive(model_name, rows) if action == 'archive' else rows.count()
+        moved[model_name] = moved.get(model_name, 0) + count
+    parents.delete()
+    return moved
+
+
+def apply_retention(max_seconds=60, batch_size=1000, dry_run=False, only=None):
+    """
+    Run every enabled policy until done or until max_seconds elapse.
+
+    Returns metrics: {policy: {'eligible' | 'archived' | 'deleted': n, 'batches': n}}.
+    """
+    deadline = time.monotonic() + max_seconds
+    now = timezone.now()
+    metrics = {}
+    for name, policy in get_policies().items():
+        if only and name not in only:
+            continue
+        candidates = _candidates(name, now - timedelta(days=policy['days']))
+        stats = metrics.setdefault(name, {'batches': 0})
+        if dry_run:
+            stats['eligible'] = candidates.count()
+            continue
+        key = 'archived' if policy['action'] == 'archive' else 'deleted'
+        while time.monotonic() < deadline:
+            ids = list(candidates.order_by('pk').values_list('pk', flat=True).distinct()[:batch_size])
+            if not ids:
+                break
+            with transaction.atomic(), quiet():
+                moved = _purge_batch(name, ids, policy['action'])
+            stats['batches'] += 1
+            for model_name, count in moved.items():
+                bucket = metrics.setdefault(model_name, {'batches': 0})
+                bucket[key] = bucket.get(key, 0) + count
+    metrics['elapsed_seconds'] = round(max_seconds - max(deadline - time.monotonic(), 0), 3)
+    metrics['finished'] = time.monotonic() < deadline
+    logger.info("boards retention run", extra={'retention': metrics})
+    return metrics
@@ -0,0 +1,215 @@
+import re  # query tokenizing for FTS5
+
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connection, connections  # vendor dispatch and raw queries
+from django.db.migrations.recorder import MigrationRecorder  # is the search migration applied?
+from django.db.models import Q  # fallback matching
+
+from .models import Comment, Task  # searchable rows
+
+# ----------------------------
+# Full-text search over Task.title, Task.description and Comment.text
+#
+# PostgreSQL: a generated (STORED) tsvector column on boards_task and
+# boards_comment, weighted title > description > comment text, with a GIN
+# index each; the database keeps it current on every INSERT/UPDATE.
+# SQLite (local and test runs): one FTS5 table fed by triggers, rowid
+# 2*id for tasks and 2*id+1 for comments so updates hit a single row.
+# SQLite drops a table's triggers when a migration rebuilds it, so
+# install() runs again after every migrate (post_migrate, see apps.py).
+# Anything else, or SQLite built without FTS5, falls back to icontains.
+# Hits are restricted to the user's projects in the same query, then
+# ranked and cut to `limit` by the database.
+# ----------------------------
+SEARCH_LIMIT = 20  # default hits per query
+SEARCH_MAX_LIMIT = 50  # cap for ?limit=
+FTS_TABLE = 'boards_search'
+
+POSTGRES_INSTALL = [
+    """ALTER TABLE boards_task ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+           setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+           setweight(to_tsvector('english', coalesce(description, '')), 'B')
+       ) STORED""",
+    "CREATE INDEX IF NOT EXISTS task_search_idx ON boards_task USING GIN (search_vector)",
+    """ALTER TABLE boards_comment ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+           setweight(to_tsvector('english', coalesce(text, '')), 'C')
+       ) STORED""",
+    "CREATE INDEX IF NOT EXISTS comment_search_idx ON boards_comment USING GIN (search_vector)",
+]
+POSTGRES_UNINSTALL = [
+    "DROP INDEX IF EXISTS task_search_idx",
+    "ALTER TABLE boards_task DROP COLUMN IF EXISTS search_vector",
+    "DROP INDEX IF EXISTS comment_search_idx",
+    "ALTER TABLE boards_comment DROP COLUMN IF EXISTS search_vector",
+]
+
+SQLITE_INSTALL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(title, body, tokenize='porter unicode61')",
+    f"""CREATE TRIGGER IF NOT EXISTS boards_task_search_ins AFTER INSERT ON boards_task BEGIN
+           INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (new.id * 2, new.title, coalesce(new.description, ''));
+       END""",
+    f"""CREATE TRIGGER IF NOT EXISTS boards_task_search_upd AFTER UPDATE OF title, description ON boards_task BEGIN
+           DELETE FROM {FTS_TABLE} WHERE rowid = old.id * 2;
+           INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (new.id * 2, new.title, coalesce(new.description, ''));
+       END""",
+    f"""CREATE TRIGGER IF NOT EXISTS boards_task_search_del AFTER DELETE ON boards_task BEGIN
+           DELETE FROM {FTS_TABLE} WHERE rowid = old.id * 2;
+       END""",
+    f"""CREATE TRIGGER IF NOT EXISTS boards_comment_search_ins AFTER INSERT ON boards_comment BEGIN
+           INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (new.id * 2 + 1, '', new.text);
+       END""",
+    f"""CREATE TRIGGER IF NOT EXISTS boards_comment_search_upd AFTER UPDATE OF text ON boards_comment BEGIN
+           DELETE FROM {FTS_TABLE} WHERE rowid = old.id * 2 + 1;
+           INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (new.id * 2 + 1, '', new.text);
+       END""",
+    f"""CREATE TRIGGER IF NOT EXISTS boards_comment_search_del AFTER DELETE ON boards_comment BEGIN
+           DELETE FROM {FTS_TABLE} WHERE rowid = old.id * 2 + 1;
+       END""",
+    # (re)fill from the current rows; also repairs the table after SQLite rebuilt boards_task/boards_comment
+    f"DELETE FROM {FTS_TABLE}",
+    f"INSERT INTO {FTS_TABLE}(rowid, title, body) SELECT id * 2, title, coalesce(description, '') FROM boards_task",
+    f"INSERT INTO {FTS_TABLE}(rowid, title, body) SELECT id * 2 + 1, '', text FROM boards_comment",
+]
+SQLITE_UNINSTALL = [
+    "DROP TRIGGER IF EXISTS boards_task_search_ins",
+    "DROP TRIGGER IF EXISTS boards_task_search_upd",
+    "DROP TRIGGER IF EXISTS boards_task_search_del",
+    "DROP TRIGGER IF EXISTS boards_comment_search_ins",
+    "DROP TRIGGER IF EXISTS boards_comment_search_upd",
+    "DROP TRIGGER IF EXISTS boards_comment_search_del",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+# Ranked hits readable by user_id. Each returns (kind, id, task_id, project_id, rank), best first.
+POSTGRES_QUERY = """
+    WITH q AS (SELECT websearch_to_tsquery('english', %(q)s) AS query)
+    (SELECT 'task', t.id, t.id, c.project_id, ts_rank(t.search_vector, q.query) AS rank
+       FROM q, boards_task t
+       JOIN boards_column c ON c.id = t.column_id
+       JOIN boards_project p ON p.id = c.project_id
+       JOIN boards_projectaccess a ON a.project_id = p.id AND a.user_id = %(user)s
+      WHERE t.search_vector @@ q.query AND t.is_active AND c.is_active AND p.is_active)
+    UNION ALL
+    (SELECT 'comment', m.id, t.id, c.project_id, ts_rank(m.search_vector, q.query) AS rank
+       FROM q, boards_comment m
+       JOIN boards_task t ON t.id = m.task_id
+       JOIN boards_column c ON c.id = t.column_id
+       JOIN boards_project p ON p.id = c.project_id
+       JOIN boards_projectaccess a ON a.project_id = p.id AND a.user_id = %(user)s
+      WHERE m.search_vector @@ q.query AND m.is_active AND t.is_active AND c.is_active AND p.is_active)
+    ORDER BY rank DESC, 2 DESC
+    LIMIT %(limit)s
+"""
+SQLITE_QUERY = f"""
+    SELECT CASE {FTS_TABLE}.rowid %% 2 WHEN 0 THEN 'task' ELSE 'comment' END, {FTS_TABLE}.rowid / 2, t.id, c.project_id,
+           -bm25({FTS_TABLE}, 4.0, 1.0) AS rank
+      FROM {FTS_TABLE}
+      LEFT JOIN boards_comment m ON {FTS_TABLE}.rowid %% 2 = 1 AND m.id = {FTS_TABLE}.rowid / 2
+      JOIN boards_task t ON t.id = CASE {FTS_TABLE}.rowid %% 2 WHEN 0 THEN {FTS_TABLE}.rowid / 2 ELSE m.task_id END
+      JOIN boards_column c ON c.id = t.column_id
+      JOIN boards_project p ON p.id = c.project_id
+      JOIN boards_projectaccess a ON a.project_id = p.id AND a.user_id = %(user)s
+     WHERE {FTS_TABLE} MATCH %(q)s AND t.is_active AND c.is_active AND p.is_active
+       AND ({FTS_TABLE}.rowid %% 2 = 0 OR m.is_active)
+     ORDER BY rank DESC, 2 DESC
+     LIMIT %(limit)s
+"""
+
+
+def install(conn=connection):
+    """Create the search columns/indexes (PostgreSQL) or FTS5 table and triggers (SQLite)."""
+    statements = {'postgresql': POSTGRES_INSTALL, 'sqlite': SQLITE_INSTALL}.get(conn.vendor, [])
+    with conn.cursor() as cursor:
+        for statement in statements:
+            try:
+                cursor.execute(statement)
+            except DatabaseError:
+                if conn.vendor == 'sqlite':  # built without FTS5: search falls back to icontains
+                    return
+                raise
+
+
+def reinstall(sender, using=DEFAULT_DB_ALIAS, **kwargs):
+    """post_migrate handler: recreate triggers a later migration dropped and refill the index."""
+    conn = connections[using]
+    if ('boards', '0008_search') not in MigrationRecorder(conn).applied_migrations():
+        return  # not installed yet, or migrated back below it
+    install(conn)
+
+
+def uninstall(conn=connection):
+    statements = {'postgresql': POSTGRES_UNINSTALL, 'sqlite': SQLITE_UNINSTALL}.get(conn.vendor, [])
+    with conn.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def _fts_available():
+    if connection.vendor == 'postgresql':
+        return True
+    if connection.vendor != 'sqlite':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS_TABLE])
+        return cursor.fetchone() is not None
+
+
+def _fts5_query(text):
+    # every word must match, the last one as a prefix (search-as-you-type); quoting disables FTS5 operators
+    words = re.findall(r'\w+', text)
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def _fallback(user, text, limit):
+    # unindexed icontains, for databases without a full-text index
+    tasks = Task.objects.filter(
+        column__is_active=True, column__project__is_active=True, column__project__access__user=user,
+    ).filter(Q(title__icontains=text) | Q(description__icontains=text))
+    comments = Comment.objects.filter(
+        task__is_active=True, task__column__is_active=True, task__column__project__is_active=True,
+        task__column__project__access__user=user, text__icontains=text,
+    )
+    hits = [('task', pk, pk, project_id, 0.0)
+            for pk, project_id in tasks.order_by('-id').values_list('pk', 'column__project_id')[:limit]]
+    hits += [('comment', pk, task_id, project_id, 0.0)
+             for pk, task_id, project_id in comments.order_by('-id').values_list('pk', 'task_id', 'task__column__project_id')[:limit]]
+    return hits[:limit]
+
+
+def search(user, text, limit=SEARCH_LIMIT):
+    """Ranked hits for `text` in the projects `user` can access, as dicts ready to serialize."""
+    text = (text or '').strip()
+    if not text:
+        return []
+    limit = min(max(limit, 1), SEARCH_MAX_LIMIT)
+    if not _fts_available():
+        rows = _fallback(user, text, limit)
+    else:
+        if connection.vendor == 'postgresql':
+            sql, query = POSTGRES_QUERY, text
+        else:
+            sql, query = SQLITE_QUERY, _fts5_query(text)
+            if query is None:
+                return []
+        with connection.cursor() as cursor:
+            cursor.execute(sql, {'q': query, 'user': user.pk, 'limit': limit})
+            rows = cursor.fetchall()
+
+    # one query per kind for the display fields
+    tasks = Task.objects.in_bulk({task_id for _, _, task_id, _, _ in rows})
+    comments = Comment.objects.in_bulk({pk for kind, pk, _, _, _ in rows if kind == 'comment'})
+    hits = []
+    for kind, pk, task_id, project_id, rank in rows:
+        task = tasks.get(task_id)
+        if task is None:
+            continue
+        hit = {'type': kind, 'id': pk, 'task': task_id, 'project': project_id, 'title': task.title, 'rank': round(float(rank), 6)}
+        if kind == 'comment':
+            hit['text'] = comments[pk].text if pk in comments else ''
+        else:
+            hit['text'] = task.description or ''
+        hits.append(hit)
+    return hits
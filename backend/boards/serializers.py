@@ -1,67 +1,348 @@
 from rest_framework import serializers  # import DRF serializers
 from rest_framework.validators import UniqueValidator  # validate uniqueness
 from .models import Project, Column, Task, Comment, Notification  # import project models
+from .ordering import ORDER_MAX  # upper bound for client supplied order values
+from . import timing  # 'serialize' span of the Server-Timing header
 from django.contrib.auth import get_user_model  # get custom user model
+from functools import lru_cache  # one LeanRows plan per serializer class
+from django.core.exceptions import FieldDoesNotExist  # fields that are not model fields
+from django.db.models import F, Prefetch  # joined columns for LeanRows, narrowed prefetches
 
 User = get_user_model()  # get the active user model
 
+
+# ----------------------------
+# Optional, sparse `order` for Column and Task
+# ----------------------------
+class SparseOrderMixin:
+    order_scope = None  # foreign key that groups siblings ('project' for columns, 'column' for tasks)
+
+    def validate(self, attrs):
+        # order may be omitted (the view appends the row); an explicit one must still be free in its scope
+        if 'order' in attrs or self.order_scope in attrs:
+            scope = attrs.get(self.order_scope, getattr(self.instance, self.order_scope, None))
+            order = attrs.get('order', getattr(self.instance, 'order', None))
+            taken = self.Meta.model.all_objects.filter(**{self.order_scope: scope, 'order': order})
+            if self.instance is not None:
+                taken = taken.exclude(pk=self.instance.pk)
+            if order is not None and taken.exists():
+                raise serializers.ValidationError({'order': f'This position is already taken in this {self.order_scope}.'})
+        return super().validate(attrs)
+
+
+# ----------------------------
+# Sparse fieldsets (?fields=) and expansion (?expand=)
+#
+# ?fields=id,name,columns.id,columns.name keeps only the listed fields,
+# dotted names reach into nested serializers. ?expand=assigned,comments
+# swaps a field for the nested serializer named in `expandable_fields`.
+# The top-level serializer reads both from the request, nested ones get
+# their branch from the parent. The viewsets shape their queryset from
+# the resulting fields (see sparse_queryset) so unused columns and
+# relations are never loaded.
+# ----------------------------
+def parse_field_tree(value):
+    """'id,columns.name,columns.id' -> {'id': {}, 'columns': {'name': {}, 'id': {}}}"""
+    tree = {}
+    for path in (value or '').split(','):
+        node = tree
+        for part in filter(None, (part.strip() for part in path.split('.'))):
+            node = node.setdefault(part, {})
+    return tree
+
+
+class DynamicFieldsMixin:
+    expandable_fields = {}  # name -> (serializer class name, kwargs), used when the name is in ?expand=
+
+    def to_representation(self, instance):
+        recorder = timing.current()
+        if recorder is None:  # not a timed request
+            return super().to_representation(instance)
+        with recorder.span('serialize'):
+            return super().to_representation(instance)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        selected, expanded = self._field_trees()
+        for name, (serializer_name, kwargs) in self.expandable_fields.items():
+            if name in expanded:
+                fields[name] = globals()[serializer_name](read_only=True, **kwargs)
+        if selected:
+            fields = {name: field for name, field in fields.items() if name in selected}
+        for name, field in fields.items():
+            nested = getattr(field, 'child', field)  # many=True wraps the serializer in a ListSerializer
+            if isinstance(nested, DynamicFieldsMixin):
+                nested.field_trees = ((selected or {}).get(name), expanded.get(name, {}))
+        return fields
+
+    def _field_trees(self):
+        # explicit branch from a parent, else the query string when this is the top-level serializer
+        if getattr(self, 'field_trees', None) is not None:
+            return self.field_trees[0], self.field_trees[1]
+        parent = self.parent.parent if isinstance(self.parent, serializers.ListSerializer) else self.parent
+        request = self.context.get('request')
+        if parent is not None or request is None or request.method not in ('GET', 'HEAD'):
+            return None, {}  # writes always see every field
+        return parse_field_tree(request.query_params.get('fields')), parse_field_tree(request.query_params.get('expand'))
+
+
+def sparse_queryset(queryset, serializer, required=()):
+    """
+    Narrow queryset to what serializer will read: only() the used columns,
+    select_related() forward relations read through dotted sources or
+    nested serializers, prefetch_related() many-valued ones (with their own
+    narrowed queryset). Falls back to loading every column when a field
+    reads something that is not a model field or annotation.
+    """
+    serializer = getattr(serializer, 'child', serializer)
+    only, related, prefetch = _sparse_plan(queryset.model, serializer, '', set(queryset.query.annotations))
+    required = [*required, *_joined_paths(queryset.query.select_related)]  # joins the view already asked for stay loaded
+    if related:
+        queryset = queryset.select_related(*related)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    if only is not None:
+        queryset = queryset.only(*only, *required)
+    return queryset
+
+
+def _joined_paths(tree, prefix=''):
+    # select_related() tree -> ['column', 'column__project', ...]
+    if not isinstance(tree, dict):
+        return []
+    paths = []
+    for name, subtree in tree.items():
+        paths.append(f'{prefix}{name}')
+        paths += _joined_paths(subtree, f'{prefix}{name}__')
+    return paths
+
+
+def _sparse_plan(model, serializer, prefix, annotations):
+    # (only, select_related, prefetch_related) for one serializer level; only is None when it cannot be narrowed
+    only, related, prefetch = {f'{prefix}{model._meta.pk.name}'}, set(), []
+    for field in serializer.fields.values():
+        if field.write_only or field.source_attrs and field.source_attrs[0] in annotations:
+            continue
+        try:
+            model_field = model._meta.get_field(field.source_attrs[0])
+        except (IndexError, FieldDoesNotExist):  # '*', properties, methods
+            only = None
+            continue
+        nested = getattr(field, 'child', field)
+        path = f'{prefix}{model_field.name}'
+        if model_field.many_to_many or model_field.one_to_many:
+            child_queryset = model_field.related_model._default_manager.all()
+            if isinstance(nested, serializers.BaseSerializer):
+                back_reference = [model_field.field.name] if model_field.one_to_many else []  # joins rows to their parent
+                child_queryset = sparse_queryset(child_queryset, nested, back_reference)
+            prefetch.append(Prefetch(path, queryset=child_queryset))
+            continue
+        if only is not None:
+            only.add(path)
+        if not model_field.is_relation:
+            continue
+        if isinstance(nested, serializers.BaseSerializer):  # expanded foreign key
+            related.add(path)
+            sub_only, sub_related, sub_prefetch = _sparse_plan(model_field.related_model, nested, f'{path}__', set())
+            related |= sub_related
+            prefetch += sub_prefetch
+            only = None if only is None or sub_only is None else only | sub_only
+        elif len(field.source_attrs) > 1:  # dotted source such as assigned.username
+            related.add(path)
+            if only is not None:
+                only.add(f'{path}__{field.source_attrs[1]}')
+    return only, related, prefetch
+
+
 # ----------------------------
 # Column Serializer
 # ----------------------------
-class ColumnSerializer(serializers.ModelSerializer):
+class ColumnSerializer(DynamicFieldsMixin, SparseOrderMixin, serializers.ModelSerializer):
+    order_scope = 'project'
+    expandable_fields = {'tasks': ('TaskSerializer', {'many': True})}  # active tasks, top to bottom
+
     class Meta:
         model = Column
         fields = '__all__'  # include all fields
+        validators = []  # (project, order) uniqueness is checked in SparseOrderMixin.validate
+        extra_kwargs = {'order': {'required': False, 'max_value': ORDER_MAX}}
 
 
 # ----------------------------
 # Task Serializer
 # ----------------------------
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(DynamicFieldsMixin, SparseOrderMixin, serializers.ModelSerializer):
     assigned_user = serializers.CharField(source='assigned.username', read_only=True)  # show assigned username
+    order_scope = 'column'
+    expandable_fields = {
+        'assigned': ('MemberSerializer', {}),
+        'created_by': ('MemberSerializer', {}),
+        'comments': ('CommentSerializer', {'many': True}),
+    }
+
     class Meta:
         model = Task
         fields = '__all__'
+        validators = []  # (column, order) uniqueness is checked in SparseOrderMixin.validate
+        extra_kwargs = {'order': {'required': False, 'max_value': ORDER_MAX}}
 
 
 # ----------------------------
 # Comment Serializer
 # ----------------------------
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     author_username = serializers.CharField(source='author.username', read_only=True)  # display author username
+    expandable_fields = {'author': ('MemberSerializer', {}), 'task': ('TaskSerializer', {})}
+
     class Meta:
         model = Comment
         fields = '__all__'
+        extra_kwargs = {'author': {'read_only': True}}  # set from request.user in CommentViewSet.perform_create
 
 
 # ----------------------------
 # Notification Serializer
 # ----------------------------
-class NotificationSerializer(serializers.ModelSerializer):
+class NotificationSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Notification
         fields = '__all__'
 
 
+# ----------------------------
+# Bulk mark-read request
+# ----------------------------
+class MarkReadSerializer(serializers.Serializer):
+    up_to = serializers.IntegerField(required=False, min_value=1)  # mark notifications with id <= up_to; all when omitted
+
+
 # ----------------------------
 # Project Serializer with nested columns
 # ----------------------------
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     owner = serializers.CharField(source='owner.username', read_only=True)  # display owner username
     members = serializers.SlugRelatedField(
         slug_field='username', many=True, queryset=User.objects.all(), required=False
     )  # display members as usernames
     columns = ColumnSerializer(many=True, read_only=True)  # nested columns
+    expandable_fields = {'owner': ('MemberSerializer', {}), 'members': ('MemberSerializer', {'many': True})}
 
     class Meta:
         model = Project
         fields = '__all__'
 
 
+# ----------------------------
+# Move a Column or Task to a position within its (new) scope
+# ----------------------------
+class MoveSerializer(serializers.Serializer):
+    position = serializers.IntegerField(min_value=0)  # index among the active siblings, 0 = first
+    column = serializers.IntegerField(required=False)  # target column (tasks only); defaults to the current one
+
+
+# ----------------------------
+# Bulk reorder of a project's board
+# ----------------------------
+class ColumnTasksOrderSerializer(serializers.Serializer):
+    column = serializers.IntegerField()  # column receiving the tasks
+    tasks = serializers.ListField(child=serializers.IntegerField())  # full new task order, top to bottom
+
+
+class ReorderSerializer(serializers.Serializer):
+    columns = serializers.ListField(child=serializers.IntegerField(), required=False)  # full new column order, left to right
+    tasks = ColumnTasksOrderSerializer(many=True, required=False)  # new task order for one or more columns
+
+    def validate(self, attrs):
+        task_ids = [pk for entry in attrs.get('tasks', []) for pk in entry['tasks']]
+        target_columns = [entry['column'] for entry in attrs.get('tasks', [])]
+        if len(set(task_ids)) != len(task_ids) or len(set(target_columns)) != len(target_columns):
+            raise serializers.ValidationError("Each column and task may only appear once.")
+        if len(set(attrs.get('columns', []))) != len(attrs.get('columns', [])):
+            raise serializers.ValidationError({'columns': "Each column may only appear once."})
+        return attrs
+
+
+# ----------------------------
+# Board snapshot serializers (project -> columns -> tasks)
+# ----------------------------
+class BoardTaskSerializer(TaskSerializer):
+    comment_count = serializers.IntegerField(read_only=True)  # annotated active comment count
+
+
+class BoardColumnSerializer(ColumnSerializer):
+    tasks = BoardTaskSerializer(many=True, read_only=True)  # nested active tasks (prefetched)
+
+
+class BoardSerializer(ProjectSerializer):
+    columns = BoardColumnSerializer(many=True, read_only=True)  # nested active columns with their tasks
+
+
+# ----------------------------
+# Lean list rows: values() instead of model instances
+#
+# Builds the same JSON as a ModelSerializer from one values() query, with
+# dotted sources such as `assigned.username` joined in SQL. Only plain
+# model fields, foreign keys (as ids) and dotted read-only sources are
+# supported. Like DRF, a dotted source behind a NULL foreign key leaves
+# the key out of the row.
+# ----------------------------
+class LeanRows:
+    passthrough = (serializers.BooleanField, serializers.CharField, serializers.IntegerField)  # values() already has the output type
+
+    def __init__(self, fields):
+        self.lookups = []  # values() arguments
+        self.expressions = {}  # joined columns, e.g. assigned_user=F('assigned__username')
+        self.plan = []  # (output key, row key, converter or None, omit when None)
+        for name, field in fields.items():
+            if field.write_only:
+                continue
+            if isinstance(field, (serializers.ManyRelatedField, serializers.BaseSerializer)) or field.source == '*':
+                raise TypeError(f"{name} cannot be read from values()")
+            if '.' in field.source:
+                self.expressions[name] = F(field.source.replace('.', '__'))
+                self.plan.append((name, name, None, True))
+                continue
+            self.lookups.append(field.source)
+            if isinstance(field, (serializers.PrimaryKeyRelatedField, *self.passthrough)):
+                converter = None
+            else:
+                converter = field.to_representation  # dates, datetimes, decimals, choices
+            self.plan.append((name, field.source, converter, False))
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def of(cls, serializer_class):
+        return cls(serializer_class().fields)  # fields are inspected once per class, not per request
+
+    def queryset(self, queryset, keys=()):
+        # keys: extra columns read by the caller (keyset pagination), never rendered
+        lookups = self.lookups + [key for key in keys if key not in self.lookups]
+        return queryset.values(*lookups, **self.expressions)
+
+    def render(self, rows):
+        with timing.span('serialize'):
+            return self._render(rows)
+
+    def _render(self, rows):
+        data = []
+        for row in rows:
+            item = {}
+            for name, key, converter, optional in self.plan:
+                value = row[key]
+                if value is None:
+                    if optional:
+                        continue
+                    item[name] = None
+                else:
+                    item[name] = converter(value) if converter is not None else value
+            data.append(item)
+        return data
+
+
 # ----------------------------
 # User Registration Serializer
 # ----------------------------
-class RegisterSerializer(serializers.ModelSerializer):
+class RegisterSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     password = serializers.CharField(write_only=True, required=True, min_length=8)  # password write-only
     email = serializers.EmailField(
         required=True, validators=[UniqueValidator(queryset=User.objects.all())]
@@ -84,7 +365,16 @@ class RegisterSerializer(serializers.ModelSerializer):
 # ----------------------------
 # User Serializer
 # ----------------------------
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ('id', 'username', 'email')
+
+
+# ----------------------------
+# Other users as seen on a board (?expand= of owner, members, assignees, authors)
+# ----------------------------
+class MemberSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    class Meta:
+        model = User
+        fields = ('id', 'username')  # no email: these are other people's accounts
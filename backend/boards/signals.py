@@ -0,0 +1,222 @@
+from contextlib import contextmanager  # quiet() block
+from contextvars import ContextVar  # per thread/task switch
+
+from django.contrib.auth import get_user_model  # credential changes revoke tokens
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save  # model layer hooks
+from django.dispatch import receiver  # decorator to connect handlers
+
+from . import events, notifications  # board change stream, notification fan-out
+from .access import sync_project_access  # ProjectAccess maintenance
+from .authentication import bump_token_version, evict_users  # JWT revocation and cached users
+from .models import Project, Column, Task, Comment, Notification  # models whose changes are tracked
+from .serializers import ColumnSerializer, TaskSerializer, CommentSerializer  # event payloads
+from .versioning import touch_projects  # board revision counter
+
+User = get_user_model()
+UNKNOWN = object()  # field was deferred when the instance was loaded
+
+
+# ----------------------------
+# ProjectAccess: owner changes
+# ----------------------------
+@receiver(post_init, sender=Project)
+def remember_owner(sender, instance, **kwargs):
+    instance._loaded_owner_id = instance.__dict__.get('owner_id', UNKNOWN)
+
+
+@receiver(post_save, sender=Project)
+def project_saved(sender, instance, created, **kwargs):
+    if created or instance._loaded_owner_id != instance.owner_id:  # creation and owner hand-over (UNKNOWN: deferred, sync anyway)
+        sync_project_access([instance.pk])
+    instance._loaded_owner_id = instance.owner_id
+    touch_projects(pk=instance.pk)
+
+
+# ----------------------------
+# ProjectAccess: member changes (project.members.* and user.projects.*)
+# ----------------------------
+@receiver(m2m_changed, sender=Project.members.through)
+def project_members_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse and action == 'pre_clear':
+        # user.projects.clear(): remember the projects before the rows are gone
+        instance._cleared_project_ids = list(instance.projects.values_list('pk', flat=True))
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        project_ids = [instance.pk]
+    elif action == 'post_clear':
+        project_ids = getattr(instance, '_cleared_project_ids', [])
+    else:
+        project_ids = pk_set or []
+    sync_project_access(project_ids)
+    touch_projects(own_fields=True, pk__in=project_ids)  # member usernames are part of the project payload
+
+
+# ----------------------------
+# Board revision and change events: any write below a project changes its version
+# ----------------------------
+_quiet = ContextVar('boards_signals_quiet', default=False)
+
+
+@contextmanager
+def quiet():
+    """Skip revision bumps, change events and notification side effects inside the block (e.g. purging tombstones)."""
+    token = _quiet.set(True)
+    try:
+        yield
+    finally:
+        _quiet.reset(token)
+
+
+@receiver(post_init, sender=Column)
+@receiver(post_init, sender=Task)
+def remember_loaded_state(sender, instance, **kwargs):
+    # values as loaded, to tell moves/reassignments from plain updates on save (__dict__: never load deferred fields)
+    scope = 'project_id' if sender is Column else 'column_id'
+    instance._loaded_position = (instance.__dict__.get(scope), instance.__dict__.get('order'))
+    if sender is Task:
+        instance._loaded_assigned_id = instance.__dict__.get('assigned_id', UNKNOWN)
+        instance._loaded_due = instance.__dict__.get('due', UNKNOWN)
+
+
+def _save_action(instance, created):
+    if created:
+        return 'created'
+    if not instance.is_active:
+        return 'deleted'  # soft delete
+    return 'updated'
+
+
+@receiver(post_save, sender=Column)
+def column_saved(sender, instance, created, **kwargs):
+    if _quiet.get():
+        return
+    touch_projects(pk=instance.project_id)
+    action = _save_action(instance, created)
+    if action == 'updated' and instance._loaded_position != (instance.project_id, instance.order):
+        action = 'moved'
+    instance._loaded_position = (instance.project_id, instance.order)
+    events.emit('column', action, instance, instance.project_id, ColumnSerializer)
+
+
+@receiver(post_delete, sender=Column)
+def column_deleted(sender, instance, **kwargs):
+    if _quiet.get():
+        return
+    touch_projects(pk=instance.project_id)
+    events.emit('column', 'deleted', instance, instance.project_id)
+
+
+def _task_project_id(column_id):
+    # only resolved when someone is subscribed (events.emit checks first)
+    return Column.all_objects.filter(pk=column_id).values_list('project_id', flat=True).first()
+
+
+@receiver(post_save, sender=Task)
+def task_saved(sender, instance, created, **kwargs):
+    if _quiet.get():
+        return
+    touch_projects(columns=instance.column_id)  # resolved in SQL, no column fetch
+    if instance.is_active:
+        actor = notifications.current_actor()
+        if actor is None and created:
+            actor = instance.created_by_id  # created outside a view: the creator made the assignment
+        if instance.assigned_id is not None and (created or instance._loaded_assigned_id not in (UNKNOWN, instance.assigned_id)):
+            notifications.task_assigned(instance, actor)
+        if not created and instance._loaded_due not in (UNKNOWN, instance.due):
+            notifications.task_due_changed(instance, actor)
+    instance._loaded_assigned_id, instance._loaded_due = instance.assigned_id, instance.due
+    if events.broker.is_listening():
+        action = _save_action(instance, created)
+        if action == 'updated' and instance._loaded_position != (instance.column_id, instance.order):
+            action = 'moved'
+        instance._loaded_position = (instance.column_id, instance.order)
+        events.emit('task', action, instance, _task_project_id(instance.column_id), TaskSerializer)
+
+
+@receiver(post_delete, sender=Task)
+def task_deleted(sender, instance, **kwargs):
+    if _quiet.get():
+        return
+    touch_projects(columns=instance.column_id)
+    if events.broker.is_listening():
+        events.emit('task', 'deleted', instance, _task_project_id(instance.column_id))
+
+
+def _comment_project_id(task_id):
+    return Column.all_objects.filter(tasks=task_id).values_list('project_id', flat=True).first()
+
+
+@receiver(post_save, sender=Comment)
+def comment_saved(sender, instance, created, **kwargs):
+    if _quiet.get():
+        return
+    touch_projects(columns__tasks=instance.task_id)
+    if created and instance.is_active:
+        notifications.comment_created(instance)
+    if events.broker.is_listening():
+        events.emit('comment', _save_action(instance, created), instance, _comment_project_id(instance.task_id), CommentSerializer)
+
+
+@receiver(post_delete, sender=Comment)
+def comment_deleted(sender, instance, **kwargs):
+    if _quiet.get():
+        return
+    touch_projects(columns__tasks=instance.task_id)
+    if events.broker.is_listening():
+        events.emit('comment', 'deleted', instance, _comment_project_id(instance.task_id))
+
+
+# ----------------------------
+# Unread notification counters (bulk fan-out adjusts them itself)
+# ----------------------------
+@receiver(post_init, sender=Notification)
+def remember_read(sender, instance, **kwargs):
+    instance._loaded_read = instance.__dict__.get('read', UNKNOWN)
+
+
+@receiver(post_save, sender=Notification)
+def notification_saved(sender, instance, created, **kwargs):
+    if _quiet.get():
+        return
+    if created:
+        delta = 0 if instance.read else 1
+    elif instance._loaded_read in (UNKNOWN, instance.read):
+        delta = 0
+    else:
+        delta = -1 if instance.read else 1
+    notifications.adjust_unread({instance.user_id: delta})
+    instance._loaded_read = instance.read
+
+
+@receiver(post_delete, sender=Notification)
+def notification_deleted(sender, instance, **kwargs):
+    if _quiet.get():
+        return
+    if not instance.read:
+        notifications.adjust_unread({instance.user_id: -1})
+
+
+# ----------------------------
+# Cached JWT users: revoke tokens on password change or deactivation
+# ----------------------------
+@receiver(post_init, sender=User)
+def remember_credentials(sender, instance, **kwargs):
+    instance._loaded_credentials = (instance.__dict__.get('password', UNKNOWN), instance.__dict__.get('is_active', UNKNOWN))
+    instance._loaded_username = instance.__dict__.get('username', UNKNOWN)
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, **kwargs):
+    password, is_active = instance._loaded_credentials
+    instance._loaded_credentials = (instance.password, instance.is_active)
+    username, instance._loaded_username = instance._loaded_username, instance.username
+    if created:
+        return
+    if username not in (UNKNOWN, instance.username):
+        touch_projects(own_fields=True, access__user=instance.pk)  # usernames are part of cached project and board payloads
+    if password not in (UNKNOWN, instance.password) or (is_active is True and not instance.is_active):
+        bump_token_version(instance.pk)  # also evicts the cached entry
+    else:
+        evict_users([instance.pk])  # profile edits show up at once in every worker
@@ -0,0 +1,103 @@
+import gzip  # precompressed variant
+import hashlib  # ETag
+import os  # stat for mtime-based reload
+import threading  # one reload at a time
+import time  # throttles the mtime checks
+
+from django.conf import settings  # BASE_DIR, BOARDS_SPA
+from django.http import HttpResponse, HttpResponseNotModified  # shell responses
+from django.utils.cache import patch_vary_headers  # Vary: Accept-Encoding
+from django.utils.http import parse_etags  # If-None-Match
+
+try:
+    import brotli  # optional: smaller shell for browsers that accept br
+except ImportError:  # pragma: no cover - gzip and identity are still served
+    brotli = None
+
+# ----------------------------
+# SPA shell (frontend/dist/index.html)
+#
+# The built index.html is read once per process and kept in memory as
+# identity, gzip and (with the brotli package) br bodies. Every deep link
+# is answered from memory with a strong ETag per encoding (the hash of the
+# build, suffixed with -gzip / -br) and `Cache-Control: no-cache`
+# so browsers revalidate (a 304) and pick up a new build immediately;
+# the hashed assets it references are served by WhiteNoise. The file's
+# mtime is checked at most every RECHECK_SECONDS, so a rebuild is picked
+# up without a restart and without a stat() per request.
+# ----------------------------
+_spa_settings = getattr(settings, 'BOARDS_SPA', {})
+INDEX_PATH = _spa_settings.get('INDEX', os.path.join(settings.BASE_DIR, '..', 'frontend', 'dist', 'index.html'))
+RECHECK_SECONDS = _spa_settings.get('RECHECK_SECONDS', 2.0)  # 0 stats on every request (development)
+MISSING_MESSAGE = "index.html not found! Please build your React app first."
+
+
+class SpaShell:
+    def __init__(self, path=INDEX_PATH, recheck_seconds=RECHECK_SECONDS):
+        self.path = path
+        self.recheck_seconds = recheck_seconds
+        self._lock = threading.Lock()
+        self._mtime = None  # mtime of the loaded build; None when nothing is loaded
+        self._checked_at = float('-inf')  # monotonic time of the last stat()
+        self.variants = {}  # content-coding ('identity', 'gzip', 'br') -> (body, ETag): one strong validator per byte sequence
+
+    def _refresh(self):
+        now = time.monotonic()
+        if now - self._checked_at < self.recheck_seconds:
+            return
+        with self._lock:
+            if now - self._checked_at < self.recheck_seconds:
+                return
+            self._checked_at = now
+            try:
+                mtime = os.stat(self.path).st_mtime_ns
+            except FileNotFoundError:
+                self._mtime, self.variants = None, {}
+                return
+            if mtime == self._mtime:
+                return
+            with open(self.path, 'rb') as f:
+                body = f.read()
+            bodies = {'identity': body, 'gzip': gzip.compress(body, compresslevel=9, mtime=0)}
+            if brotli is not None:
+                bodies['br'] = brotli.compress(body)
+            digest = hashlib.sha256(body).hexdigest()[:32]
+            self.variants = {
+                coding: (encoded, f'"{digest}"' if coding == 'identity' else f'"{digest}-{coding}"')
+                for coding, encoded in bodies.items()
+            }
+            self._mtime = mtime
+
+    @staticmethod
+    def _coding(request, variants):
+        accepted = {
+            part.split(';')[0].strip().lower()
+            for part in request.META.get('HTTP_ACCEPT_ENCODING', '').split(',')
+            if not part.replace(' ', '').endswith(';q=0')
+        }
+        for coding in ('br', 'gzip'):
+            if coding in accepted and coding in variants:
+                return coding
+        return 'identity'
+
+    def response(self, request):
+        self._refresh()
+        variants = self.variants  # one consistent build even if a reload happens meanwhile
+        if not variants:
+            return HttpResponse(MISSING_MESSAGE, status=501)
+        coding = self._coding(request, variants)
+        body, etag = variants[coding]
+        if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(body, content_type='text/html; charset=utf-8')
+            if coding != 'identity':
+                response['Content-Encoding'] = coding  # GZipMiddleware leaves encoded responses alone
+            response['Content-Length'] = len(body)
+        response['ETag'] = etag
+        response['Cache-Control'] = 'no-cache'  # always revalidate: a new deploy must show up at once
+        patch_vary_headers(response, ('Accept-Encoding',))
+        return response
+
+
+shell = SpaShell()
@@ -0,0 +1,2 @@
+# Run from the repository root (backend/ is a namespace package, so point discovery at the directory):
+#   PYTHONPATH=. python backend/manage.py test backend/boards/tests -t .
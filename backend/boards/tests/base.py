@@ -0,0 +1,40 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from rest_framework.test import APITestCase
+
+from backend.boards.access import access_cache
+from backend.boards.authentication import user_cache
+from backend.boards.bus import bus
+from backend.boards.caching import read_cache
+from backend.boards.models import Column, Project, Task
+from backend.boards.notifications import fanout
+
+
+class BoardsTestCase(APITestCase):
+    """API tests in a single process: no bus listener, inline notification fan-out, cold caches."""
+
+    def setUp(self):
+        super().setUp()
+        for patch in (
+            mock.patch.object(bus, 'enabled', False),
+            mock.patch.object(fanout, 'asynchronous', False),
+            mock.patch.object(read_cache, 'enabled', False),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+        access_cache.clear()  # primary keys are reused once a test's transaction rolls back
+        user_cache.clear()
+
+    @staticmethod
+    def make_user(username):
+        return User.objects.create_user(username=username, password='test-password')
+
+    @staticmethod
+    def make_board(owner, *members, name='Board'):
+        """A project with one column holding one task."""
+        project = Project.objects.create(name=name, owner=owner)
+        project.members.add(*members)
+        column = Column.objects.create(name='Todo', project=project, order=1)
+        task = Task.objects.create(title='First', column=column, order=1, created_by=owner)
+        return project, column, task
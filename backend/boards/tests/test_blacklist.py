@@ -0,0 +1,40 @@
+import threading
+from datetime import timedelta
+
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from backend.boards.blacklist import TokenBlacklist
+
+from .base import BoardsTestCase
+
+
+class TokenBlacklistTests(BoardsTestCase):
+    def setUp(self):
+        super().setUp()  # no bus listener thread
+        token = OutstandingToken.objects.create(jti='revoked', token='x', expires_at=timezone.now() + timedelta(days=1))
+        BlacklistedToken.objects.create(token=token)
+        self.blacklist = TokenBlacklist(capacity=100, sync_seconds=3600)
+
+    def test_loads_the_database_blacklist(self):
+        self.assertTrue(self.blacklist.might_contain('revoked'))
+        self.blacklist.add('logged-out')
+        self.assertTrue(self.blacklist.might_contain('logged-out'))
+
+    def test_lookups_survive_concurrent_invalidation(self):
+        # the bus thread drops the filter while requests read and add to it
+        done = threading.Event()
+
+        def invalidate():
+            while not done.is_set():
+                self.blacklist.invalidate(None)
+
+        thread = threading.Thread(target=invalidate)
+        thread.start()
+        try:
+            for _ in range(200):
+                self.assertTrue(self.blacklist.might_contain('revoked'))
+                self.blacklist.add('logged-out')
+        finally:
+            done.set()
+            thread.join()
@@ -0,0 +1,206 @@
+import asyncio
+import json
+import time
+from collections import defaultdict
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+
+from backend.boards import events
+from backend.boards.authentication import VersionedTokenObtainPairSerializer
+from backend.boards.bus import bus
+from backend.boards.events import BusBroker, LocalBroker
+from backend.boards.models import Column, InvalidationEvent, Task
+from backend.boards.ordering import ORDER_GAP
+
+from .base import BoardsTestCase
+
+
+class ReorderEventTests(BoardsTestCase):
+    """Bulk renumbering bypasses the save() signals but still reaches subscribers."""
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.make_user('owner')
+        self.project, self.todo, self.first = self.make_board(self.owner)
+        self.done = Column.objects.create(name='Done', project=self.project, order=2)
+        self.second = Task.objects.create(title='Second', column=self.todo, order=2, created_by=self.owner)
+        self.client.force_authenticate(self.owner)
+        for patch in (
+            mock.patch.object(events.broker, 'is_listening', return_value=True),
+            mock.patch.object(events.broker, 'publish'),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def published(self, kind):
+        return [event for _, event in (call.args for call in events.broker.publish.call_args_list) if event['type'] == kind]
+
+    def test_reorder_sends_one_event_per_scope(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f'/api/projects/{self.project.pk}/reorder/', {
+                'columns': [self.done.pk, self.todo.pk],
+                'tasks': [{'column': self.done.pk, 'tasks': [self.second.pk]}],
+            }, format='json')
+        self.assertEqual(response.status_code, 200)
+        [columns] = self.published('column.reordered')
+        self.assertEqual(columns['project'], self.project.pk)
+        self.assertEqual(columns['data'], {'project': self.project.pk, 'order': [
+            {'id': self.done.pk, 'order': ORDER_GAP}, {'id': self.todo.pk, 'order': 2 * ORDER_GAP},
+        ]})
+        [tasks] = self.published('task.reordered')
+        self.assertEqual(tasks['project'], self.project.pk)
+        self.assertEqual(tasks['data'], {'column': self.done.pk, 'order': [{'id': self.second.pk, 'order': ORDER_GAP}]})
+
+
+class BusBrokerTests(BoardsTestCase):
+    """Events published on one worker are delivered on every other one, once."""
+
+    def setUp(self):
+        super().setUp()
+        patch = mock.patch.object(bus, 'enabled', True)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.here, self.there = BusBroker(), BusBroker()  # two workers sharing the bus
+        self.addCleanup(bus._handlers[events.BUS_KIND].remove, self.here._receive)
+        self.addCleanup(bus._handlers[events.BUS_KIND].remove, self.there._receive)
+        self.addCleanup(bus._handlers[events.PRESENCE_KIND].remove, self.here._presence)
+        self.addCleanup(bus._handlers[events.PRESENCE_KIND].remove, self.there._presence)
+
+    def test_event_reaches_the_other_worker_once(self):
+        event = {'type': 'task.updated', 'project': 7, 'object_id': 3, 'data': {'title': 'Hello'}}
+        with mock.patch.object(LocalBroker, 'publish', autospec=True) as deliver:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.here.publish(7, event)
+        calls = [call for call in deliver.call_args_list if call.args[0] in (self.here, self.there)]  # not the module broker
+        self.assertCountEqual(calls, [mock.call(self.here, 7, event), mock.call(self.there, 7, event)])
+
+    def test_oversized_events_are_relayed_without_data(self):
+        event = {'type': 'task.updated', 'project': 7, 'object_id': 3, 'data': {'description': 'x' * events.MAX_MESSAGE_BYTES}}
+        with mock.patch.object(bus, 'publish') as relay, mock.patch.object(LocalBroker, 'publish'):
+            self.here.publish(7, event)
+        [message] = relay.call_args.args[1]
+        self.assertEqual(json.loads(message)['event'], {'type': 'task.updated', 'project': 7, 'object_id': 3})
+
+
+class PresenceTests(BoardsTestCase):
+    """Writes are only relayed while some worker streams their project."""
+
+    def setUp(self):
+        super().setUp()
+        for patch in (
+            mock.patch.object(bus, 'enabled', True),
+            mock.patch.object(bus, 'ensure_listening'),  # no listener thread
+            mock.patch.object(BusBroker, '_changed', autospec=True),  # no announcer thread: tests announce by hand
+            mock.patch.object(bus, '_handlers', defaultdict(list)),  # the module broker must not learn of these projects
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.here, self.there = BusBroker(), BusBroker()
+
+    def announce(self, broker):
+        with self.captureOnCommitCallbacks(execute=True):
+            broker._announce()
+
+    def test_workers_know_which_projects_are_streamed_elsewhere(self):
+        self.assertFalse(self.here.is_listening())
+        self.there._subscribers[7].add(mock.Mock())
+        self.announce(self.there)
+        self.assertTrue(self.here.is_listening())
+        self.assertTrue(self.here.is_listening(7))
+        self.assertFalse(self.here.is_listening(8))
+        self.there._subscribers.clear()  # last client went away
+        self.announce(self.there)
+        self.assertFalse(self.here.is_listening())
+
+    def test_silent_workers_expire(self):
+        self.there._subscribers[7].add(mock.Mock())
+        self.announce(self.there)
+        later = time.monotonic() + 3 * events.PRESENCE_SECONDS + 1
+        with mock.patch.object(events.time, 'monotonic', return_value=later):
+            self.assertFalse(self.here.is_listening(7))
+
+    def test_reconnected_worker_asks_the_others_to_announce(self):
+        self.here._presence(None)  # listener (re)started
+        self.announce(self.here)
+        BusBroker._changed.assert_any_call(self.there)
+
+    def test_writes_are_relayed_only_while_the_project_is_streamed(self):
+        owner = self.make_user('owner')
+        project, _, task = self.make_board(owner)
+        self.client.force_authenticate(owner)
+        with mock.patch.object(events, 'broker', self.here):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.patch(f'/api/tasks/{task.pk}/', {'title': 'Unwatched'}, format='json')
+            self.assertFalse(InvalidationEvent.objects.filter(kind=events.BUS_KIND).exists())
+            self.there._subscribers[project.pk].add(mock.Mock())
+            self.announce(self.there)
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.patch(f'/api/tasks/{task.pk}/', {'title': 'Watched'}, format='json')
+        [message] = InvalidationEvent.objects.get(kind=events.BUS_KIND).keys
+        self.assertEqual(json.loads(message)['event']['data']['title'], 'Watched')
+
+
+class EventStreamTests(BoardsTestCase):
+    """GET /api/projects/<id>/events/ streams the events of model saves to the project's members."""
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.make_user('owner')
+        self.project, self.column, self.task = self.make_board(self.owner)
+        patch = mock.patch.object(events, 'broker', LocalBroker())
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def url(self, project):
+        return f'/api/projects/{project.pk}/events/'
+
+    def token(self, user):
+        return str(VersionedTokenObtainPairSerializer.get_token(user).access_token)
+
+    def edit_board(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            task = Task.objects.create(title='Second', column=self.column, order=2, created_by=self.owner)
+        with self.captureOnCommitCallbacks(execute=True):
+            task.title = 'Renamed'
+            task.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            task.order = 3
+            task.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            task.is_active = False  # soft delete
+            task.save()
+        return task
+
+    async def test_saves_reach_the_stream(self):
+        token = await sync_to_async(self.token)(self.owner)
+        response = await self.async_client.get(self.url(self.project), headers={'Authorization': f'Bearer {token}'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        frames = aiter(response.streaming_content)
+        try:
+            self.assertEqual(await anext(frames), b'retry: 3000\n\n')  # subscribed from here on
+            self.assertTrue(events.broker.is_listening(self.project.pk))
+            task = await sync_to_async(self.edit_board)()
+            received = []
+            for _ in range(4):
+                frame = (await asyncio.wait_for(anext(frames), timeout=5)).decode()
+                received.append(json.loads(frame.split('data: ', 1)[1]))
+        finally:
+            await frames.aclose()
+        self.assertEqual([(event['type'], event['object_id']) for event in received], [
+            ('task.created', task.pk), ('task.updated', task.pk), ('task.moved', task.pk), ('task.deleted', task.pk),
+        ])
+        self.assertEqual(received[1]['data']['title'], 'Renamed')
+
+    async def test_token_is_required(self):
+        response = await self.async_client.get(self.url(self.project))
+        self.assertEqual(response.status_code, 401)
+        response = await self.async_client.get(self.url(self.project), {'token': 'not-a-jwt'})
+        self.assertEqual(response.status_code, 401)
+
+    async def test_other_projects_are_not_found(self):
+        stranger = await sync_to_async(self.make_user)('stranger')
+        response = await self.async_client.get(self.url(self.project), {'token': await sync_to_async(self.token)(stranger)})
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(events.broker.is_listening())
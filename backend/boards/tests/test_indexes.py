@@ -0,0 +1,56 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.utils import timezone
+
+from backend.boards.models import Column, Comment, Notification, Project, Task
+
+from .base import BoardsTestCase
+
+
+class HotQueryPlanTests(BoardsTestCase):
+    """The queries behind the busiest endpoints are answered from their indexes."""
+
+    def setUp(self):
+        super().setUp()  # no bus listener thread
+        self.user = User.objects.create(username='planner')
+        self.project = Project.objects.create(name='Plans', owner=self.user)
+        self.column = Column.objects.create(name='Todo', project=self.project, order=1)
+        self.task = Task.objects.create(title='Explain', column=self.column, order=1, assigned=self.user)
+
+    def explain(self, queryset):
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute('SET LOCAL enable_seqscan = off')  # tiny test tables would always be scanned
+                cursor.execute(f'EXPLAIN {sql}', params)
+            else:
+                cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            return '\n'.join(str(row) for row in cursor.fetchall())
+
+    def assertUsesIndex(self, queryset, index):
+        plan = self.explain(queryset)
+        self.assertIn(index, plan, f"expected {index} in the plan:\n{plan}")
+
+    def test_notification_inbox(self):
+        inbox = Notification.objects.filter(user=self.user).order_by('-created_at', '-id')[:20]
+        self.assertUsesIndex(inbox, 'notification_user_recent_idx')
+
+    def test_unread_notifications(self):
+        unread = Notification.objects.filter(user=self.user, read=False).order_by('-created_at', '-id')[:20]
+        self.assertUsesIndex(unread, 'notification_unread_idx')
+
+    def test_comments_of_a_task(self):
+        comments = Comment.objects.filter(task=self.task).order_by('created_at', 'id')
+        self.assertUsesIndex(comments, 'comment_active_task_idx')
+
+    def test_tasks_assigned_to_a_user(self):
+        tasks = Task.objects.filter(assigned=self.user).order_by('due')
+        self.assertUsesIndex(tasks, 'task_active_assigned_idx')
+
+    def test_changes_since(self):
+        since = timezone.now() - timedelta(minutes=5)
+        self.assertUsesIndex(Column.all_objects.filter(project=self.project, updated_at__gt=since), 'column_project_updated_idx')
+        self.assertUsesIndex(Task.all_objects.filter(column=self.column, updated_at__gt=since), 'task_column_updated_idx')
+        self.assertUsesIndex(Comment.all_objects.filter(task=self.task, updated_at__gt=since), 'comment_task_updated_idx')
@@ -0,0 +1,106 @@
+import json
+from datetime import date
+
+from rest_framework import serializers
+
+from backend.boards.models import Column, Comment, Notification, ProjectAccess, Task
+from backend.boards.renderers import ORJSONRenderer
+from backend.boards.serializers import ColumnSerializer, CommentSerializer, LeanRows, TaskSerializer
+
+from .base import BoardsTestCase
+
+SPARSE_FIELDS = {  # list route -> ?fields= values that leave out the cursor's ordering column
+    'projects': ('id', 'name,created_at', 'updated_at'),
+    'columns': ('id', 'id,name', 'updated_at'),
+    'tasks': ('id', 'title,created_at', 'updated_at'),
+    'comments': ('id', 'text', 'updated_at'),
+    'notifications': ('id', 'message', 'read'),
+}
+
+
+class SparseListTests(BoardsTestCase):
+    """?fields= on every list route, first page and the one after it."""
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.make_user('owner')
+        project, column, task = self.make_board(self.owner)
+        self.make_board(self.owner, name='Second board')
+        Column.objects.create(name='Done', project=project, order=2)
+        Task.objects.create(title='Second', column=column, order=2, created_by=self.owner)
+        for text in ('One', 'Two'):
+            Comment.objects.create(task=task, author=self.owner, text=text)
+            Notification.objects.create(user=self.owner, message=text)
+        self.client.force_authenticate(self.owner)
+
+    def test_fields_on_every_list_route(self):
+        for route, variants in SPARSE_FIELDS.items():
+            for fields in variants:
+                with self.subTest(route=route, fields=fields):
+                    response = self.client.get(f'/api/{route}/', {'fields': fields, 'page_size': 1})
+                    self.assertEqual(response.status_code, 200, response.content[:500])
+                    page = response.json()
+                    rows = page['results'] if isinstance(page, dict) else page
+                    self.assertTrue(rows)
+                    self.assertEqual({key for row in rows for key in row}, set(fields.split(',')))
+                    if isinstance(page, dict) and page.get('next'):
+                        following = self.client.get(page['next'])
+                        self.assertEqual(following.status_code, 200, following.content[:500])
+                        self.assertEqual({key for row in following.json()['results'] for key in row}, set(fields.split(',')))
+
+
+class LeanParityTests(BoardsTestCase):
+    """The values() fast path renders exactly what the DRF serializer would."""
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.make_user('owner')
+        self.assignee = self.make_user('assignee')
+        self.project, self.column, self.task = self.make_board(self.owner, self.assignee)  # unassigned, no due date
+        Task.objects.create(
+            title='Assigned', description='With a due date', column=self.column, order=2,
+            assigned=self.assignee, created_by=self.owner, due=date(2026, 11, 30),
+        )
+        Column.objects.create(name='Done', project=self.project, order=2)
+        Comment.objects.create(task=self.task, author=self.assignee, text='First')
+        Comment.objects.create(task=self.task, author=self.owner, text='Second')
+        self.client.force_authenticate(self.owner)
+
+    @staticmethod
+    def serialized(serializer_class, queryset):
+        # through the API renderer, so datetimes and dates compare as the client sees them
+        return {row['id']: row for row in json.loads(ORJSONRenderer().render(serializer_class(queryset, many=True).data))}
+
+    def test_list_routes_match_the_serializer(self):
+        for route, serializer_class, queryset in (
+            ('columns', ColumnSerializer, Column.objects.all()),
+            ('tasks', TaskSerializer, Task.objects.all()),
+            ('comments', CommentSerializer, Comment.objects.all()),
+        ):
+            with self.subTest(route=route):
+                response = self.client.get(f'/api/{route}/')
+                self.assertEqual(response.status_code, 200)
+                page = response.json()
+                rows = page['results'] if isinstance(page, dict) else page
+                expected = self.serialized(serializer_class, queryset)
+                self.assertEqual(len(rows), len(expected))
+                self.assertEqual(rows, [expected[row['id']] for row in rows])
+
+    def test_null_foreign_key_and_dates(self):
+        rows = {row['title']: row for row in self.client.get('/api/tasks/').json()['results']}
+        self.assertNotIn('assigned_user', rows['First'])  # serializer skips a dotted source through a null FK
+        self.assertIsNone(rows['First']['assigned'])
+        self.assertIsNone(rows['First']['due'])
+        self.assertEqual(rows['Assigned']['assigned_user'], 'assignee')
+        self.assertEqual(rows['Assigned']['due'], '2026-11-30')
+
+    def test_choice_fields(self):
+        class AccessSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = ProjectAccess
+                fields = '__all__'
+
+        lean = LeanRows(AccessSerializer().fields)
+        queryset = ProjectAccess.objects.order_by('pk')
+        self.assertEqual(lean.render(lean.queryset(queryset)), AccessSerializer(queryset, many=True).data)
+        self.assertEqual({row['role'] for row in lean.render(lean.queryset(queryset))}, {'owner', 'member'})
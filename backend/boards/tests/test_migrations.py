@@ -0,0 +1,33 @@
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+
+class ProjectAccessBackfillTests(TransactionTestCase):
+    """0002_project_access indexes the owners and members of projects created before it."""
+
+    before = [('boards', '0001_initial')]
+    after = [('boards', '0002_project_access')]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes())  # back to the latest schema
+
+    def test_existing_owners_and_members_keep_access(self):
+        apps = self.migrate(self.before)
+        User = apps.get_model('auth', 'User')
+        Project = apps.get_model('boards', 'Project')
+        owner = User.objects.create(username='owner')
+        member = User.objects.create(username='member')
+        project = Project.objects.create(name='Old project', owner=owner)
+        project.members.add(member, owner)  # owner listed as a member too: the owner role wins
+
+        apps = self.migrate(self.after)
+        ProjectAccess = apps.get_model('boards', 'ProjectAccess')
+        rows = set(ProjectAccess.objects.values_list('user__username', 'project_id', 'role'))
+        self.assertEqual(rows, {('owner', project.pk, 'owner'), ('member', project.pk, 'member')})
@@ -0,0 +1,46 @@
+from backend.boards.models import Notification
+
+from .base import BoardsTestCase
+
+
+class ActorNotificationTests(BoardsTestCase):
+    """Assignment and due-date notifications skip the user who made the change."""
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.make_user('owner')
+        self.member = self.make_user('member')
+        self.project, self.column, self.task = self.make_board(self.owner, self.member)
+
+    def patch_task(self, user, data):
+        self.client.force_authenticate(user)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(f'/api/tasks/{self.task.pk}/', data, format='json')
+        self.assertEqual(response.status_code, 200)
+
+    def messages(self, user):
+        return list(Notification.objects.filter(user=user).values_list('message', flat=True))
+
+    def test_self_assignment_does_not_notify(self):
+        self.patch_task(self.owner, {'assigned': self.owner.pk})
+        self.assertEqual(self.messages(self.owner), [])
+
+    def test_creating_a_task_assigned_to_yourself_does_not_notify(self):
+        self.client.force_authenticate(self.member)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/tasks/', {'title': 'Mine', 'column': self.column.pk, 'assigned': self.member.pk}, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.messages(self.member), [])
+
+    def test_assigning_someone_else_notifies_them(self):
+        self.patch_task(self.owner, {'assigned': self.member.pk})
+        self.assertEqual(self.messages(self.member), ['You were assigned to "First"'])
+        self.assertEqual(self.messages(self.owner), [])
+
+    def test_own_due_date_change_notifies_only_the_others(self):
+        self.task.assigned = self.member
+        self.task.save()
+        Notification.objects.all().delete()
+        self.patch_task(self.member, {'due': '2026-12-01'})
+        self.assertEqual(self.messages(self.member), [])
+        self.assertEqual(self.messages(self.owner), ['Due date of "First" changed to 2026-12-01'])
@@ -0,0 +1,42 @@
+import base64
+import json
+
+from backend.boards.models import Comment, Task
+
+from .base import BoardsTestCase
+
+
+def cursor(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+class KeysetCursorTests(BoardsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.owner = self.make_user('owner')
+        self.project, self.column, self.task = self.make_board(self.owner)
+        Task.objects.create(title='Second', column=self.column, order=2, created_by=self.owner)
+        Comment.objects.create(task=self.task, author=self.owner, text='One')
+        self.client.force_authenticate(self.owner)
+
+    def test_next_link_walks_the_pages(self):
+        first = self.client.get('/api/tasks/?page_size=1').json()
+        second = self.client.get(first['next']).json()
+        self.assertEqual([row['title'] for row in first['results'] + second['results']], ['First', 'Second'])
+        self.assertIsNone(second['next'])
+
+    def test_tampered_cursor_is_not_found(self):
+        for url, position in (
+            ('/api/tasks/', ['abc', 1]),  # order is an integer
+            ('/api/comments/', ['yesterday', 1]),  # created_at is a datetime
+            ('/api/notifications/', ['2026-13-45T99:00:00', 1]),
+        ):
+            with self.subTest(url=url):
+                response = self.client.get(url, {'cursor': cursor({'p': position, 'r': 0})})
+                self.assertEqual(response.status_code, 404)
+                self.assertEqual(response.json(), {'detail': 'Invalid cursor'})
+
+    def test_garbage_cursor_is_not_found(self):
+        for value in ('not-base64!', cursor({'p': [1]}), cursor(['list'])):
+            with self.subTest(cursor=value):
+                self.assertEqual(self.client.get('/api/tasks/', {'cursor': value}).status_code, 404)
@@ -0,0 +1,61 @@
+from unittest import mock
+
+from backend.boards.models import Column, Comment, ProjectAccess, Task
+
+from .base import BoardsTestCase
+
+
+class MoveAcrossProjectsTests(BoardsTestCase):
+    """PATCHing a column, task or comment onto a foreign parent is refused."""
+
+    def setUp(self):
+        super().setUp()
+        self.alice = self.make_user('alice')
+        self.mallory = self.make_user('mallory')
+        self.project, self.column, self.task = self.make_board(self.alice, name='Alice')
+        self.other_project, self.other_column, self.other_task = self.make_board(self.mallory, name='Mallory')
+        self.client.force_authenticate(self.mallory)
+
+    def test_task_cannot_move_to_an_inaccessible_column(self):
+        response = self.client.patch(f'/api/tasks/{self.other_task.pk}/', {'column': self.column.pk, 'order': 5}, format='json')
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(Task.objects.get(pk=self.other_task.pk).column_id, self.other_column.pk)
+
+    def test_column_cannot_move_to_an_inaccessible_project(self):
+        response = self.client.patch(f'/api/columns/{self.other_column.pk}/', {'project': self.project.pk, 'order': 5}, format='json')
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(Column.objects.get(pk=self.other_column.pk).project_id, self.other_project.pk)
+
+    def test_comment_cannot_move_to_an_inaccessible_task(self):
+        comment = Comment.objects.create(task=self.other_task, author=self.mallory, text='Mine')
+        response = self.client.patch(f'/api/comments/{comment.pk}/', {'task': self.task.pk}, format='json')
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(Comment.objects.get(pk=comment.pk).task_id, self.other_task.pk)
+
+    def test_move_within_accessible_projects_still_works(self):
+        column = Column.objects.create(name='Done', project=self.other_project, order=2)
+        response = self.client.patch(f'/api/tasks/{self.other_task.pk}/', {'column': column.pk}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Task.objects.get(pk=self.other_task.pk).column_id, column.pk)
+
+
+class ProjectAccessSyncTests(BoardsTestCase):
+    """The access index is rebuilt when a project's owner changes, not on every project save."""
+
+    def setUp(self):
+        super().setUp()
+        self.alice = self.make_user('alice')
+        self.bob = self.make_user('bob')
+        self.project, _, _ = self.make_board(self.alice, name='Alice')
+
+    def test_field_edits_leave_the_access_index_alone(self):
+        with mock.patch('backend.boards.signals.sync_project_access') as sync:
+            self.project.description = 'Edited'
+            self.project.save()
+        sync.assert_not_called()
+
+    def test_owner_hand_over_is_indexed(self):
+        self.project.owner = self.bob
+        self.project.save()
+        self.assertEqual(ProjectAccess.objects.get(project=self.project, user=self.bob).role, ProjectAccess.OWNER)
+        self.assertFalse(ProjectAccess.objects.filter(project=self.project, user=self.alice).exists())
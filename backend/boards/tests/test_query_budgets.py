@@ -0,0 +1,166 @@
+import difflib
+import io
+import re
+from unittest import mock
+
+from django.core.management import call_command
+
+from backend.boards.bus import bus
+from backend.boards.management.commands.bench_api import ROUTES, Command as BenchCommand
+from backend.boards.models import Comment
+
+from .base import BoardsTestCase
+
+# ----------------------------
+# Query budgets
+#
+# Every bench_api route is sent against two seeded workloads of very
+# different size and must issue the same number of queries on both: an
+# N+1 (a serializer reading a relation per row, a permission check per
+# object) shows up as a diff of the normalized statements. The count on
+# the large workload must also stay within the route's budget. The bus
+# is on, so the invalidation and event writes a request makes in
+# production are counted too (without a listener thread); the access and
+# user caches are warm and the read cache is off, so the miss path is the
+# one measured. A route that legitimately needs more queries raises its
+# budget here, in review.
+# ----------------------------
+SIZES = {
+    'small': {'users': 3, 'projects': 3, 'members': 1, 'columns': 2, 'tasks': 2, 'comments': 1, 'notifications': 2},
+    'large': {'users': 3, 'projects': 12, 'members': 2, 'columns': 6, 'tasks': 10, 'comments': 4, 'notifications': 15},
+}
+PASSWORD = 'budget-password'
+WARMUP = 2  # requests per route before the counted one
+
+BUDGETS = {  # bench_api route -> SQL queries per request
+    'api.root': 0,
+    'test_connection': 0,
+    'projects.list': 4,
+    'projects.retrieve': 4,
+    'projects.board': 5,
+    'projects.board_not_modified': 1,
+    'projects.changes': 6,
+    'projects.cache_stats': 0,
+    'columns.list': 2,
+    'columns.retrieve': 2,
+    'tasks.list': 1,
+    'tasks.retrieve': 2,
+    'comments.list': 1,
+    'comments.retrieve': 2,
+    'notifications.list': 1,
+    'notifications.retrieve': 1,
+    'notifications.unread_count': 1,
+    'search': 3,
+    'projects.create': 8,
+    'projects.update': 6,
+    'projects.reorder': 12,
+    'columns.create': 8,
+    'columns.move': 9,
+    'columns.delete': 8,
+    'tasks.create': 8,
+    'tasks.update': 4,
+    'tasks.move': 10,
+    'tasks.delete': 7,
+    'comments.create': 5,
+    'comments.delete': 5,
+    'notifications.mark_read': 7,
+    'auth.register': 3,
+    'auth.login': 3,
+    'auth.refresh': 2,
+    'auth.logout': 6,
+}
+
+VARIANTS = [  # (route, query parameters, budget): ?fields= and ?expand= change the queries too
+    ('projects.list', {'fields': 'id,name'}, 2),
+    ('projects.list', {'fields': 'id,owner,members,columns.name'}, 4),
+    ('projects.list', {'expand': 'owner,members'}, 4),
+    ('projects.retrieve', {'fields': 'id,name'}, 2),
+    ('projects.retrieve', {'expand': 'owner,members'}, 4),
+    ('columns.list', {'fields': 'id,name'}, 2),
+    ('columns.list', {'expand': 'tasks'}, 3),
+    ('columns.retrieve', {'expand': 'tasks'}, 3),
+    ('tasks.list', {'fields': 'id,title,assigned_user'}, 1),
+    ('tasks.list', {'expand': 'assigned,created_by'}, 1),
+    ('tasks.list', {'expand': 'comments'}, 2),
+    ('tasks.retrieve', {'expand': 'assigned,comments'}, 3),
+    ('comments.list', {'fields': 'id,text'}, 1),
+    ('comments.list', {'expand': 'author,task'}, 1),
+    ('comments.retrieve', {'expand': 'author'}, 2),
+    ('notifications.list', {'fields': 'id,message'}, 1),
+]
+
+
+def normalize(sql):
+    # same statement shape regardless of ids, literals and IN-list lengths
+    sql = re.sub(r"'(?:[^']|'')*'", '?', sql)
+    sql = re.sub(r'\b\d+(\.\d+)?\b', '?', sql)
+    sql = re.sub(r'"s\d+_x\d+"', '"?"', sql)  # savepoint names
+    return re.sub(r'IN \((?:\?|%s)(?:, (?:\?|%s))*\)', 'IN (...)', sql)
+
+
+class Bench(BenchCommand):
+    # the same branch on both workloads: bench_api picks rows and positions at random
+    def _comment(self):  # someone else's comment: the membership check is not skipped for the author
+        comment_id = (
+            Comment.objects.filter(task__column__project_id__in=self.project_ids).exclude(author=self.user)
+            .order_by('pk').values_list('pk', flat=True).first()
+        )
+        return comment_id or super()._comment()
+
+    def _request_columns_move(self):  # to the front: random positions land mid-list on one workload and at the end of the other
+        method, path, body, headers = super()._request_columns_move()
+        return method, path, {**body, 'position': 0}, headers
+
+    def _request_tasks_move(self):  # to the front as well
+        method, path, body, headers = super()._request_tasks_move()
+        return method, path, {**body, 'position': 0}, headers
+
+
+class QueryBudgetTests(BoardsTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with mock.patch.object(bus, 'enabled', False):  # no listener thread while seeding
+            for size, workload in SIZES.items():
+                call_command('seed_kanban', prefix=f'budget-{size}-', password=PASSWORD, stdout=io.StringIO(), **workload)
+
+    def setUp(self):
+        super().setUp()
+        for patch in (
+            mock.patch.object(bus, 'enabled', True),  # invalidation writes count against the request
+            mock.patch.object(bus, 'ensure_listening'),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.benches = {}
+        for size in SIZES:
+            self.benches[size] = Bench()
+            self.benches[size].setup(f'budget-{size}-', PASSWORD)
+
+    def measure(self, name, params):
+        samples = {}
+        for size, bench in self.benches.items():
+            for _ in range(WARMUP):
+                bench.run(name, params)
+            samples[size] = sample = bench.run(name, params)
+            self.assertLess(sample['status'], 400, f"{name} on the {size} workload")
+        return samples
+
+    def assertWithinBudget(self, name, params, budget):
+        samples = self.measure(name, params)
+        small, large = ([normalize(sql) for sql in samples[size]['sql']] for size in SIZES)
+        diff = '\n'.join(difflib.unified_diff(small, large, 'small', 'large', lineterm='', n=1))
+        self.assertEqual(len(small), len(large), f"query count grows with the data:\n{diff}")
+        self.assertLessEqual(len(large), budget, '\n'.join(large))
+
+    def test_every_route_has_a_budget(self):
+        self.assertEqual(set(BUDGETS), set(ROUTES))
+
+    def test_routes(self):
+        for name, budget in BUDGETS.items():
+            with self.subTest(route=name):
+                self.assertWithinBudget(name, None, budget)
+
+    def test_sparse_and_expanded_variants(self):
+        for name, params, budget in VARIANTS:
+            with self.subTest(route=name, **params):
+                self.assertWithinBudget(name, params, budget)
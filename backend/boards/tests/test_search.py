@@ -0,0 +1,93 @@
+from unittest import mock, skipUnless
+
+from django.db import connection
+
+from backend.boards import search
+from backend.boards.apps import BoardsConfig
+from backend.boards.models import Comment, Task
+
+from .base import BoardsTestCase
+
+
+class SearchTests(BoardsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.owner = self.make_user('owner')
+        self.project, self.column, self.task = self.make_board(self.owner)
+        self.client.force_authenticate(self.owner)
+
+    def make_task(self, title, description='', column=None):
+        column = column or self.column
+        return Task.objects.create(title=title, description=description, column=column, order=Task.objects.count() + 1)
+
+    def hits(self, q):
+        response = self.client.get('/api/search/', {'q': q})
+        self.assertEqual(response.status_code, 200)
+        return [(hit['type'], hit['id']) for hit in response.json()['results']]
+
+    def test_title_matches_rank_first(self):
+        described = self.make_task('Release notes', 'draft the deployment checklist')
+        titled = self.make_task('Deployment checklist')
+        comment = Comment.objects.create(task=self.task, author=self.owner, text='see the deployment checklist')
+        first, *rest = self.hits('deployment checklist')
+        self.assertEqual(first, ('task', titled.pk))
+        self.assertCountEqual(rest, [('task', described.pk), ('comment', comment.pk)])  # body text weighs the same on SQLite
+
+    @skipUnless(connection.vendor == 'sqlite', "prefix matching is the FTS5 query; PostgreSQL matches whole stems")
+    def test_last_word_matches_as_a_prefix(self):
+        task = self.make_task('Deployment checklist')
+        self.assertEqual(self.hits('check'), [('task', task.pk)])
+        self.assertEqual(self.hits('deployment chec'), [('task', task.pk)])
+        self.assertEqual(self.hits('deplo checklist'), [])  # only the last word is a prefix
+
+    def test_only_accessible_projects(self):
+        stranger = self.make_user('stranger')
+        _, other_column, _ = self.make_board(stranger, name='Private')
+        mine, theirs = self.make_task('Quarterly budget'), self.make_task('Quarterly budget', column=other_column)
+        self.assertEqual(self.hits('quarterly budget'), [('task', mine.pk)])
+        self.client.force_authenticate(stranger)
+        self.assertEqual(self.hits('quarterly budget'), [('task', theirs.pk)])
+
+    def test_soft_deleted_rows_are_not_found(self):
+        task = self.make_task('Obsolete migration')
+        comment = Comment.objects.create(task=self.task, author=self.owner, text='obsolete migration notes')
+        self.assertEqual(len(self.hits('obsolete')), 2)
+        Comment.all_objects.filter(pk=comment.pk).update(is_active=False)
+        self.assertEqual(self.hits('obsolete'), [('task', task.pk)])
+        self.client.delete(f'/api/columns/{self.column.pk}/')
+        self.assertEqual(self.hits('obsolete'), [])
+
+    def test_index_follows_edits_and_deletes(self):
+        task = self.make_task('Draft')
+        task.title = 'Published'
+        task.save()
+        self.assertEqual(self.hits('draft'), [])
+        self.assertEqual(self.hits('published'), [('task', task.pk)])
+        Task.all_objects.filter(pk=task.pk).delete()
+        self.assertEqual(self.hits('published'), [])
+
+    def test_fallback_without_a_full_text_index(self):
+        stranger = self.make_user('stranger')
+        _, other_column, _ = self.make_board(stranger, name='Private')
+        self.make_task('Invoice run', column=other_column)
+        task = self.make_task('Monthly invoice')
+        Task.all_objects.filter(pk=self.make_task('Old invoice').pk).update(is_active=False)
+        with mock.patch.object(search, '_fts_available', return_value=False):
+            self.assertEqual(self.hits('INVOICE'), [('task', task.pk)])  # icontains: case-insensitive, scoped, live rows only
+
+
+@skipUnless(connection.vendor == 'sqlite', "SQLite only: PostgreSQL keeps its generated columns through table rebuilds")
+class SearchReinstallTests(BoardsTestCase):
+    """A migration that rebuilds boards_task drops its triggers; post_migrate puts them back."""
+
+    def test_post_migrate_restores_dropped_triggers(self):
+        owner = self.make_user('owner')
+        _, column, _ = self.make_board(owner)
+        with connection.cursor() as cursor:
+            cursor.execute('DROP TRIGGER boards_task_search_ins')  # what a table rebuild does
+        task = Task.objects.create(title='Rebuilt table', column=column, order=2)
+        self.assertEqual(search.search(owner, 'rebuilt'), [])
+        search.reinstall(sender=BoardsConfig, using=connection.alias)
+        self.assertEqual([hit['id'] for hit in search.search(owner, 'rebuilt')], [task.pk])  # refilled
+        later = Task.objects.create(title='Rebuilt again', column=column, order=3)
+        self.assertEqual({hit['id'] for hit in search.search(owner, 'rebuilt')}, {task.pk, later.pk})  # trigger is back
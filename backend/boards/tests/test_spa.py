@@ -0,0 +1,38 @@
+import gzip
+import os
+import tempfile
+
+from django.test import RequestFactory, SimpleTestCase
+
+from backend.boards.spa import SpaShell
+
+
+class SpaShellTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'index.html')
+        with open(path, 'wb') as f:
+            f.write(b'<!doctype html><div id="root"></div>' * 20)
+        self.shell = SpaShell(path=path, recheck_seconds=0)
+        self.factory = RequestFactory()
+
+    def get(self, encoding='', etag=None):
+        headers = {'HTTP_ACCEPT_ENCODING': encoding}
+        if etag:
+            headers['HTTP_IF_NONE_MATCH'] = etag
+        return self.shell.response(self.factory.get('/board/1', **headers))
+
+    def test_each_encoding_has_its_own_etag(self):
+        identity, gzipped = self.get(), self.get('gzip')
+        self.assertNotIn('Content-Encoding', identity)
+        self.assertEqual(gzipped['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(gzipped.content), identity.content)
+        self.assertEqual(gzipped['ETag'], identity['ETag'][:-1] + '-gzip"')
+
+    def test_not_modified_only_for_the_same_encoding(self):
+        identity_etag, gzip_etag = self.get()['ETag'], self.get('gzip')['ETag']
+        self.assertEqual(self.get('gzip', gzip_etag).status_code, 304)
+        self.assertEqual(self.get('', identity_etag).status_code, 304)
+        self.assertEqual(self.get('', gzip_etag).status_code, 200)  # cached gzip body, client now wants identity
+        self.assertEqual(self.get('gzip', identity_etag).status_code, 200)
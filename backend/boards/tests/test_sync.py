@@ -0,0 +1,105 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from backend.boards import events
+from backend.boards.models import Column, Comment, Project, Task
+from backend.boards.versioning import make_sync_token
+
+from .base import BoardsTestCase
+
+
+class DeltaSyncTests(BoardsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.owner = self.make_user('owner')
+        self.project, self.column, self.task = self.make_board(self.owner)
+        self.comment = Comment.objects.create(task=self.task, author=self.owner, text='Hello')
+        hour_ago = timezone.now() - timedelta(hours=1)
+        Project.all_objects.update(updated_at=hour_ago, changed_at=hour_ago)  # older than the sync window
+        self.token = make_sync_token(timezone.now())
+        self.client.force_authenticate(self.owner)
+
+    def changes(self):
+        response = self.client.get(f'/api/projects/{self.project.pk}/changes/', {'since': self.token})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_deleting_a_column_leaves_tombstones_for_its_tasks_and_comments(self):
+        gone = Task.objects.create(title='Gone already', column=self.column, order=2, is_active=False)
+        Task.all_objects.filter(pk=gone.pk).update(updated_at=timezone.now() - timedelta(hours=1))
+        response = self.client.delete(f'/api/columns/{self.column.pk}/')
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(Task.all_objects.get(pk=self.task.pk).is_active)
+        self.assertFalse(Comment.all_objects.get(pk=self.comment.pk).is_active)
+        deleted = self.changes()['deleted']
+        self.assertEqual(deleted['columns'], [self.column.pk])
+        self.assertEqual(deleted['tasks'], [self.task.pk])  # the earlier tombstone is not reported again
+        self.assertEqual(deleted['comments'], [self.comment.pk])
+
+    def test_deleting_a_task_deactivates_its_comments(self):
+        self.assertEqual(self.client.delete(f'/api/tasks/{self.task.pk}/').status_code, 204)
+        self.assertFalse(Comment.all_objects.get(pk=self.comment.pk).is_active)
+        self.assertEqual(self.changes()['deleted']['comments'], [self.comment.pk])
+
+    def test_child_writes_do_not_resend_the_project(self):
+        self.client.patch(f'/api/tasks/{self.task.pk}/', {'title': 'Renamed'}, format='json')
+        payload = self.changes()
+        self.assertIsNone(payload['project'])
+        self.assertEqual([task['title'] for task in payload['tasks']], ['Renamed'])
+
+    def test_project_edits_are_sent(self):
+        self.client.patch(f'/api/projects/{self.project.pk}/', {'name': 'Renamed'}, format='json')
+        self.assertEqual(self.changes()['project']['name'], 'Renamed')
+
+    def test_last_modified_follows_board_changes(self):
+        before = self.client.get(f'/api/projects/{self.project.pk}/')['Last-Modified']
+        self.client.patch(f'/api/tasks/{self.task.pk}/', {'title': 'Renamed'}, format='json')
+        self.assertNotEqual(self.client.get(f'/api/projects/{self.project.pk}/')['Last-Modified'], before)
+
+
+class ProjectDeleteTests(BoardsTestCase):
+    """Deleting a project costs the same number of queries, and sends one event, whatever the board size."""
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.make_user('owner')
+        self.client.force_authenticate(self.owner)
+        for patch in (
+            mock.patch.object(events.broker, 'is_listening', return_value=True),
+            mock.patch.object(events.broker, 'publish'),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def board(self, name, columns, tasks):
+        project, column, task = self.make_board(self.owner, name=name)
+        Comment.objects.create(task=task, author=self.owner, text='Hello')
+        for c in range(1, columns):
+            column = Column.objects.create(name=f'Column {c}', project=project, order=c + 1)
+            for t in range(tasks):
+                task = Task.objects.create(title=f'Task {t}', column=column, order=t + 1)
+                Comment.objects.create(task=task, author=self.owner, text='Hello')
+        return project
+
+    def delete(self, project):
+        events.broker.publish.reset_mock()
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(f'/api/projects/{project.pk}/')
+        self.assertEqual(response.status_code, 204)
+        return len(queries)
+
+    def test_query_count_does_not_grow_with_the_board(self):
+        small = self.delete(self.board('Small', columns=1, tasks=1))
+        large = self.delete(self.board('Large', columns=4, tasks=5))
+        self.assertEqual(small, large)
+        self.assertFalse(Task.all_objects.filter(title__startswith='Task').exists())
+
+    def test_one_event_for_the_whole_board(self):
+        project = self.board('Large', columns=3, tasks=3)
+        self.delete(project)
+        published = [event for _, event in (call.args for call in events.broker.publish.call_args_list)]
+        self.assertEqual(published, [{'type': 'project.deleted', 'project': project.pk, 'object_id': project.pk}])
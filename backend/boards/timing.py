@@ -0,0 +1,134 @@
+import json  # structured log lines
+import logging  # timing and slow-request lines
+import random  # sampling
+import time  # durations
+from collections import defaultdict  # span name -> milliseconds
+from contextlib import ExitStack, contextmanager  # execute_wrapper on every connection, spans
+from contextvars import ContextVar  # recorder of the current request
+
+from django.conf import settings  # BOARDS_TIMING
+from django.core.exceptions import MiddlewareNotUsed  # opt-in
+from django.db import connections  # SQL instrumentation
+
+logger = logging.getLogger(__name__)
+
+# ----------------------------
+# Per-request timing (Server-Timing header and log lines)
+#
+# ServerTimingMiddleware wraps every database connection with an
+# execute_wrapper for the duration of a sampled request and collects
+# named spans: 'serialize' (model serializers and LeanRows), 'render'
+# (JSON encoding) and 'auth' (JWT user resolution). Span times exclude
+# the SQL run inside them, which is reported once as 'db'. Results go
+# out as a Server-Timing header and one JSON log line per request;
+# requests slower than SLOW_MS are logged at WARNING with their queries.
+# Off unless BOARDS_TIMING['ENABLED'] is set.
+# ----------------------------
+_timing_settings = getattr(settings, 'BOARDS_TIMING', {})
+ENABLED = _timing_settings.get('ENABLED', False)
+SAMPLE_RATE = _timing_settings.get('SAMPLE_RATE', 1.0)  # share of requests instrumented
+SLOW_MS = _timing_settings.get('SLOW_MS', 500)  # slower sampled requests are logged with their queries
+HEADER = _timing_settings.get('HEADER', True)  # False: log lines only (Server-Timing is visible to clients)
+MAX_QUERIES = _timing_settings.get('MAX_QUERIES', 100)  # queries kept for the slow-request dump
+
+_current = ContextVar('boards_timing', default=None)
+
+
+class Recorder:
+    def __init__(self):
+        self.db_ms = 0.0
+        self.query_count = 0
+        self.queries = []  # (sql, ms), at most MAX_QUERIES
+        self.spans = defaultdict(float)
+        self._open = set()  # spans already running (nested serializers count once)
+
+    def __call__(self, execute, sql, params, many, context):
+        # connection.execute_wrapper hook
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            ms = (time.perf_counter() - start) * 1000
+            self.db_ms += ms
+            self.query_count += 1
+            if len(self.queries) < MAX_QUERIES:
+                self.queries.append((sql, round(ms, 3)))
+
+    @contextmanager
+    def span(self, name):
+        if name in self._open:
+            yield
+            return
+        self._open.add(name)
+        start, db_ms = time.perf_counter(), self.db_ms
+        try:
+            yield
+        finally:
+            self._open.discard(name)
+            self.spans[name] += (time.perf_counter() - start) * 1000 - (self.db_ms - db_ms)
+
+    def header(self, total_ms):
+        parts = [f'db;dur={self.db_ms:.1f};desc="{self.query_count} queries"']
+        parts += [f'{name};dur={ms:.1f}' for name, ms in sorted(self.spans.items())]
+        parts.append(f'total;dur={total_ms:.1f}')
+        return ', '.join(parts)
+
+
+def current():
+    """Recorder of the request being timed, or None."""
+    return _current.get()
+
+
+@contextmanager
+def span(name):
+    """Time the block as `name` when the current request is being timed."""
+    recorder = _current.get()
+    if recorder is None:
+        yield
+        return
+    with recorder.span(name):
+        yield
+
+
+class ServerTimingMiddleware:
+    def __init__(self, get_response):
+        if not ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if SAMPLE_RATE < 1 and random.random() >= SAMPLE_RATE:
+            return self.get_response(request)
+        recorder = Recorder()
+        token = _current.set(recorder)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(recorder))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        total_ms = (time.perf_counter() - start) * 1000  # streaming responses: time to the first byte
+        if HEADER:
+            response['Server-Timing'] = recorder.header(total_ms)
+        self._log(request, response, recorder, total_ms)
+        return response
+
+    @staticmethod
+    def _log(request, response, recorder, total_ms):
+        line = {
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'user': getattr(getattr(request, 'user', None), 'pk', None),
+            'total_ms': round(total_ms, 1),
+            'db_ms': round(recorder.db_ms, 1),
+            'queries': recorder.query_count,
+            **{f'{name}_ms': round(ms, 1) for name, ms in sorted(recorder.spans.items())},
+        }
+        if total_ms < SLOW_MS:
+            logger.info(json.dumps(line))
+            return
+        line['sql'] = [{'sql': sql, 'ms': ms} for sql, ms in recorder.queries]
+        logger.warning(json.dumps(line))
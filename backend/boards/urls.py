@@ -1,5 +1,4 @@
-from django.urls import path, re_path, include
-# from .views import frontend  # Django URL handling
+from django.urls import path, include
 from rest_framework.routers import DefaultRouter  # DRF router for viewsets
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView  # JWT auth views
 from .views import test_connection  # Test connection view
@@ -12,7 +11,8 @@ from .views import (
     NotificationViewSet, # CRUD API for notifications
     register,            # user registration endpoint
     logout_view,          # user logout endpoint
-    frontend,              # React frontend view
+    project_events,        # project change stream (SSE)
+    search_view,           # full-text search
     test_connection        # Test connection view
 )
 
@@ -31,13 +31,13 @@ router.register(r'notifications', NotificationViewSet)  # /notifications/ and /n
 # URL patterns for the boards app
 # ----------------------------
 urlpatterns = [
+    path('projects/<int:pk>/events/', project_events, name='project_events'),  # Server-Sent Events per project
     path('', include(router.urls)),  # Include all routes from the router
     path('auth/register/', register, name='auth_register'),  # User registration endpoint
     path('auth/login/', TokenObtainPairView.as_view(), name='token_obtain_pair'),  # JWT login
     path('auth/refresh/', TokenRefreshView.as_view(), name='token_refresh'),      # JWT refresh token
     path('auth/logout/', logout_view, name='auth_logout'),  # Logout endpoint
+    path('search/', search_view, name='search'),  # Full-text search over tasks and comments
     path('test-connection/', test_connection, name='test_connection'),  # Test connection endpoint
-    re_path(r'^.*$', frontend),
-    
 ]
 
@@ -0,0 +1,84 @@
+import hashlib  # short digest of the representation variant
+from datetime import timedelta  # overlap window for delta sync tokens
+
+from django.core import signing  # tamper-proof sync tokens
+from django.utils import timezone  # timestamp for Last-Modified
+from django.utils.dateparse import parse_datetime  # sync token payload
+from django.db.models import F  # atomic revision increment
+from django.views.decorators.http import condition  # Django's conditional GET handling
+
+from .models import Project  # revisioned model
+
+
+# ----------------------------
+# Project revision counter
+#
+# Every write to a project, its columns, tasks or comments bumps
+# Project.revision (and changed_at) with a single UPDATE. The pair is the
+# board's version: it backs the ETag / Last-Modified of project reads.
+# Project.updated_at only moves when the project's own payload changes
+# (fields, members, usernames), so delta sync does not resend the
+# project for every task edit.
+# ----------------------------
+def touch_projects(own_fields=False, **lookup):
+    """Bump the revision of the projects matching lookup, e.g. pk=1, columns=2, columns__tasks=3."""
+    now = timezone.now()
+    changes = {'revision': F('revision') + 1, 'changed_at': now}
+    if own_fields:  # the project row itself is part of the change
+        changes['updated_at'] = now
+    Project.all_objects.filter(**lookup).update(**changes)
+
+
+def project_version(request, pk):
+    # (revision, changed_at) of a project the user can see, memoized for the etag + last-modified pair
+    http_request = getattr(request, '_request', request)
+    memo = http_request.__dict__.setdefault('_project_version', {})
+    if pk not in memo:
+        memo[pk] = Project.objects.filter(pk=pk, access__user=request.user).values_list('revision', 'changed_at').first()
+    return memo[pk]
+
+
+def project_etag(request, pk=None, *args, **kwargs):
+    version = project_version(request, pk)
+    if version is None:
+        return None  # unknown or not visible: let the view answer with 404
+    # the same revision renders differently per endpoint, query string and media type
+    variant = hashlib.sha1(
+        f"{request.get_full_path()}|{getattr(request, 'accepted_media_type', '')}".encode()
+    ).hexdigest()[:12]
+    return f"{pk}-{version[0]}-{variant}"
+
+
+def project_last_modified(request, pk=None, *args, **kwargs):
+    version = project_version(request, pk)
+    return version[1] if version else None
+
+
+# Decorator for viewset methods: 304 before any serialization when the client is up to date
+conditional_project = condition(etag_func=project_etag, last_modified_func=project_last_modified)
+
+
+# ----------------------------
+# Delta sync tokens
+#
+# A token is the signed time at which a /changes/ read started. The next
+# read returns rows whose updated_at is newer than that minus
+# SYNC_OVERLAP, so writes that committed while the previous read was
+# running are not missed (clients apply changes idempotently).
+# ----------------------------
+SYNC_OVERLAP = timedelta(seconds=5)
+SYNC_TOKEN_SALT = 'boards.changes'
+
+
+def make_sync_token(started_at):
+    return signing.dumps({'t': started_at.isoformat()}, salt=SYNC_TOKEN_SALT, compress=True)
+
+
+def read_sync_token(token):
+    """datetime to read changes from, or None if the token is missing; raises signing.BadSignature if invalid."""
+    if not token:
+        return None
+    started_at = parse_datetime(signing.loads(token, salt=SYNC_TOKEN_SALT).get('t', ''))
+    if started_at is None:
+        raise signing.BadSignature('Malformed sync token')
+    return started_at - SYNC_OVERLAP
@@ -1,19 +1,34 @@
-import os
-from django.http import HttpResponse
-from django.conf import settings
-from django.shortcuts import render
+from asgiref.sync import sync_to_async
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.core import signing
+from django.utils import timezone
+from django.shortcuts import render, get_object_or_404
+from django.utils.decorators import method_decorator
+from django.db import transaction
+from django.db.models import Count, Prefetch, Q
 from rest_framework import viewsets, status, filters
-from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated, IsAdminUser, AllowAny
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework.exceptions import PermissionDenied
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
 from django.contrib.auth import get_user_model
 
-from .models import Project, Column, Task, Comment, Notification
+from .models import Project, ProjectAccess, Column, Task, Comment, Notification
 from .serializers import (
     ProjectSerializer, ColumnSerializer, TaskSerializer,
-    CommentSerializer, NotificationSerializer, RegisterSerializer
+    CommentSerializer, NotificationSerializer, RegisterSerializer,
+    BoardSerializer, MoveSerializer, ReorderSerializer, MarkReadSerializer, LeanRows, sparse_queryset
 )
+from . import events, notifications, ordering, search, spa
+from .pagination import TaskPagination, CommentPagination, NotificationPagination
+from .access import can_access_project
+from .authentication import CachedJWTAuthentication, evict_users
+from .blacklist import BloomRefreshToken
+from .bus import bus
+from .caching import read_cache
+from .signals import quiet
+from .versioning import conditional_project, make_sync_token, project_version, read_sync_token
 from .permissions import (
     IsProjectMemberOrOwner, IsProjectOwner,
     IsCommentAuthorOrProjectMember, IsNotificationUser
@@ -43,84 +58,345 @@ def register(request): #user registration view
 def logout_view(request): #user logout view
     try: #attempt to blacklist the refresh token
         refresh_token = request.data["refresh"] #get refresh token from request data
-        token = RefreshToken(refresh_token) #create RefreshToken instance
+        token = BloomRefreshToken(refresh_token) #create RefreshToken instance (bloom-filtered blacklist)
         token.blacklist() #blacklist the token
+        evict_users([request.user.pk]) #next request reloads the user
         return Response({"detail": "Successfully logged out"}, status=status.HTTP_205_RESET_CONTENT) #return success response
     except Exception as e: #handle exceptions
         return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST) #return error response
 
 
+# ----------------------------
+# Soft delete: DELETE deactivates the row so delta sync can report it
+# ----------------------------
+class SoftDeleteMixin:
+    cascade = [] #(model, lookup to the deleted row) of children that become tombstones with it
+
+    @transaction.atomic
+    def perform_destroy(self, instance): #keep the row, and its live children, as tombstones
+        now = timezone.now()
+        for model, lookup in self.cascade: #one UPDATE per child table, already deleted children keep their timestamp
+            model.objects.filter(**{lookup: instance}).update(is_active=False, updated_at=now)
+        instance.is_active = False
+        instance.save(update_fields=['is_active', 'updated_at']) #also bumps the project revision
+
+
+# ----------------------------
+# The serializer (and ?fields= / ?expand=) shapes the query, not only the output
+# ----------------------------
+class SparseFieldsMixin:
+    def filter_queryset(self, queryset): #only()/select_related()/prefetch_related() for the fields the serializer reads
+        queryset = super().filter_queryset(queryset)
+        if self.request.method in ('GET', 'HEAD'): #also without ?fields=: nested and dotted fields load in a fixed number of queries
+            queryset = sparse_queryset(queryset, self.get_serializer(), getattr(self.paginator, 'key_fields', ())) #plus the page cursor columns
+        return queryset
+
+
+# ----------------------------
+# Lean list: rows straight from values(), same JSON as the serializer
+# ----------------------------
+class LeanListMixin:
+    def list(self, request, *args, **kwargs): #no model instances, usernames joined in SQL
+        if 'expand' in request.query_params: #nested serializers need model instances
+            return super().list(request, *args, **kwargs)
+        if 'fields' in request.query_params: #values() only for the requested fields
+            lean = LeanRows(self.get_serializer().fields)
+        else:
+            lean = LeanRows.of(self.get_serializer_class())
+        queryset = lean.queryset(self.filter_queryset(self.get_queryset()), getattr(self.paginator, 'key_fields', ())) #cursor columns read, not rendered
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(lean.render(page))
+        return Response(lean.render(queryset))
+
+
 # ----------------------------
 # Project ViewSet
 # ----------------------------
-class ProjectViewSet(viewsets.ModelViewSet): #CRUD operations for Project model
+class ProjectViewSet(SparseFieldsMixin, viewsets.ModelViewSet): #CRUD operations for Project model
     serializer_class = ProjectSerializer #serializer for Project model
     permission_classes = [IsAuthenticated, IsProjectOwner] #permissions for accessing Project endpoints
     queryset = Project.objects.all()  
 
     def get_queryset(self): #custom queryset to filter projects by user
-        return Project.objects.filter(members=self.request.user) | Project.objects.filter(owner=self.request.user) #projects where user is a member or owner
+        return Project.objects.filter(access__user=self.request.user) #projects where user is a member or owner (ProjectAccess index)
 
     def perform_create(self, serializer): #custom create method to set owner
         serializer.save(owner=self.request.user) #set the owner to the current user
 
+    @transaction.atomic
+    def perform_destroy(self, instance): #one event for the whole board, not a revision bump and an event per column, task and comment
+        user_ids = list(instance.access.values_list('user_id', flat=True)) #their cached project id sets go stale
+        events.emit('project', 'deleted', instance, instance.pk) #before delete() clears the pk
+        bus.publish('projects', [instance.pk])
+        bus.publish('users', user_ids)
+        with quiet(): #the revision dies with the row
+            instance.delete()
+
+    @method_decorator(conditional_project) #ETag/Last-Modified from the project revision, 304 without serializing
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_read(request, 'project', kwargs['pk'], lambda: super(ProjectViewSet, self).retrieve(request, *args, **kwargs).data)
+
+    def _cached_read(self, request, kind, pk, build): #payload cached under the project revision
+        version = project_version(request, pk) #memoized by the conditional GET above, also the access check
+        if version is None:
+            raise Http404
+        data, hit = read_cache.get_or_build(kind, pk, version[0], read_cache.variant(request), build)
+        response = Response(data)
+        response['X-Cache'] = 'hit' if hit else 'miss'
+        return response
+
+    @action(detail=True, methods=['get'], permission_classes=[IsAuthenticated]) #members can read the board, not only the owner
+    @method_decorator(conditional_project) #same conditional GET as retrieve
+    def board(self, request, pk=None): #whole board in a fixed number of queries
+        tasks = Task.objects.select_related('assigned').annotate(
+            comment_count=Count('comments', filter=Q(comments__is_active=True))
+        ) #active tasks with assignee joined and comment count aggregated in SQL
+        queryset = self.get_queryset().select_related('owner').prefetch_related(
+            'members',
+            Prefetch('columns', queryset=Column.objects.prefetch_related(Prefetch('tasks', queryset=tasks))),
+        ) #one query each for project, members, columns and tasks
+        build = lambda: BoardSerializer(get_object_or_404(queryset, pk=pk), context=self.get_serializer_context()).data
+        return self._cached_read(request, 'board', pk, build) #queries above only run on a miss
+
+    @action(detail=False, methods=['get'], url_path='cache-stats', permission_classes=[IsAdminUser]) #staff only
+    def cache_stats(self, request): #hit/miss counters of the project/board read cache
+        return Response(read_cache.stats())
+
+    @action(detail=True, methods=['get'], permission_classes=[IsAuthenticated]) #members can sync the board
+    def changes(self, request, pk=None): #rows changed since ?since=<token>, soft-deleted ones as tombstones
+        try:
+            since = read_sync_token(request.query_params.get('since'))
+        except signing.BadSignature:
+            return Response({"since": ["Invalid sync token."]}, status=status.HTTP_400_BAD_REQUEST)
+        started_at = timezone.now() #becomes the next token
+        project = get_object_or_404(self.get_queryset().select_related('owner').prefetch_related('members'), pk=pk)
+
+        if since is None: #first sync: live rows only
+            columns = Column.objects.filter(project=project)
+            tasks = Task.objects.filter(column__project=project)
+            comments = Comment.objects.filter(task__column__project=project)
+        else: #incremental: all_objects so deactivated rows come back as tombstones
+            columns = Column.all_objects.filter(project=project, updated_at__gt=since)
+            tasks = Task.all_objects.filter(column__project=project, updated_at__gt=since)
+            comments = Comment.all_objects.filter(task__column__project=project, updated_at__gt=since)
+        tasks = tasks.select_related('assigned')
+        comments = comments.select_related('author')
+
+        payload = {"token": make_sync_token(started_at), "full": since is None, "deleted": {}}
+        payload["project"] = ProjectSerializer(project, context=self.get_serializer_context()).data if since is None or project.updated_at > since else None
+        for key, rows, serializer_class in (
+            ("columns", columns, ColumnSerializer),
+            ("tasks", tasks, TaskSerializer),
+            ("comments", comments, CommentSerializer),
+        ):
+            rows = list(rows)
+            payload[key] = serializer_class([row for row in rows if row.is_active], many=True).data
+            payload["deleted"][key] = [row.pk for row in rows if not row.is_active]
+        return Response(payload)
+
+    @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated]) #members can rearrange the board
+    def reorder(self, request, pk=None): #apply a whole drag-and-drop sequence at once
+        payload = ReorderSerializer(data=request.data)
+        payload.is_valid(raise_exception=True)
+        column_ids = payload.validated_data.get('columns', [])
+        task_orders = payload.validated_data.get('tasks', [])
+        task_ids = [task_id for entry in task_orders for task_id in entry['tasks']]
+
+        with transaction.atomic():
+            project = get_object_or_404(self.get_queryset(), pk=pk) #single permission check for the whole batch
+            ordering.lock_scope(Column, project.pk) #lock the project row so concurrent reorders apply one after another
+            referenced = set(column_ids) | {entry['column'] for entry in task_orders}
+            if len(referenced) != Column.objects.filter(project=project, pk__in=referenced).count(): #every column must belong to this project
+                return Response({"columns": ["Unknown column for this project."]}, status=status.HTTP_400_BAD_REQUEST)
+            if len(task_ids) != Task.objects.filter(column__project=project, pk__in=task_ids).count(): #every task must belong to this project
+                return Response({"tasks": ["Unknown task for this project."]}, status=status.HTTP_400_BAD_REQUEST)
+
+            if column_ids:
+                ordering.rebalance(Column, project.pk, column_ids) #two UPDATEs for all columns
+            for entry in task_orders:
+                ordering.rebalance(Task, entry['column'], entry['tasks']) #two UPDATEs per column, moves included
+
+        return Response({
+            "columns": list(Column.objects.filter(project=project).values('id', 'order')),
+            "tasks": list(Task.objects.filter(column_id__in=[e['column'] for e in task_orders]).order_by('column', 'order').values('id', 'column', 'order')),
+        })
+
 
 # ----------------------------
 # Column ViewSet
 # ----------------------------
-class ColumnViewSet(viewsets.ModelViewSet): #CRUD operations for Column model
+class ColumnViewSet(LeanListMixin, SparseFieldsMixin, SoftDeleteMixin, viewsets.ModelViewSet): #CRUD operations for Column model
     serializer_class = ColumnSerializer #serializer for Column model
     permission_classes = [IsAuthenticated, IsProjectMemberOrOwner] #permissions for accessing Column endpoints
     queryset = Column.objects.all()  
+    cascade = [(Comment, 'task__column'), (Task, 'column')] #deleting a column deletes its tasks and their comments
 
     def get_queryset(self): #custom queryset to filter columns by user
-        return Column.objects.filter(project__members=self.request.user) | Column.objects.filter(project__owner=self.request.user)
+        return Column.objects.filter(project__access__user=self.request.user) #columns of projects the user can access
+
+    @transaction.atomic
+    def perform_create(self, serializer): #custom create method to place the column
+        project = serializer.validated_data['project'] #project validated by the serializer
+        if not can_access_project(self.request, project.pk): #only members/owner may add columns
+            raise PermissionDenied("You do not have access to this project.")
+        ordering.lock_scope(Column, project.pk) #serialize concurrent appends to this project
+        order = serializer.validated_data.get('order')
+        if order is None: #append at the end when no order is given
+            order = ordering.next_order(Column, project.pk)
+        serializer.save(order=order)
 
-    def perform_create(self, serializer): #custom create method to set project
-        serializer.save(project=self.request.data.get("project")) #set the project to the provided project ID
+    def perform_update(self, serializer): #moving the column to another project needs access to that project
+        project = serializer.validated_data.get('project')
+        if project is not None and not can_access_project(self.request, project.pk):
+            raise PermissionDenied("You do not have access to this project.")
+        serializer.save()
+
+    @action(detail=True, methods=['post']) #move a column left/right
+    def move(self, request, pk=None):
+        column = self.get_object() #permission checked on the column
+        move = MoveSerializer(data=request.data)
+        move.is_valid(raise_exception=True)
+        ordering.move(column, column.project_id, move.validated_data['position']) #usually a single-row update
+        return Response(self.get_serializer(column).data)
 
 
 # ----------------------------
 # Task ViewSet
 # ----------------------------
-class TaskViewSet(viewsets.ModelViewSet): #CRUD operations for Task model
+class TaskViewSet(LeanListMixin, SparseFieldsMixin, SoftDeleteMixin, viewsets.ModelViewSet): #CRUD operations for Task model
     serializer_class = TaskSerializer #serializer for Task model
     permission_classes = [IsAuthenticated, IsProjectMemberOrOwner] #permissions for accessing Task endpoints
+    pagination_class = TaskPagination #keyset pagination, no COUNT(*) unless ?count=true
     queryset = Task.objects.all() 
+    cascade = [(Comment, 'task')] #deleting a task deletes its comments
 
     def get_queryset(self): #custom queryset to filter tasks by user
-        return Task.objects.filter(column__project__members=self.request.user) | Task.objects.filter(column__project__owner=self.request.user) #tasks where user is a member or owner of the project
+        return Task.objects.filter(column__project__access__user=self.request.user).select_related('column', 'assigned') #tasks where user is a member or owner of the project, assigned_user without a query
 
+    @transaction.atomic
     def perform_create(self, serializer): #custom create method to set created_by
-        serializer.save(created_by=self.request.user) #set the creator to the current user
+        column = serializer.validated_data['column'] #column validated by the serializer
+        if not can_access_project(self.request, column.project_id): #only members/owner may add tasks
+            raise PermissionDenied("You do not have access to this project.")
+        ordering.lock_scope(Task, column.pk) #serialize concurrent appends to this column
+        order = serializer.validated_data.get('order')
+        if order is None: #append at the end when no order is given
+            order = ordering.next_order(Task, column.pk)
+        with notifications.acting_as(self.request.user.pk): #no notification for assigning yourself
+            serializer.save(created_by=self.request.user, order=order) #set the creator to the current user
+
+    def perform_update(self, serializer): #moving the task to another column needs access to that column's project
+        column = serializer.validated_data.get('column')
+        if column is not None and not can_access_project(self.request, column.project_id):
+            raise PermissionDenied("You do not have access to this project.")
+        with notifications.acting_as(self.request.user.pk): #your own assignment/due date changes do not notify you
+            serializer.save()
+
+    @action(detail=True, methods=['post']) #move a task within its column or to another column
+    def move(self, request, pk=None):
+        task = self.get_object() #permission checked on the task
+        move = MoveSerializer(data=request.data)
+        move.is_valid(raise_exception=True)
+        column_id = move.validated_data.get('column', task.column_id)
+        if not Column.objects.filter(pk=column_id, project_id=task.column.project_id).exists(): #stay inside the project
+            return Response({"column": ["Column not found in this project."]}, status=status.HTTP_400_BAD_REQUEST)
+        ordering.move(task, column_id, move.validated_data['position']) #usually a single-row update
+        return Response(self.get_serializer(task).data)
 
 
 # ----------------------------
 # Comment ViewSet
 # ----------------------------
-class CommentViewSet(viewsets.ModelViewSet): #CRUD operations for Comment model
+class CommentViewSet(LeanListMixin, SparseFieldsMixin, SoftDeleteMixin, viewsets.ModelViewSet): #CRUD operations for Comment model
     serializer_class = CommentSerializer #serializer for Comment model
     permission_classes = [IsAuthenticated, IsCommentAuthorOrProjectMember] #permissions for accessing Comment endpoints
+    pagination_class = CommentPagination #keyset pagination, no COUNT(*) unless ?count=true
     queryset = Comment.objects.all() 
 
     def get_queryset(self): #custom queryset to filter comments by user
-        return Comment.objects.filter(task__column__project__members=self.request.user) | Comment.objects.filter(task__column__project__owner=self.request.user) #comments where user is a member or owner of the project
+        return Comment.objects.filter(task__column__project__access__user=self.request.user).select_related('task__column') #comments where user is a member or owner of the project
 
     def perform_create(self, serializer): #custom create method to set author
+        task = serializer.validated_data['task'] #task validated by the serializer
+        if not can_access_project(self.request, task.column.project_id): #only members/owner may comment
+            raise PermissionDenied("You do not have access to this project.")
         serializer.save(author=self.request.user) #set the author to the current user
 
+    def perform_update(self, serializer): #moving the comment to another task needs access to that task's project
+        task = serializer.validated_data.get('task')
+        if task is not None and not can_access_project(self.request, task.column.project_id):
+            raise PermissionDenied("You do not have access to this project.")
+        serializer.save()
+
 
 # ----------------------------
 # Notification ViewSet
 # ----------------------------
-class NotificationViewSet(viewsets.ModelViewSet): #CRUD operations for Notification model
+class NotificationViewSet(SparseFieldsMixin, viewsets.ModelViewSet): #CRUD operations for Notification model
     serializer_class = NotificationSerializer #serializer for Notification model
     permission_classes = [IsAuthenticated, IsNotificationUser] #permissions for accessing Notification endpoints
+    pagination_class = NotificationPagination #keyset pagination, no COUNT(*) unless ?count=true
     queryset = Notification.objects.all() 
 
     def get_queryset(self): #custom queryset to filter notifications by user
         return Notification.objects.filter(user=self.request.user) #notifications for the current user
 
+    @action(detail=False, methods=['get'], url_path='unread-count') #badge value without paging through notifications
+    def unread_count(self, request):
+        return Response({"unread": notifications.unread_count(request.user)})
+
+    @action(detail=False, methods=['post'], url_path='mark-read') #mark everything (or up to an id) read in one UPDATE
+    def mark_read(self, request):
+        payload = MarkReadSerializer(data=request.data)
+        payload.is_valid(raise_exception=True)
+        marked, unread = notifications.mark_read(request.user, payload.validated_data.get('up_to'))
+        return Response({"marked": marked, "unread": unread})
+
+
+# ----------------------------
+# Project change stream (Server-Sent Events, served best under ASGI)
+# ----------------------------
+async def _event_stream_user(request): #JWT from the Authorization header, or ?token= since EventSource cannot set headers
+    auth = CachedJWTAuthentication()
+    header = auth.get_header(request)
+    raw_token = auth.get_raw_token(header) if header else request.GET.get('token')
+    if not raw_token:
+        return None
+    try:
+        validated = auth.get_validated_token(raw_token) #signature/expiry check, no DB
+        return await sync_to_async(auth.get_user)(validated)
+    except (InvalidToken, AuthenticationFailed):
+        return None
+
+
+async def project_events(request, pk): #GET /api/projects/<id>/events/
+    if request.method != 'GET':
+        return JsonResponse({"detail": "Method not allowed."}, status=405)
+    user = await _event_stream_user(request)
+    if user is None:
+        return JsonResponse({"detail": "Authentication credentials were not provided or are invalid."}, status=401)
+    if not await ProjectAccess.objects.filter(user=user, project_id=pk).aexists(): #same access index as the viewsets
+        return JsonResponse({"detail": "Not found."}, status=404)
+    response = StreamingHttpResponse(events.stream(pk), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no' #stop proxies from buffering the stream
+    return response
+
+
+# ----------------------------
+# Full-text search endpoint
+# ----------------------------
+@api_view(['GET']) #allowing only GET requests
+@permission_classes([IsAuthenticated]) #hits only come from projects the user can access
+def search_view(request): #GET /api/search/?q=<text>&limit=<n>
+    try:
+        limit = int(request.query_params.get('limit', search.SEARCH_LIMIT))
+    except ValueError:
+        limit = search.SEARCH_LIMIT
+    query = request.query_params.get('q', '')
+    return Response({"query": query, "results": search.search(request.user, query, limit)})
+
 
 # ----------------------------
 # Test connection endpoint
@@ -135,14 +411,6 @@ def test_connection(request): #test connection view
 #------------------------
 def frontend(request): #view to serve React frontend
     """
-    Serve the React frontend's index.html.
+    Serve the React frontend's index.html from memory (see boards.spa).
     """
-    try:
-        path = os.path.join(settings.BASE_DIR, '..', 'frontend', 'dist', 'index.html') #path to the built React app's index.html
-        with open(path) as f: #open the index.html file
-            return HttpResponse(f.read()) #return the contents of index.html
-    except FileNotFoundError: #handle file not found error
-        return HttpResponse( 
-            "index.html not found! Please build your React app first.",
-            status=501,
-        )
+    return spa.shell.response(request) #gzip/br variant, ETag and revalidation headers
@@ -0,0 +1,17 @@
+"""
+ASGI config for kanban_backend project.
+
+This file exposes the ASGI callable as a module-level variable named `application`.
+It is used by Gunicorn's Uvicorn worker on Render so that long-lived
+Server-Sent Event streams (/api/projects/<id>/events/) park as coroutines
+instead of holding a worker each.
+"""
+
+import os
+from django.core.asgi import get_asgi_application
+
+# Set the default settings module for the 'kanban_backend' project
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.kanban_backend.settings')
+
+# Create the ASGI application callable
+application = get_asgi_application()
@@ -44,6 +44,7 @@ INSTALLED_APPS = [
 # Middleware
 # ---------------------------------------------------------
 MIDDLEWARE = [
+    "backend.boards.timing.ServerTimingMiddleware",  # opt-in (BOARDS_TIMING), outermost so it times the whole request
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",   
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -61,6 +62,7 @@ MIDDLEWARE = [
 ROOT_URLCONF = "backend.kanban_backend.urls"
 
 WSGI_APPLICATION = "backend.kanban_backend.wsgi.application"
+ASGI_APPLICATION = "backend.kanban_backend.asgi.application"
 
 # ---------------------------------------------------------
 # Database
@@ -105,6 +107,23 @@ else:
         }
     }
 
+# ---------------------------------------------------------
+# Cache
+# ---------------------------------------------------------
+# Process-local by default; set CACHE_URL (redis://...) to share the board
+# cache and its hit/miss counters between workers.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "kanban",
+        "OPTIONS": {"MAX_ENTRIES": 5000},
+    }
+}
+if os.environ.get("CACHE_URL"):
+    CACHES["default"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.environ["CACHE_URL"],
+    }
 
 # ---------------------------------------------------------
 # Password validation
@@ -121,19 +140,32 @@ AUTH_PASSWORD_VALIDATORS = [
 # ---------------------------------------------------------
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "backend.boards.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
+    # orjson-backed JSON (same bytes as DRF's JSONRenderer, stdlib fallback without orjson)
+    "DEFAULT_RENDERER_CLASSES": (
+        "backend.boards.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "backend.boards.renderers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
 }
 
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=30),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
     "BLACKLIST_AFTER_ROTATION": True,
+    # add/check the `ver` claim used to revoke tokens (backend.boards.authentication)
+    "TOKEN_OBTAIN_SERIALIZER": "backend.boards.authentication.VersionedTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "backend.boards.authentication.VersionedTokenRefreshSerializer",
 }
 
 # ---------------------------------------------------------
@@ -191,3 +223,88 @@ USE_TZ = True
 # Static files (CSS, JavaScript, Images)
 # ---------------------------------------------------------
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+# ---------------------------------------------------------
+# Boards app
+# ---------------------------------------------------------
+# Process-local cache of "can user U access project P" answers.
+# TTL is in seconds; 0 keeps the answers per request only.
+BOARDS_ACCESS_CACHE = {
+    "MAX_ENTRIES": 10000,
+    "TTL": int(os.environ.get("BOARDS_ACCESS_CACHE_TTL", "0")),
+}
+
+# Project change stream (/api/projects/<id>/events/).
+# BROKER is the dotted path of the pub/sub class: BusBroker reaches clients on
+# every worker through BOARDS_BUS, LocalBroker only those of the same process.
+# Workers re-announce the projects they stream every PRESENCE_SECONDS.
+BOARDS_EVENTS = {
+    "BROKER": "backend.boards.events.BusBroker",
+    "QUEUE_SIZE": 256,
+    "HEARTBEAT_SECONDS": 15,
+    "PRESENCE_SECONDS": 20,
+}
+
+# Notification fan-out (task assignment, new comments, due date changes).
+# Events are coalesced for FLUSH_SECONDS by a background thread;
+# ASYNC=False delivers them inline when the transaction commits.
+BOARDS_NOTIFICATIONS = {
+    "ASYNC": os.environ.get("BOARDS_NOTIFICATIONS_ASYNC", "True") == "True",
+    "FLUSH_SECONDS": 2.0,
+    "BATCH_SIZE": 500,
+}
+
+# Retention (manage.py apply_retention, run from cron).
+# Read notifications older than `days` (by created_at) and soft-deleted
+# rows inactive for `days` (by updated_at) are moved to ArchivedRecord
+# ("archive") or dropped ("delete"). days=None disables a policy.
+BOARDS_RETENTION = {
+    "notification": {"days": 90, "action": "archive"},
+    "comment": {"days": 180, "action": "archive"},
+    "task": {"days": 180, "action": "archive"},
+    "column": {"days": 365, "action": "archive"},
+}
+
+# JWT users cached per process (backend.boards.authentication.CachedJWTAuthentication).
+# Password changes and deactivation revoke tokens; other processes notice
+# within USER_CACHE_TTL seconds. CACHE_PROJECT_IDS also caches the user's
+# project ids so membership checks skip the ProjectAccess lookup.
+BOARDS_AUTH = {
+    "USER_CACHE_TTL": 60,
+    "MAX_ENTRIES": 10000,
+    "CACHE_PROJECT_IDS": os.environ.get("BOARDS_AUTH_CACHE_PROJECT_IDS", "False") == "True",
+}
+
+# Refresh token blacklist: a Bloom filter in each process answers most
+# lookups without the database; other processes' logouts are picked up
+# within SYNC_SECONDS. Expired tokens: manage.py flush_expired_tokens (cron).
+BOARDS_BLACKLIST = {
+    "CAPACITY": 100000,
+    "ERROR_RATE": 0.001,
+    "SYNC_SECONDS": 2.0,
+}
+
+# Serialized project/board payloads, keyed by project revision (backend.boards.caching).
+BOARDS_READ_CACHE = {
+    "ENABLED": True,
+    "ALIAS": "default",
+    "TIMEOUT": 300,
+}
+
+# Cross-worker invalidation of the in-process caches above (backend.boards.bus):
+# LISTEN/NOTIFY on PostgreSQL, a polled InvalidationEvent table elsewhere.
+BOARDS_BUS = {
+    "ENABLED": True,
+    "CHANNEL": "boards_invalidate",
+    "POLL_SECONDS": 1.0,
+    "RETAIN_SECONDS": 3600,
+}
+
+# Server-Timing header and per-request timing log lines (backend.boards.timing); off unless BOARDS_TIMING=True.
+BOARDS_TIMING = {
+    "ENABLED": os.environ.get("BOARDS_TIMING", "False") == "True",
+    "SAMPLE_RATE": float(os.environ.get("BOARDS_TIMING_SAMPLE_RATE", "1.0")),
+    "SLOW_MS": 500,
+    "HEADER": True,
+    "MAX_QUERIES": 100,
+}
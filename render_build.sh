@@ -13,3 +13,6 @@ pip install -r requirements.txt
 #set the PYTHONPATH to include the src directory and run collectstatic
 PYTHONPATH=. python backend/manage.py collectstatic --noinput
 
+#apply database migrations (backfills the ProjectAccess index and other derived tables)
+PYTHONPATH=. python backend/manage.py migrate --noinput
+